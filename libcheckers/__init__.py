@@ -1,3 +1,6 @@
+import sys
+
+
 class BoardConfig(object):
     board_dim = 10
     squares_per_row = board_dim // 2
@@ -5,4 +8,74 @@ class BoardConfig(object):
 
 
 class InvalidMoveException(Exception):
-    pass
+    """
+    Raised when a move cannot be applied to a board.
+
+    The error is identified by `code` (see `libcheckers.enum.MoveError`), and the human-readable
+    message is only formatted when the exception is displayed, so that callers who just catch
+    the exception do not pay for string formatting.
+    """
+
+    def __init__(self, message=None, code=None, message_args=()):
+        super(InvalidMoveException, self).__init__(message)
+        self.code = code
+        self.message_args = message_args
+
+    def __str__(self):
+        message = self.args[0] if self.args and self.args[0] is not None else ''
+        return message.format(*self.message_args) if self.message_args else message
+
+
+class BudgetExceededException(Exception):
+    """
+    Raised when a search runs out of its budget (see `libcheckers.movement.CaptureSearchBudget`).
+
+    `limit_name` identifies the exhausted limit ('max_nodes', 'max_sequences' or 'time_limit'),
+    and `limit` is its configured value.
+    """
+
+    def __init__(self, limit_name, limit):
+        msg = 'Search budget exceeded: {0} = {1}'.format(limit_name, limit)
+        super(BudgetExceededException, self).__init__(msg)
+        self.limit_name = limit_name
+        self.limit = limit
+
+
+# Submodules are imported on first attribute access (e.g. `libcheckers.movement`),
+# so that importing the package stays cheap for short-lived processes.
+_lazy_submodules = frozenset([
+    'arbiter',
+    'arena',
+    'attack_maps',
+    'benchmark',
+    'cache',
+    'cli',
+    'difftest',
+    'enum',
+    'game',
+    'generator',
+    'mcts',
+    'movement',
+    'notation',
+    'perft',
+    'search',
+    'serialization',
+    'server',
+    'stats',
+    'storage',
+    'symmetry',
+    'tournament',
+    'utils',
+])
+
+
+def __getattr__(name):
+    if name in _lazy_submodules:
+        module_name = '{0}.{1}'.format(__name__, name)
+        __import__(module_name)
+        return sys.modules[module_name]
+    raise AttributeError('module {0!r} has no attribute {1!r}'.format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | _lazy_submodules)
@@ -0,0 +1,370 @@
+/*
+ * Optional compiled move generator for libcheckers.
+ *
+ * Mirrors Board.get_available_moves_python: the same capture rules (captured pieces stay on the
+ * board as zombies until the end of the turn, no promotion while passing through the home row,
+ * long king jumps) and the same maximum capture rule. Occupancy is tracked with 64-bit masks
+ * (one bit per square), and diagonal neighbours come from precomputed tables.
+ *
+ * The Python side is responsible for wrapping the returned square paths into move objects.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <stdint.h>
+
+#define BOARD_DIM 10
+#define SQUARES_PER_ROW (BOARD_DIM / 2)
+#define TOTAL_SQUARES (BOARD_DIM * BOARD_DIM / 2)
+#define NUM_DIRECTIONS 4
+#define MAX_PATH_LENGTH (TOTAL_SQUARES + 1)
+
+#define PLAYER_WHITE 1
+#define PLAYER_BLACK 2
+#define PIECE_KING 2
+
+#define BIT(index) ((uint64_t)1 << (index))
+
+/* Northwest, Northeast, Southwest, Southeast (same order as utils.valid_move_offsets). */
+static const int direction_offsets[NUM_DIRECTIONS][2] = {{-1, -1}, {-1, +1}, {+1, -1}, {+1, +1}};
+
+/* neighbours[index][direction] is the adjacent square in that direction, or 0 if off the board. */
+static int neighbours[TOTAL_SQUARES + 1][NUM_DIRECTIONS];
+
+typedef struct {
+    uint64_t own;
+    uint64_t opponent;
+    uint64_t zombie;
+    int is_king;
+    int path[MAX_PATH_LENGTH];
+    Py_ssize_t max_length;
+    PyObject *sequences;
+} CaptureSearch;
+
+
+static void index_to_coords(int index, int *row, int *col)
+{
+    *row = (index - 1) / SQUARES_PER_ROW + 1;
+    if (*row % 2) {
+        *col = index % BOARD_DIM * 2;
+    }
+    else {
+        *col = (index - SQUARES_PER_ROW) % BOARD_DIM * 2 - 1;
+    }
+}
+
+
+static int coords_to_index(int row, int col)
+{
+    return (row - 1) * SQUARES_PER_ROW + (col - row % 2 + 1) / 2;
+}
+
+
+static void init_neighbours(void)
+{
+    int index, direction, row, col, new_row, new_col;
+
+    for (index = 1; index <= TOTAL_SQUARES; index++) {
+        index_to_coords(index, &row, &col);
+        for (direction = 0; direction < NUM_DIRECTIONS; direction++) {
+            new_row = row + direction_offsets[direction][0];
+            new_col = col + direction_offsets[direction][1];
+            if (1 <= new_row && new_row <= BOARD_DIM && 1 <= new_col && new_col <= BOARD_DIM) {
+                neighbours[index][direction] = coords_to_index(new_row, new_col);
+            }
+            else {
+                neighbours[index][direction] = 0;
+            }
+        }
+    }
+}
+
+
+/* Read a board plane (a sequence of None or small ints) into a C array. */
+static int read_plane(PyObject *sequence, int *plane)
+{
+    PyObject *fast;
+    PyObject *item;
+    Py_ssize_t i;
+
+    fast = PySequence_Fast(sequence, "board planes must be sequences");
+    if (fast == NULL) {
+        return -1;
+    }
+    if (PySequence_Fast_GET_SIZE(fast) != TOTAL_SQUARES + 1) {
+        PyErr_Format(PyExc_ValueError, "board planes must have %d items", TOTAL_SQUARES + 1);
+        Py_DECREF(fast);
+        return -1;
+    }
+
+    for (i = 0; i <= TOTAL_SQUARES; i++) {
+        item = PySequence_Fast_GET_ITEM(fast, i);
+        if (item == Py_None) {
+            plane[i] = 0;
+            continue;
+        }
+        plane[i] = (int)PyLong_AsLong(item);
+        if (plane[i] == -1 && PyErr_Occurred()) {
+            Py_DECREF(fast);
+            return -1;
+        }
+    }
+
+    Py_DECREF(fast);
+    return 0;
+}
+
+
+static PyObject *path_to_tuple(const int *path, Py_ssize_t length)
+{
+    PyObject *result;
+    PyObject *item;
+    Py_ssize_t i;
+
+    result = PyTuple_New(length);
+    if (result == NULL) {
+        return NULL;
+    }
+    for (i = 0; i < length; i++) {
+        item = PyLong_FromLong(path[i]);
+        if (item == NULL) {
+            Py_DECREF(result);
+            return NULL;
+        }
+        PyTuple_SET_ITEM(result, i, item);
+    }
+    return result;
+}
+
+
+/* Record a finished capture sequence, keeping only the longest ones seen so far. */
+static int record_sequence(CaptureSearch *search, Py_ssize_t length)
+{
+    PyObject *sequence;
+    int status;
+
+    if (length < search->max_length) {
+        return 0;
+    }
+    if (length > search->max_length) {
+        if (PyList_SetSlice(search->sequences, 0, PyList_GET_SIZE(search->sequences), NULL) < 0) {
+            return -1;
+        }
+        search->max_length = length;
+    }
+
+    sequence = path_to_tuple(search->path, length);
+    if (sequence == NULL) {
+        return -1;
+    }
+    status = PyList_Append(search->sequences, sequence);
+    Py_DECREF(sequence);
+    return status;
+}
+
+
+static int search_captures(CaptureSearch *search, int square, Py_ssize_t length);
+
+
+/* Perform a single capture step, search deeper, then undo the step. */
+static int try_capture(CaptureSearch *search, int square, int victim, int landing, Py_ssize_t length)
+{
+    int status;
+
+    search->opponent &= ~BIT(victim);
+    search->zombie |= BIT(victim);
+    search->own = (search->own & ~BIT(square)) | BIT(landing);
+    search->path[length] = landing;
+
+    status = search_captures(search, landing, length + 1);
+
+    search->own = (search->own & ~BIT(landing)) | BIT(square);
+    search->zombie &= ~BIT(victim);
+    search->opponent |= BIT(victim);
+    return status;
+}
+
+
+static int search_captures(CaptureSearch *search, int square, Py_ssize_t length)
+{
+    int direction, current, victim, landing;
+    int found = 0;
+    uint64_t occupied = search->own | search->opponent | search->zombie;
+
+    for (direction = 0; direction < NUM_DIRECTIONS; direction++) {
+        current = neighbours[square][direction];
+
+        /* Kings can see the piece to capture from a distance. */
+        if (search->is_king) {
+            while (current && !(occupied & BIT(current))) {
+                current = neighbours[current][direction];
+            }
+        }
+
+        /* Cannot jump over own pieces or previously captured pieces. */
+        if (!current || !(search->opponent & BIT(current))) {
+            continue;
+        }
+
+        /* Can only capture if the square following the piece is empty. */
+        victim = current;
+        landing = neighbours[victim][direction];
+        if (!landing || (occupied & BIT(landing))) {
+            continue;
+        }
+
+        found = 1;
+        do {
+            if (try_capture(search, square, victim, landing, length) < 0) {
+                return -1;
+            }
+            landing = neighbours[landing][direction];
+        } while (search->is_king && landing && !(occupied & BIT(landing)));
+    }
+
+    if (!found && length > 1) {
+        return record_sequence(search, length);
+    }
+    return 0;
+}
+
+
+static PyObject *generate_moves(PyObject *self, PyObject *args)
+{
+    PyObject *owner_sequence;
+    PyObject *piece_class_sequence;
+    PyObject *result;
+    PyObject *move;
+    int owner[TOTAL_SQUARES + 1];
+    int piece_class[TOTAL_SQUARES + 1];
+    int player, opponent, index, direction, first_direction, destination;
+    uint64_t own_mask = 0, opponent_mask = 0, occupied;
+    CaptureSearch search;
+
+    if (!PyArg_ParseTuple(args, "OOi", &owner_sequence, &piece_class_sequence, &player)) {
+        return NULL;
+    }
+    if (read_plane(owner_sequence, owner) < 0 || read_plane(piece_class_sequence, piece_class) < 0) {
+        return NULL;
+    }
+
+    opponent = player == PLAYER_WHITE ? PLAYER_BLACK : PLAYER_WHITE;
+    for (index = 1; index <= TOTAL_SQUARES; index++) {
+        if (owner[index] == player) {
+            own_mask |= BIT(index);
+        }
+        else if (owner[index] == opponent) {
+            opponent_mask |= BIT(index);
+        }
+    }
+
+    search.sequences = PyList_New(0);
+    if (search.sequences == NULL) {
+        return NULL;
+    }
+    search.max_length = 0;
+    search.zombie = 0;
+
+    /* Captures are mandatory, and the rules demand that we capture as many pieces as possible. */
+    for (index = 1; index <= TOTAL_SQUARES; index++) {
+        if (!(own_mask & BIT(index))) {
+            continue;
+        }
+        search.own = own_mask;
+        search.opponent = opponent_mask;
+        search.is_king = piece_class[index] == PIECE_KING;
+        search.path[0] = index;
+        if (search_captures(&search, index, 1) < 0) {
+            Py_DECREF(search.sequences);
+            return NULL;
+        }
+    }
+
+    if (PyList_GET_SIZE(search.sequences) > 0) {
+        result = Py_BuildValue("(OO)", Py_True, search.sequences);
+        Py_DECREF(search.sequences);
+        return result;
+    }
+
+    /* There are no pieces we must capture. Free movement is allowed. */
+    occupied = own_mask | opponent_mask;
+    for (index = 1; index <= TOTAL_SQUARES; index++) {
+        if (!(own_mask & BIT(index))) {
+            continue;
+        }
+
+        /* Men can only move forward, and the direction of forward depends on the color. */
+        first_direction = 0;
+        if (piece_class[index] != PIECE_KING && player == PLAYER_BLACK) {
+            first_direction = 2;
+        }
+
+        for (direction = first_direction; direction < NUM_DIRECTIONS; direction++) {
+            if (piece_class[index] != PIECE_KING && direction >= first_direction + 2) {
+                break;
+            }
+            destination = neighbours[index][direction];
+            while (destination && !(occupied & BIT(destination))) {
+                move = Py_BuildValue("(ii)", index, destination);
+                if (move == NULL || PyList_Append(search.sequences, move) < 0) {
+                    Py_XDECREF(move);
+                    Py_DECREF(search.sequences);
+                    return NULL;
+                }
+                Py_DECREF(move);
+                if (piece_class[index] != PIECE_KING) {
+                    break;
+                }
+                destination = neighbours[destination][direction];
+            }
+        }
+    }
+
+    result = Py_BuildValue("(OO)", Py_False, search.sequences);
+    Py_DECREF(search.sequences);
+    return result;
+}
+
+
+static PyMethodDef movegen_methods[] = {
+    {
+        "generate_moves",
+        generate_moves,
+        METH_VARARGS,
+        "generate_moves(owner, piece_class, player) -> (is_capture, paths)\n\n"
+        "Get the square paths of all allowed moves for the specified player.\n"
+        "Each path is a tuple of the starting square followed by every landing square."
+    },
+    {NULL, NULL, 0, NULL}
+};
+
+
+static struct PyModuleDef movegen_module = {
+    PyModuleDef_HEAD_INIT,
+    "_movegen",
+    "Compiled move generator for libcheckers.",
+    -1,
+    movegen_methods,
+    NULL,
+    NULL,
+    NULL,
+    NULL
+};
+
+
+PyMODINIT_FUNC PyInit__movegen(void)
+{
+    PyObject *module;
+
+    init_neighbours();
+    module = PyModule_Create(&movegen_module);
+
+#ifdef Py_GIL_DISABLED
+    /* The generator keeps all its state on the stack, so it is safe to run without the GIL. */
+    if (module != NULL) {
+        PyUnstable_Module_SetGIL(module, Py_MOD_GIL_NOT_USED);
+    }
+#endif
+
+    return module;
+}
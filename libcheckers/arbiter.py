@@ -0,0 +1,112 @@
+from libcheckers.enum import Player, GameOverReason, ForfeitReason
+from libcheckers.game import DrawRuleTracker
+from libcheckers.utils import get_opponent
+
+
+DEFAULT_MAX_PLIES = 500
+
+_winner_reasons = {
+    Player.WHITE: GameOverReason.WHITE_WON,
+    Player.BLACK: GameOverReason.BLACK_WON,
+}
+
+
+def is_legal_move(board, player, move):
+    """
+    Check whether a move submitted by a bot is one of the moves available to the player.
+    A bot that failed to produce a move (None) has not made a legal one either.
+    """
+
+    return move is not None and move in board.get_available_moves(player)
+
+
+class MatchArbiter(object):
+    """
+    Keeps track of a match between two bots: whose turn it is, the ply limit, and how the match ended,
+    including forfeits. Shared by the match server and the tournament runner, so that both end matches
+    by the same rules.
+
+    The arbiter does not check the moves itself: the caller runs the rule checks wherever is convenient
+    (in the same process or in a worker pool) and reports the outcome with `accept_move`.
+    """
+
+    def __init__(self, first_player=Player.WHITE, max_plies=DEFAULT_MAX_PLIES, board=None):
+        """
+        Parameters
+        ----------
+        first_player : int
+            The player who makes the first move.
+        max_plies : int
+            The match is declared a draw after this many plies.
+        board : Board, optional
+            The initial board. If specified, the arbiter also ends the match by the FMJD draw rules
+            (see `DrawRuleTracker`), so every accepted move must come with its `game.get_move_summary`.
+        """
+
+        self.player = first_player
+        self.max_plies = max_plies
+        self.plies = 0
+        self.game_over_reason = None
+        self.draw_rule = None
+        self.forfeited_by = None
+        self.forfeit_reason = None
+
+        self._draw_rules = DrawRuleTracker(board, first_player) if board is not None else None
+
+    @property
+    def is_over(self):
+        return self.game_over_reason is not None
+
+    def start(self, game_over_reason):
+        """
+        Record whether the initial position is already terminal for the first player
+        (see `Board.check_game_over`).
+        """
+
+        self._set_game_over_reason(game_over_reason)
+
+    def accept_move(self, is_legal, game_over_reason=None, move_summary=None):
+        """
+        Record a move of the player to move. An illegal move forfeits the match.
+
+        Parameters
+        ----------
+        is_legal : bool
+            Whether the move is allowed by the rules.
+        game_over_reason : int, optional
+            The GameOverReason of the position after a legal move, or None if the game can continue.
+        move_summary : tuple, optional
+            The `game.get_move_summary` of a legal move, required when the arbiter applies the draw rules.
+
+        Returns
+        -------
+        bool
+            True if the move was accepted.
+        """
+
+        if not is_legal:
+            self.forfeit(ForfeitReason.ILLEGAL_MOVE)
+            return False
+
+        self.plies += 1
+        self.player = get_opponent(self.player)
+        if self._draw_rules is not None:
+            self.draw_rule = self._draw_rules.update(move_summary)
+            if game_over_reason is None and self.draw_rule is not None:
+                game_over_reason = GameOverReason.DRAW
+        self._set_game_over_reason(game_over_reason)
+        return True
+
+    def forfeit(self, forfeit_reason):
+        """
+        End the match with a loss for the player to move (see `ForfeitReason`).
+        """
+
+        self.forfeited_by = self.player
+        self.forfeit_reason = forfeit_reason
+        self.game_over_reason = _winner_reasons[get_opponent(self.player)]
+
+    def _set_game_over_reason(self, game_over_reason):
+        if game_over_reason is None and self.plies >= self.max_plies:
+            game_over_reason = GameOverReason.DRAW
+        self.game_over_reason = game_over_reason
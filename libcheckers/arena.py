@@ -0,0 +1,172 @@
+import struct
+from multiprocessing.shared_memory import SharedMemory
+
+from libcheckers import BoardConfig
+from libcheckers.serialization import load_board_binary, save_board_binary
+
+
+# Every slot holds a board in the compact binary format, followed by the player to move (0 if unknown).
+SLOT_SIZE = BoardConfig.total_squares + 1
+
+# The header holds the capacity of the arena, so that other processes can attach by name only.
+_header_format = '<Q'
+_header_size = struct.calcsize(_header_format)
+
+# Arenas opened in the current process, by name. Board handles reuse them instead of attaching again.
+_attached_arenas = {}
+
+
+class BoardArena(object):
+    """
+    A fixed-capacity pool of boards in shared memory, addressable by slot index.
+
+    Worker processes can attach to an existing arena by its name and read or write boards
+    without sending them through pipes. Use `handle` to pass individual boards between processes.
+    """
+
+    def __init__(self, capacity=None, name=None):
+        """
+        Parameters
+        ----------
+        capacity : int, optional
+            The number of board slots. If specified, a new arena is created.
+        name : str, optional
+            The name of the shared memory block. If only the name is specified,
+            attach to an existing arena.
+        """
+
+        if capacity is None and name is None:
+            raise ValueError('Either the capacity or the name of the arena must be specified')
+
+        if capacity is not None:
+            size = _header_size + capacity * SLOT_SIZE
+            self._shared_memory = SharedMemory(name=name, create=True, size=size)
+            struct.pack_into(_header_format, self._shared_memory.buf, 0, capacity)
+            self.is_owner = True
+        else:
+            self._shared_memory = SharedMemory(name=name)
+            self.is_owner = False
+
+        self.capacity = struct.unpack_from(_header_format, self._shared_memory.buf, 0)[0]
+        _attached_arenas.setdefault(self.name, self)
+
+    @property
+    def name(self):
+        return self._shared_memory.name
+
+    def _get_offset(self, slot):
+        if not 0 <= slot < self.capacity:
+            raise IndexError('Slot {0} is out of range (0 to {1})'.format(slot, self.capacity - 1))
+        return _header_size + slot * SLOT_SIZE
+
+    def view(self, slot):
+        """
+        Get a zero-copy view of the raw bytes of the specified slot.
+        The view must be released before the arena is closed.
+        """
+
+        offset = self._get_offset(slot)
+        return self._shared_memory.buf[offset:offset + SLOT_SIZE]
+
+    def write(self, slot, board, player=None):
+        """
+        Store a board (and optionally the player to move) in the specified slot.
+        """
+
+        offset = self._get_offset(slot)
+        buf = self._shared_memory.buf
+        buf[offset:offset + BoardConfig.total_squares] = save_board_binary(board)
+        buf[offset + BoardConfig.total_squares] = player or 0
+
+    def read(self, slot):
+        """
+        Load the board stored in the specified slot.
+        """
+
+        offset = self._get_offset(slot)
+        return load_board_binary(self._shared_memory.buf[offset:offset + BoardConfig.total_squares])
+
+    def read_player(self, slot):
+        """
+        Get the player to move stored in the specified slot, or None if it was not specified.
+        """
+
+        return self._shared_memory.buf[self._get_offset(slot) + BoardConfig.total_squares] or None
+
+    def handle(self, slot):
+        """
+        Get a lightweight picklable reference to the specified slot.
+        """
+
+        self._get_offset(slot)
+        return BoardHandle(self.name, slot)
+
+    def close(self):
+        """
+        Detach from the arena, and destroy it if it was created by this object.
+        """
+
+        if _attached_arenas.get(self.name) is self:
+            del _attached_arenas[self.name]
+        self._shared_memory.close()
+        if self.is_owner:
+            self._shared_memory.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def attach_arena(name):
+    """
+    Get the arena with the specified name, attaching to it once per process.
+    """
+
+    if name not in _attached_arenas:
+        _attached_arenas[name] = BoardArena(name=name)
+    return _attached_arenas[name]
+
+
+class BoardHandle(object):
+    """
+    A reference to a board slot in a shared memory arena.
+    Pickles to just the arena name and slot index, regardless of the board contents.
+    """
+
+    def __init__(self, arena_name, slot):
+        self.arena_name = arena_name
+        self.slot = slot
+
+    def load(self):
+        """
+        Load the referenced board.
+        """
+
+        return attach_arena(self.arena_name).read(self.slot)
+
+    def load_player(self):
+        """
+        Get the player to move stored with the referenced board.
+        """
+
+        return attach_arena(self.arena_name).read_player(self.slot)
+
+    def store(self, board, player=None):
+        """
+        Overwrite the referenced slot with a new board.
+        """
+
+        attach_arena(self.arena_name).write(self.slot, board, player)
+
+    def __reduce__(self):
+        return BoardHandle, (self.arena_name, self.slot)
+
+    def __eq__(self, other):
+        return (isinstance(other, BoardHandle) and
+                self.arena_name == other.arena_name and
+                self.slot == other.slot)
+
+    def __repr__(self):
+        return 'BoardHandle: {0}[{1}]'.format(self.arena_name, self.slot)
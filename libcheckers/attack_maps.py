@@ -0,0 +1,120 @@
+from libcheckers import BoardConfig
+from libcheckers.enum import Player
+from libcheckers.utils import get_lines_of_sight
+
+
+# For every square, the set of squares that lie on any of its four diagonals.
+# A change on a square can only affect pieces that can see it along a diagonal.
+_diagonal_squares = [frozenset()] + [
+    frozenset(
+        square
+        for line in get_lines_of_sight(index, BoardConfig.board_dim)
+        for square in line
+    )
+    for index in range(1, BoardConfig.total_squares + 1)
+]
+
+
+class AttackMaps(object):
+    """
+    Incrementally maintained mobility and attack maps for a board.
+
+    Keeps the free movement destinations and the capturable opponent pieces for every piece,
+    plus the reverse mapping (which pieces can capture a given square). Changes made to the board
+    are recorded as dirty squares, and only the pieces whose diagonals pass through those squares
+    are recomputed the next time the maps are queried.
+    """
+
+    def __init__(self, board):
+        self.board = board
+        self._destinations = {}
+        self._capturable = {}
+        self._attackers = {}
+        self._dirty = set()
+
+        for player in (Player.WHITE, Player.BLACK):
+            for index in board.get_player_squares(player):
+                self._update_piece(index)
+
+    def invalidate(self, index):
+        """
+        Record that the contents of the specified square have changed.
+        """
+
+        self._dirty.add(index)
+
+    def _refresh(self):
+        if not self._dirty:
+            return
+
+        affected = set(self._dirty)
+        for index in self._dirty:
+            affected.update(_diagonal_squares[index])
+        self._dirty.clear()
+
+        for index in affected:
+            if self.board.owner[index] in (Player.WHITE, Player.BLACK):
+                self._update_piece(index)
+            else:
+                self._forget_piece(index)
+
+    def _update_piece(self, index):
+        self._forget_piece(index)
+        self._destinations[index] = self.board.get_free_movement_destinations(index)
+        self._capturable[index] = self.board.get_capturable_pieces(index)
+        for target in self._capturable[index]:
+            self._attackers.setdefault(target, set()).add(index)
+
+    def _forget_piece(self, index):
+        self._destinations.pop(index, None)
+        for target in self._capturable.pop(index, []):
+            attackers = self._attackers[target]
+            attackers.discard(index)
+            if not attackers:
+                del self._attackers[target]
+
+    def get_free_movement_destinations(self, index):
+        """
+        Get all allowed destinations for free movement for the piece at the specified square.
+        """
+
+        self._refresh()
+        return self._destinations.get(index, [])
+
+    def get_capturable_pieces(self, index):
+        """
+        Get all squares with opponent's pieces capturable by the piece at the specified square.
+        """
+
+        self._refresh()
+        return self._capturable.get(index, [])
+
+    def get_attackers(self, index):
+        """
+        Get all squares with pieces that can capture the piece at the specified square.
+        """
+
+        self._refresh()
+        return sorted(self._attackers.get(index, ()))
+
+    def get_mobility(self, player):
+        """
+        Get the total number of free movement destinations available to the specified player.
+        """
+
+        self._refresh()
+        return sum(
+            len(self._destinations[index])
+            for index in self.board.get_player_squares(player)
+        )
+
+    def get_capture_count(self, player):
+        """
+        Get the total number of (attacker, target) capture options available to the specified player.
+        """
+
+        self._refresh()
+        return sum(
+            len(self._capturable[index])
+            for index in self.board.get_player_squares(player)
+        )
@@ -0,0 +1,207 @@
+import argparse
+import json
+import platform
+import sys
+import time
+import timeit
+
+from libcheckers import movement
+
+
+DEFAULT_REPEAT = 5
+DEFAULT_MIN_SAMPLE_TIME = 0.05
+DEFAULT_THRESHOLD = 0.1
+DEFAULT_STATISTIC = 'median'
+
+
+def measure(func, repeat=DEFAULT_REPEAT, min_sample_time=DEFAULT_MIN_SAMPLE_TIME):
+    """
+    Measure the execution time of a function.
+
+    The number of calls per sample is calibrated (1, 10, 100, ...) so that each sample
+    takes at least `min_sample_time` seconds, to keep the timer resolution from dominating.
+
+    Parameters
+    ----------
+    func : callable
+        The function to measure. Called without arguments.
+    repeat : int
+        The number of samples to take.
+    min_sample_time : float
+        The minimum duration of a single sample, in seconds.
+
+    Returns
+    -------
+    dict
+        Timing statistics in seconds per call: 'min', 'median', 'mean', 'max',
+        plus the 'number' of calls per sample and the 'repeat' count.
+    """
+
+    timer = timeit.Timer(func)
+    number = 1
+    while timer.timeit(number) < min_sample_time:
+        number *= 10
+
+    samples = sorted(sample / number for sample in timer.repeat(repeat, number))
+    middle = len(samples) // 2
+    median = samples[middle] if len(samples) % 2 else (samples[middle - 1] + samples[middle]) / 2
+
+    return {
+        'min': samples[0],
+        'median': median,
+        'mean': sum(samples) / len(samples),
+        'max': samples[-1],
+        'number': number,
+        'repeat': repeat,
+    }
+
+
+def is_free_threaded():
+    """
+    Check whether the interpreter runs without the global interpreter lock
+    (e.g. a free-threaded 3.13+ build).
+    """
+
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def get_environment_info():
+    """
+    Describe the environment the benchmarks run in, to be stored along with the results.
+    """
+
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'native_movegen': movement.native_movegen is not None,
+        'free_threaded': is_free_threaded(),
+    }
+
+
+def append_history(path, results, label=None):
+    """
+    Append a benchmark run to a history file (one JSON object per line).
+
+    Parameters
+    ----------
+    path : str
+        The path to the history file.
+    results : dict
+        Benchmark name -> timing statistics (as returned by `measure`).
+    label : str, optional
+        A free-form label of the run (e.g. a commit hash).
+
+    Returns
+    -------
+    dict
+        The recorded run.
+    """
+
+    run = {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'label': label,
+        'environment': get_environment_info(),
+        'results': results,
+    }
+    with open(path, 'a') as history_file:
+        history_file.write(json.dumps(run, sort_keys=True) + '\n')
+    return run
+
+
+def load_history(path):
+    """
+    Load all benchmark runs from a history file, oldest first.
+    """
+
+    with open(path) as history_file:
+        return [json.loads(line) for line in history_file if line.strip()]
+
+
+class Comparison(object):
+    """
+    The change in timing of a single benchmark between two runs.
+    """
+
+    def __init__(self, name, baseline, current):
+        self.name = name
+        self.baseline = baseline
+        self.current = current
+
+    @property
+    def ratio(self):
+        return self.current / self.baseline if self.baseline > 0 else float('inf')
+
+    def is_regression(self, threshold):
+        return self.ratio > 1 + threshold
+
+    def format(self, name_width=50):
+        return '{0:<{4}} {1:>12.3f}us {2:>12.3f}us {3:>8.2f}x'.format(
+            self.name,
+            self.baseline * 1e6,
+            self.current * 1e6,
+            self.ratio,
+            name_width,
+        )
+
+
+def compare_runs(baseline, current, statistic=DEFAULT_STATISTIC):
+    """
+    Compare the benchmarks present in both runs.
+
+    Returns
+    -------
+    list
+        A list of Comparison objects, sorted by benchmark name.
+    """
+
+    baseline_results = baseline['results']
+    current_results = current['results']
+    return [
+        Comparison(name, baseline_results[name][statistic], current_results[name][statistic])
+        for name in sorted(set(baseline_results) & set(current_results))
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compare benchmark runs recorded in a history file.')
+    parser.add_argument('history', help='The path to the benchmark history file.')
+    parser.add_argument('--baseline', type=int, default=-2,
+                        help='The index of the baseline run in the history (default: the second to last).')
+    parser.add_argument('--current', type=int, default=-1,
+                        help='The index of the run to check (default: the last).')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='The relative slowdown that counts as a regression (default: 0.1).')
+    parser.add_argument('--statistic', choices=['min', 'median', 'mean', 'max'], default=DEFAULT_STATISTIC,
+                        help='The timing statistic to compare (default: median).')
+    args = parser.parse_args(argv)
+
+    history = load_history(args.history)
+    try:
+        baseline = history[args.baseline]
+        current = history[args.current]
+    except IndexError:
+        sys.stderr.write('The history has {0} runs, not enough to compare.\n'.format(len(history)))
+        return 2
+
+    comparisons = compare_runs(baseline, current, args.statistic)
+    regressions = [comparison for comparison in comparisons if comparison.is_regression(args.threshold)]
+
+    name_width = max([len('Benchmark')] + [len(comparison.name) for comparison in comparisons])
+    header = '{0:<{4}} {1:>14} {2:>14} {3:>9}\n'.format(
+        'Benchmark', 'Baseline', 'Current', 'Ratio', name_width,
+    )
+    sys.stdout.write(header)
+    for comparison in comparisons:
+        marker = '  REGRESSION' if comparison in regressions else ''
+        sys.stdout.write(comparison.format(name_width) + marker + '\n')
+
+    if regressions:
+        sys.stdout.write('{0} regression(s) beyond {1:.0%}.\n'.format(len(regressions), args.threshold))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
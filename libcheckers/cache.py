@@ -0,0 +1,223 @@
+import json
+import sqlite3
+import time
+
+from libcheckers.serialization import load_move, save_move, save_position_binary
+
+
+# Bump whenever a change to the rules or the move generator changes the result for any position.
+# Opening a cache written with a different version discards all its entries.
+RULES_VERSION = 1
+
+DEFAULT_MAX_ENTRIES = 1000000
+DEFAULT_EVICTION_INTERVAL = 1000
+DEFAULT_TOUCH_INTERVAL = 60.0
+DEFAULT_TIMEOUT = 30.0
+
+_schema = [
+    'CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL)',
+    'CREATE TABLE IF NOT EXISTS positions ('
+    '    key BLOB PRIMARY KEY,'
+    '    moves TEXT,'
+    '    game_over INTEGER,'
+    '    game_over_known INTEGER NOT NULL DEFAULT 0,'
+    '    last_used REAL NOT NULL'
+    ')',
+    'CREATE INDEX IF NOT EXISTS positions_last_used ON positions (last_used)',
+]
+
+
+def get_position_key(board, player):
+    """
+    Get the cache key of a position: the board in the compact binary format, followed by the player byte.
+    """
+
+    return save_position_binary(board, player)
+
+
+class PositionCache(object):
+    """
+    A persistent cache of move lists and game over checks, stored in an SQLite database.
+
+    The database runs in WAL mode, so any number of processes can open the same file and read
+    concurrently while one of them writes. Every process must open its own PositionCache
+    (connections cannot be shared between processes).
+
+    The cache is bounded: once it grows past `max_entries`, the least recently used positions are evicted.
+    Recency is only updated when an entry is read more than `touch_interval` seconds after its last use,
+    so that most reads do not turn into writes.
+    """
+
+    def __init__(self, path, max_entries=DEFAULT_MAX_ENTRIES, rules_version=RULES_VERSION,
+                 eviction_interval=DEFAULT_EVICTION_INTERVAL, touch_interval=DEFAULT_TOUCH_INTERVAL,
+                 timeout=DEFAULT_TIMEOUT):
+        """
+        Parameters
+        ----------
+        path : str
+            The database file. Created if it does not exist.
+        max_entries : int
+            The maximum number of cached positions.
+        rules_version : int
+            The version of the rules the cached results are valid for.
+        eviction_interval : int
+            Check the size of the cache after this many insertions.
+        touch_interval : float
+            The minimum number of seconds between recency updates of an entry.
+        timeout : float
+            How long to wait for a lock held by another process, in seconds.
+        """
+
+        self.path = path
+        self.max_entries = max_entries
+        self.rules_version = rules_version
+        self.eviction_interval = eviction_interval
+        self.touch_interval = touch_interval
+
+        self._insertions = 0
+        self._connection = sqlite3.connect(path, timeout=timeout, isolation_level=None)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+        self._connection.execute('PRAGMA synchronous=NORMAL')
+        self._initialize()
+
+    def _initialize(self):
+        cursor = self._connection.cursor()
+        cursor.execute('BEGIN IMMEDIATE')
+        try:
+            for statement in _schema:
+                cursor.execute(statement)
+            cursor.execute("SELECT value FROM meta WHERE name = 'rules_version'")
+            row = cursor.fetchone()
+            if row is None or row[0] != str(self.rules_version):
+                # Results computed under other rules are no longer valid.
+                cursor.execute('DELETE FROM positions')
+                cursor.execute(
+                    "INSERT OR REPLACE INTO meta (name, value) VALUES ('rules_version', ?)",
+                    (str(self.rules_version),),
+                )
+            cursor.execute('COMMIT')
+        except Exception:
+            cursor.execute('ROLLBACK')
+            raise
+
+    def _get_row(self, key, column):
+        row = self._connection.execute(
+            'SELECT {0}, last_used FROM positions WHERE key = ?'.format(column),
+            (key,),
+        ).fetchone()
+        if row is not None:
+            now = time.time()
+            if now - row[-1] >= self.touch_interval:
+                self._connection.execute('UPDATE positions SET last_used = ? WHERE key = ?', (now, key))
+        return row
+
+    def _upsert(self, key, column_values):
+        columns = sorted(column_values)
+        self._connection.execute(
+            'INSERT INTO positions (key, {0}, last_used) VALUES (?, {1}, ?) '
+            'ON CONFLICT (key) DO UPDATE SET {2}, last_used = excluded.last_used'.format(
+                ', '.join(columns),
+                ', '.join('?' for _ in columns),
+                ', '.join('{0} = excluded.{0}'.format(column) for column in columns),
+            ),
+            [key] + [column_values[column] for column in columns] + [time.time()],
+        )
+
+        self._insertions += 1
+        if self._insertions >= self.eviction_interval:
+            self._insertions = 0
+            self.evict()
+
+    def get_moves(self, board, player):
+        """
+        Get the cached available moves of a position.
+
+        Returns
+        -------
+        list or None
+            The moves, or None if they are not in the cache.
+        """
+
+        row = self._get_row(get_position_key(board, player), 'moves')
+        if row is None or row[0] is None:
+            return None
+        return [load_move(move_data) for move_data in json.loads(row[0])]
+
+    def put_moves(self, board, player, moves):
+        """
+        Store the available moves of a position.
+        """
+
+        moves_data = json.dumps([save_move(move) for move in moves], separators=(',', ':'))
+        self._upsert(get_position_key(board, player), {'moves': moves_data})
+
+    def get_game_over(self, board, player):
+        """
+        Get the cached game over check of a position.
+
+        Returns
+        -------
+        tuple
+            A 2-tuple: (whether the result is in the cache, GameOverReason or None).
+        """
+
+        row = self._get_row(get_position_key(board, player), 'game_over, game_over_known')
+        if row is None or not row[1]:
+            return False, None
+        return True, row[0]
+
+    def put_game_over(self, board, player, game_over_reason):
+        """
+        Store the game over check of a position (None if the game can continue).
+        """
+
+        self._upsert(get_position_key(board, player), {'game_over': game_over_reason, 'game_over_known': 1})
+
+    def get_available_moves(self, board, player):
+        """
+        Same as `Board.get_available_moves`, but served from the cache when possible.
+        """
+
+        moves = self.get_moves(board, player)
+        if moves is None:
+            moves = board.get_available_moves(player)
+            self.put_moves(board, player, moves)
+        return moves
+
+    def check_game_over(self, board, player_turn):
+        """
+        Same as `Board.check_game_over`, but served from the cache when possible.
+        """
+
+        is_cached, game_over_reason = self.get_game_over(board, player_turn)
+        if not is_cached:
+            game_over_reason = board.check_game_over(player_turn)
+            self.put_game_over(board, player_turn, game_over_reason)
+        return game_over_reason
+
+    def evict(self):
+        """
+        Remove the least recently used entries until the cache fits into `max_entries`.
+        """
+
+        excess = len(self) - self.max_entries
+        if excess > 0:
+            self._connection.execute(
+                'DELETE FROM positions WHERE key IN (SELECT key FROM positions ORDER BY last_used LIMIT ?)',
+                (excess,),
+            )
+
+    def clear(self):
+        self._connection.execute('DELETE FROM positions')
+
+    def close(self):
+        self._connection.close()
+
+    def __len__(self):
+        return self._connection.execute('SELECT COUNT(*) FROM positions').fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
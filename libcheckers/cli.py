@@ -0,0 +1,247 @@
+import argparse
+import json
+import sys
+import time
+from collections import deque
+
+from libcheckers import BoardConfig
+from libcheckers.serialization import load_board, load_player, load_position_binary, save_game_over_reason
+
+
+JSONL_FORMAT = 'jsonl'
+BINARY_FORMAT = 'binary'
+
+# A binary position record, in the format of `serialization.save_position_binary`.
+BINARY_RECORD_SIZE = BoardConfig.total_squares + 1
+
+DEFAULT_CHUNK_SIZE = 256
+DEFAULT_PROGRESS_INTERVAL = 5.0
+
+
+def read_records(stream, input_format):
+    """
+    Read raw position records from a binary stream, without parsing them.
+
+    Yields
+    ------
+    bytes
+        A line of JSON for JSON Lines input, or a fixed-size record for binary input.
+    """
+
+    if input_format == BINARY_FORMAT:
+        while True:
+            record = stream.read(BINARY_RECORD_SIZE)
+            if not record:
+                return
+            yield record
+    else:
+        for line in stream:
+            if line.strip():
+                yield line
+
+
+def load_position(record, input_format):
+    """
+    Parse a raw position record.
+
+    JSON Lines records look like {"board": {...}, "player": "white"}, with the board in the format
+    of `serialization.save_board`. Malformed records raise KeyError, TypeError or ValueError.
+
+    Returns
+    -------
+    tuple
+        A 2-tuple: (board, player to move).
+    """
+
+    if input_format == BINARY_FORMAT:
+        return load_position_binary(record)
+
+    position_data = json.loads(record)
+    board_data = position_data['board']
+    if not isinstance(board_data, dict):
+        raise TypeError('Board must be an object, got {0}'.format(type(board_data).__name__))
+    for index in board_data:
+        if not 1 <= int(index) <= BoardConfig.total_squares:
+            raise ValueError('Invalid square: {0}'.format(index))
+    return load_board(board_data), load_player(position_data['player'])
+
+
+def analyze_position(board, player, depth=None):
+    """
+    Get the legal moves and the game state of a position, and optionally evaluate it with the search engine.
+
+    Returns
+    -------
+    dict
+        A JSON-serializable analysis result.
+    """
+
+    # Imported here so that the worker processes load these modules only when they need them.
+    from libcheckers.notation import format_move
+    from libcheckers.search import AlphaBetaSearch
+
+    moves = board.get_available_moves(player)
+    game_over_reason = board.check_game_over(player, available_moves=moves)
+    result = {
+        'moves': [format_move(move) for move in moves],
+        'game_over': save_game_over_reason(game_over_reason) if game_over_reason else None,
+    }
+
+    if depth and game_over_reason is None:
+        search_result = AlphaBetaSearch().search(board, player, max_depth=depth)
+        result['evaluation'] = {
+            'move': format_move(search_result.move) if search_result.move else None,
+            'score': search_result.score,
+            'depth': search_result.depth,
+        }
+
+    return result
+
+
+def analyze_records(records, input_format, depth=None):
+    """
+    Analyze a chunk of raw position records.
+    Malformed records produce an error entry instead of failing the chunk.
+    """
+
+    results = []
+    for record in records:
+        try:
+            board, player = load_position(record, input_format)
+            results.append(analyze_position(board, player, depth))
+        except (KeyError, TypeError, ValueError) as e:
+            results.append({'error': '{0}: {1}'.format(type(e).__name__, e)})
+    return results
+
+
+def _chunk(iterable, chunk_size):
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def analyze_stream(records, input_format, depth=None, workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Analyze a stream of raw position records, optionally on a process pool.
+
+    Only a bounded number of chunks is in flight at any time, so arbitrarily large inputs
+    can be processed in constant memory.
+
+    Yields
+    ------
+    dict
+        Analysis results, in the same order as the records.
+    """
+
+    chunks = _chunk(records, chunk_size)
+
+    if not workers:
+        for chunk in chunks:
+            for result in analyze_records(chunk, input_format, depth):
+                yield result
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(analyze_records, chunk, input_format, depth))
+            if len(pending) >= workers * 2:
+                for result in pending.popleft().result():
+                    yield result
+        while pending:
+            for result in pending.popleft().result():
+                yield result
+
+
+def _detect_format(path):
+    return BINARY_FORMAT if path.endswith('.bin') else JSONL_FORMAT
+
+
+def _write_stats(stderr, count, errors, elapsed, is_final=False):
+    rate = count / elapsed if elapsed > 0 else 0.0
+    stderr.write('{0} {1} positions ({2} errors) in {3:.1f}s, {4:.1f} positions/s\n'.format(
+        'Done:' if is_final else 'Progress:',
+        count,
+        errors,
+        elapsed,
+        rate,
+    ))
+    stderr.flush()
+
+
+def run_analyze(args, stdout, stderr):
+    input_format = args.format or _detect_format(args.input)
+    is_stdin = args.input == '-'
+    stream = getattr(sys.stdin, 'buffer', sys.stdin) if is_stdin else open(args.input, 'rb')
+
+    start_time = time.time()
+    last_report_time = start_time
+    count = 0
+    errors = 0
+
+    try:
+        records = read_records(stream, input_format)
+        for result in analyze_stream(records, input_format, args.depth, args.workers, args.chunk_size):
+            result['index'] = count
+            if 'error' in result:
+                errors += 1
+            stdout.write(json.dumps(result, sort_keys=True) + '\n')
+            count += 1
+
+            now = time.time()
+            if args.progress_interval and now - last_report_time >= args.progress_interval:
+                _write_stats(stderr, count, errors, now - start_time)
+                last_report_time = now
+    finally:
+        if not is_stdin:
+            stream.close()
+
+    _write_stats(stderr, count, errors, time.time() - start_time, is_final=True)
+    return 1 if errors else 0
+
+
+def main(argv=None, stdout=None, stderr=None):
+    stdout = stdout or sys.stdout
+    stderr = stderr or sys.stderr
+
+    parser = argparse.ArgumentParser(prog='libcheckers', description='International checkers tools.')
+    subparsers = parser.add_subparsers(dest='command')
+
+    analyze_parser = subparsers.add_parser(
+        'analyze',
+        help='List the legal moves and the game state of logged positions.',
+        description='Analyze positions from a JSON Lines file '
+                    '({{"board": ..., "player": "white"}} per line) or a binary file '
+                    '({0}-byte records: board, then player 1 or 2). '
+                    'Results are written to stdout as JSON Lines, '
+                    'statistics to stderr.'.format(BINARY_RECORD_SIZE),
+    )
+    analyze_parser.add_argument('input', help='The position file, or - for stdin.')
+    analyze_parser.add_argument('--format', choices=[JSONL_FORMAT, BINARY_FORMAT], default=None,
+                                help='The input format (default: binary for *.bin files, jsonl otherwise).')
+    analyze_parser.add_argument('--workers', type=int, default=None,
+                                help='The number of worker processes (default: analyze in this process).')
+    analyze_parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                                help='The number of positions per unit of work.')
+    analyze_parser.add_argument('--depth', type=int, default=None,
+                                help='Also evaluate every position with a search of this depth.')
+    analyze_parser.add_argument('--progress-interval', type=float, default=DEFAULT_PROGRESS_INTERVAL,
+                                help='Seconds between progress reports on stderr (0 to disable).')
+
+    args = parser.parse_args(argv)
+    if args.command == 'analyze':
+        return run_analyze(args, stdout, stderr)
+
+    parser.print_help(stderr)
+    return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,297 @@
+import argparse
+import sys
+
+from libcheckers import BoardConfig, movement
+from libcheckers.enum import Player, PieceClass
+from libcheckers.generator import RandomPositionGenerator
+from libcheckers.movement import Board, CaptureMove, ComboCaptureMove, get_move_path
+from libcheckers.serialization import save_board, save_player
+
+
+DEFAULT_CHUNK_SIZE = 500
+
+
+def reference_move_generator(board, player):
+    """
+    The reference move generator: the pure Python implementation of the rules.
+    """
+
+    return board.get_available_moves_python(player)
+
+
+def _get_move_key(move):
+    if isinstance(move, ComboCaptureMove):
+        kind = 'ComboCaptureMove'
+    else:
+        kind = 'CaptureMove' if isinstance(move, CaptureMove) else 'ForwardMove'
+    return kind, tuple(get_move_path(move))
+
+
+def _get_changed_squares(reference_board, candidate_board):
+    return [
+        (index, (reference_board.owner[index], reference_board.piece_class[index]),
+         (candidate_board.owner[index], candidate_board.piece_class[index]))
+        for index in range(1, BoardConfig.total_squares + 1)
+        if (reference_board.owner[index] != candidate_board.owner[index] or
+            reference_board.piece_class[index] != candidate_board.piece_class[index])
+    ]
+
+
+def normalize_moves(moves):
+    """
+    Convert a list of moves into an order-independent comparable form.
+    """
+
+    return sorted(_get_move_key(move) for move in moves)
+
+
+class Divergence(object):
+    """
+    A position where the reference and the candidate move generators disagree,
+    or where the candidate generator raised an exception (`error`, with `candidate_moves` set to None),
+    or where the move lists agree, but a move leads to different boards (`move`, with the squares
+    that differ as `changed_squares`: a list of
+    (square, reference (owner, class), candidate (owner, class))).
+    """
+
+    def __init__(self, board, player, reference_moves, candidate_moves, position_number=None, error=None,
+                 move=None, changed_squares=None):
+        self.board = board
+        self.player = player
+        self.reference_moves = reference_moves
+        self.candidate_moves = candidate_moves
+        self.position_number = position_number
+        self.error = error
+        self.move = move
+        self.changed_squares = changed_squares
+
+    def format(self):
+        """
+        Get a human-readable description of the divergence.
+        """
+
+        lines = [
+            'Divergence at position #{0}'.format(self.position_number),
+            'Board: {0}'.format(save_board(self.board)),
+            'Player: {0}'.format(save_player(self.player)),
+        ]
+        if self.error is not None:
+            lines.append('Candidate raised: {0}'.format(self.error))
+        elif self.move is not None:
+            lines.append('Different boards after {0}: {1}'.format(
+                _get_move_key(self.move), self.changed_squares,
+            ))
+        else:
+            reference_keys = normalize_moves(self.reference_moves)
+            candidate_keys = normalize_moves(self.candidate_moves)
+            missing_keys = [key for key in reference_keys if key not in candidate_keys]
+            extra_keys = [key for key in candidate_keys if key not in reference_keys]
+            lines.extend([
+                'Missing in candidate: {0}'.format(missing_keys),
+                'Extra in candidate: {0}'.format(extra_keys),
+            ])
+        return '\n'.join(lines)
+
+    def __repr__(self):
+        return 'Divergence: {0} ({1} to move)'.format(self.board, save_player(self.player))
+
+
+def check_position(board, player, candidate, reference=reference_move_generator):
+    """
+    Compare the candidate and the reference move generators on a single position.
+
+    When both generate the same moves, every move is also applied: the reference moves with full
+    validation, the candidate moves without it (the fast path of move generation users),
+    and the resulting boards must agree.
+
+    Returns
+    -------
+    Divergence or None
+    """
+
+    reference_moves = reference(board, player)
+    try:
+        candidate_moves = candidate(board, player)
+        if normalize_moves(reference_moves) != normalize_moves(candidate_moves):
+            return Divergence(board, player, reference_moves, candidate_moves)
+        candidate_boards = dict(
+            (_get_move_key(move), move.apply(board, validate=False))
+            for move in candidate_moves
+        )
+    except Exception as e:
+        # Stored as text, so that the divergence can be sent back from a worker process.
+        error = '{0}: {1}'.format(type(e).__name__, e)
+        return Divergence(board, player, reference_moves, None, error=error)
+
+    for move in reference_moves:
+        changed_squares = _get_changed_squares(move.apply(board), candidate_boards[_get_move_key(move)])
+        if changed_squares:
+            return Divergence(board, player, reference_moves, candidate_moves,
+                              move=move, changed_squares=changed_squares)
+    return None
+
+
+def minimize_divergence(divergence, candidate, reference=reference_move_generator):
+    """
+    Shrink the board of a divergence by removing pieces and demoting kings
+    for as long as the generators still disagree.
+
+    Returns
+    -------
+    Divergence
+        A divergence with a (locally) minimal board.
+    """
+
+    current = divergence
+    is_shrinking = True
+    while is_shrinking:
+        is_shrinking = False
+        for index in range(1, len(current.board.owner)):
+            if not current.board.owner[index]:
+                continue
+
+            candidate_boards = []
+
+            smaller_board = current.board.clone()
+            smaller_board.remove_piece(index)
+            candidate_boards.append(smaller_board)
+
+            if current.board.piece_class[index] == PieceClass.KING:
+                demoted_board = current.board.clone()
+                demoted_board.set_piece_class(index, PieceClass.MAN)
+                candidate_boards.append(demoted_board)
+
+            for board in candidate_boards:
+                smaller = check_position(board, current.player, candidate, reference)
+                if smaller is not None:
+                    smaller.position_number = divergence.position_number
+                    current = smaller
+                    is_shrinking = True
+                    break
+
+    return current
+
+
+def generate_positions(seed, count, placement_ratio=0.5):
+    """
+    Generate a reproducible mix of positions from random games and random piece placements.
+
+    Yields
+    ------
+    Board
+    """
+
+    generator = RandomPositionGenerator(seed)
+    for _ in range(count):
+        if generator.rng.random() < placement_ratio:
+            yield generator.random_placement(king_probability=generator.rng.random())
+        else:
+            board, _ = generator.random_game_position(min_plies=0, max_plies=120)
+            yield board
+
+
+def run_chunk(seed, count, candidate, reference=reference_move_generator, first_position_number=0):
+    """
+    Check a chunk of generated positions for both players.
+
+    Returns
+    -------
+    Divergence or None
+        The first divergence in the chunk, minimized.
+    """
+
+    for position_number, board in enumerate(generate_positions(seed, count), start=first_position_number):
+        for player in (Player.WHITE, Player.BLACK):
+            divergence = check_position(board, player, candidate, reference)
+            if divergence is not None:
+                divergence.position_number = position_number
+                return minimize_divergence(divergence, candidate, reference)
+    return None
+
+
+def run_differential_test(candidate, count, seed=0, reference=reference_move_generator,
+                          workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Compare two move generators over generated positions.
+
+    Parameters
+    ----------
+    candidate : callable
+        The move generator under test. Accepts (board, player) and returns a list of moves.
+        Must be picklable (e.g. a module-level function) when running on multiple workers.
+    count : int
+        The number of positions to check.
+    seed : int
+        The seed for position generation. Each chunk of positions derives its own seed from it.
+    reference : callable
+        The trusted move generator.
+    workers : int, optional
+        If specified, check the chunks in a pool with this many processes.
+    chunk_size : int
+        The number of positions per chunk of work.
+
+    Returns
+    -------
+    Divergence or None
+        The divergence found in the earliest chunk, or None if the generators agree.
+    """
+
+    chunks = [
+        (seed * 1000003 + chunk_index, min(chunk_size, count - first), first)
+        for chunk_index, first in enumerate(range(0, count, chunk_size))
+    ]
+
+    if not workers:
+        for chunk_seed, chunk_count, first in chunks:
+            divergence = run_chunk(chunk_seed, chunk_count, candidate, reference, first)
+            if divergence is not None:
+                return divergence
+        return None
+
+    # Imported here to keep multiprocessing out of the import path of single-process users.
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(run_chunk, chunk_seed, chunk_count, candidate, reference, first)
+            for chunk_seed, chunk_count, first in chunks
+        ]
+        for future in futures:
+            divergence = future.result()
+            if divergence is not None:
+                for other_future in futures:
+                    other_future.cancel()
+                return divergence
+
+    return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Compare the compiled move generator against the reference one.',
+    )
+    parser.add_argument('--count', type=int, default=10000, help='The number of positions to check.')
+    parser.add_argument('--seed', type=int, default=0, help='The seed for position generation.')
+    parser.add_argument('--workers', type=int, default=None, help='The number of worker processes.')
+    args = parser.parse_args(argv)
+
+    if movement.native_movegen is None:
+        sys.stderr.write('The compiled move generator is not built, nothing to compare.\n')
+        return 2
+
+    divergence = run_differential_test(
+        Board.get_available_moves_native,
+        args.count,
+        seed=args.seed,
+        workers=args.workers,
+    )
+    if divergence is None:
+        sys.stdout.write('No divergences in {0} positions.\n'.format(args.count))
+        return 0
+
+    sys.stdout.write(divergence.format() + '\n')
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -13,3 +13,24 @@ class GameOverReason(object):
     WHITE_WON = 1   # White player has won the game
     BLACK_WON = 2   # Black player has won the game
     DRAW = 3        # Neither player can win the game
+
+
+class DrawRule(object):
+    REPETITION = 1          # The same position has occurred three times with the same player to move
+    KING_MOVES = 2          # Only kings have been moved without capturing for 25 moves of each player
+    LIMITED_MATERIAL = 3    # A king against limited material failed to win within the allowed moves
+
+
+class MoveError(object):
+    EMPTY_START_SQUARE = 1      # There is no piece to move on the starting square
+    OCCUPIED_END_SQUARE = 2     # The destination square is not empty
+    BACKWARD_MOVE = 3           # A man tried to move backwards without capturing
+    OWN_PIECE_IN_WAY = 4        # A capture tried to jump over a piece of the same color
+    NOT_ONE_OPPONENT = 5        # A capture path does not contain exactly one opponent piece
+    NON_DIAGONAL_MOVE = 6       # The start and end squares are not on the same diagonal
+
+
+class ForfeitReason(object):
+    TIMEOUT = 'timeout'                 # The client did not respond within the move time limit
+    ILLEGAL_MOVE = 'illegal_move'       # The client submitted a move that is not allowed by the rules
+    CLIENT_ERROR = 'client_error'       # The client raised an exception or sent a malformed payload
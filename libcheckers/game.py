@@ -0,0 +1,369 @@
+from collections import OrderedDict
+
+from libcheckers.enum import Player, PieceClass, GameOverReason, DrawRule
+from libcheckers.movement import ForwardMove, ComboCaptureMove
+from libcheckers.utils import get_indexes_between, get_opponent, zobrist_black_to_move_key
+
+
+DEFAULT_SNAPSHOT_INTERVAL = 16
+
+# FMJD draw rules, expressed in plies (moves of both players).
+REPETITION_COUNT = 3
+KING_MOVES_PLY_LIMIT = 50
+SMALL_ENDGAME_PLY_LIMIT = 10
+LARGE_ENDGAME_PLY_LIMIT = 32
+
+
+def get_touched_squares(move):
+    """
+    Get the indexes of all squares whose contents can be changed by the specified move.
+    """
+
+    # Capture moves can change any square along their path, forward moves only the endpoints.
+    steps = move.moves if isinstance(move, ComboCaptureMove) else [move]
+    result = set()
+    for step in steps:
+        result.add(step.start_index)
+        result.add(step.end_index)
+        result.update(get_indexes_between(step.start_index, step.end_index))
+    return sorted(result)
+
+
+def get_material(board):
+    """
+    Get the material signature of a board: (white pieces, black pieces, white kings, black kings).
+    """
+
+    return (
+        board.get_piece_count(Player.WHITE),
+        board.get_piece_count(Player.BLACK),
+        board.get_king_count(Player.WHITE),
+        board.get_king_count(Player.BLACK),
+    )
+
+
+def get_endgame_ply_limit(board):
+    """
+    Get the number of plies after which the current material is declared a draw,
+    or None if the material is not limited.
+
+    One king against three pieces (with at least one king) is a draw after 16 moves of each player.
+    One king against two pieces or fewer (with at least one king) is a draw after 5 moves of each player.
+    """
+
+    for player, opponent in ((Player.WHITE, Player.BLACK), (Player.BLACK, Player.WHITE)):
+        if board.get_piece_count(player) != 1 or board.get_king_count(player) != 1:
+            continue
+        if board.get_king_count(opponent) == 0:
+            continue
+        if board.get_piece_count(opponent) <= 2:
+            return SMALL_ENDGAME_PLY_LIMIT
+        if board.get_piece_count(opponent) == 3:
+            return LARGE_ENDGAME_PLY_LIMIT
+
+    return None
+
+
+def get_position_key(board, player):
+    """
+    Get the hash key of a position, including the player to move.
+    """
+
+    return board.position_hash ^ (zobrist_black_to_move_key if player == Player.BLACK else 0)
+
+
+def get_move_summary(board_before, board_after, move, player_to_move):
+    """
+    Get what the draw rules need to know about a move, in a compact form that can be sent
+    between processes (e.g. computed in a worker that applies the move).
+
+    Returns
+    -------
+    tuple
+        A 4-tuple: (whether the move is a non-capturing king move, the position key after the move
+        (see `get_position_key`), the material signature after the move (see `get_material`),
+        the endgame ply limit after the move (see `get_endgame_ply_limit`)).
+    """
+
+    is_king_move = (
+        isinstance(move, ForwardMove) and
+        board_before.piece_class[move.start_index] == PieceClass.KING
+    )
+    return (
+        is_king_move,
+        get_position_key(board_after, player_to_move),
+        get_material(board_after),
+        get_endgame_ply_limit(board_after),
+    )
+
+
+class DrawRuleTracker(object):
+    """
+    Tracks the FMJD draw rules (threefold repetition, 25 king moves without capturing,
+    and limited material endgames) in constant time per move.
+    """
+
+    def __init__(self, board, player):
+        """
+        Parameters
+        ----------
+        board : Board
+            The initial board.
+        player : int
+            The player to move on the initial board.
+        """
+
+        self.draw_rule = None
+        self._position_counts = {}
+        self._king_moves_plies = 0
+        self._endgame_material = get_material(board)
+        self._endgame_plies = 0
+        self._record_position(get_position_key(board, player))
+
+    def _record_position(self, position_key):
+        self._position_counts[position_key] = self._position_counts.get(position_key, 0) + 1
+        return self._position_counts[position_key]
+
+    def update(self, move_summary):
+        """
+        Account for a move, described by `get_move_summary`.
+
+        Returns
+        -------
+        int or None
+            The DrawRule that ends the game after the move, or None.
+        """
+
+        is_king_move, position_key, endgame_material, endgame_ply_limit = move_summary
+
+        # Captures and man moves are irreversible, so the earlier positions cannot repeat.
+        if is_king_move:
+            self._king_moves_plies += 1
+        else:
+            self._king_moves_plies = 0
+            self._position_counts.clear()
+
+        repetitions = self._record_position(position_key)
+
+        # The endgame counter restarts whenever the material changes.
+        if endgame_material != self._endgame_material:
+            self._endgame_material = endgame_material
+            self._endgame_plies = 0
+        else:
+            self._endgame_plies += 1
+
+        if repetitions >= REPETITION_COUNT:
+            self.draw_rule = DrawRule.REPETITION
+        elif self._king_moves_plies >= KING_MOVES_PLY_LIMIT:
+            self.draw_rule = DrawRule.KING_MOVES
+        elif endgame_ply_limit is not None and self._endgame_plies >= endgame_ply_limit:
+            self.draw_rule = DrawRule.LIMITED_MATERIAL
+        else:
+            self.draw_rule = None
+        return self.draw_rule
+
+
+class Game(object):
+    """
+    Records the moves of a game and provides random access to any position in it.
+
+    The game keeps a board snapshot every `snapshot_interval` plies and a compact per-ply log
+    of changed squares in between, so seeking to any ply takes at most `snapshot_interval`
+    change applications instead of replaying the whole game.
+
+    The game also tracks the FMJD draw rules (threefold repetition, 25 king moves without
+    capturing, and limited material endgames) in constant time per move.
+    """
+
+    def __init__(self, board, first_player=Player.WHITE,
+                 snapshot_interval=DEFAULT_SNAPSHOT_INTERVAL, max_snapshots=None):
+        """
+        Parameters
+        ----------
+        board : Board
+            The initial board of the game.
+        first_player : int
+            The player who makes the first move.
+        snapshot_interval : int
+            Keep a full board snapshot every this many plies.
+        max_snapshots : int, optional
+            The maximum number of snapshots to keep in memory (in addition to the initial board).
+            The least recently used snapshots will be evicted when this budget is exceeded.
+        """
+
+        self.first_player = first_player
+        self.snapshot_interval = snapshot_interval
+        self.max_snapshots = max_snapshots
+
+        self.moves = []
+        self.board = board.clone()
+
+        # Each item is a tuple of square changes: (index, old owner, old class, new owner, new class).
+        self._change_log = []
+
+        self._initial_board = board.clone()
+        self._snapshots = OrderedDict()
+
+        self._cursor_board = board.clone()
+        self._cursor_ply = 0
+
+        self._draw_rules = DrawRuleTracker(self.board, first_player)
+
+    def __len__(self):
+        return len(self.moves)
+
+    def get_player_to_move(self, ply=None):
+        """
+        Get the player to move at the specified ply (at the end of the game by default).
+        """
+
+        if ply is None:
+            ply = len(self.moves)
+        other_player = get_opponent(self.first_player)
+        return self.first_player if ply % 2 == 0 else other_player
+
+    def apply_move(self, move):
+        """
+        Apply a move to the current (last) position of the game and record it.
+
+        Returns
+        -------
+        Board
+            The board produced by the move.
+        """
+
+        board_before = self.board
+        board_after = move.apply(board_before)
+
+        changes = tuple(
+            (
+                index,
+                board_before.owner[index],
+                board_before.piece_class[index],
+                board_after.owner[index],
+                board_after.piece_class[index],
+            )
+            for index in get_touched_squares(move)
+            if (board_before.owner[index] != board_after.owner[index] or
+                board_before.piece_class[index] != board_after.piece_class[index])
+        )
+
+        self.moves.append(move)
+        self._change_log.append(changes)
+        self.board = board_after
+        self._draw_rules.update(get_move_summary(board_before, board_after, move, self.get_player_to_move()))
+
+        ply = len(self.moves)
+        if ply % self.snapshot_interval == 0:
+            self._snapshots[ply] = board_after.clone()
+            self.evict_snapshots()
+
+        return board_after
+
+    @property
+    def draw_rule(self):
+        """
+        The DrawRule that ends the game at its current (last) position, or None.
+        """
+
+        return self._draw_rules.draw_rule
+
+    def get_position_key(self, board, player):
+        """
+        Get the hash key of a position, including the player to move.
+        """
+
+        return get_position_key(board, player)
+
+    def check_game_over(self):
+        """
+        Check if the game is over at its current (last) position, taking the draw rules into account.
+
+        Returns
+        -------
+        int or None
+            A GameOverReason value, or None if the game can continue.
+        """
+
+        if self.draw_rule is not None:
+            return GameOverReason.DRAW
+        return self.board.check_game_over(self.get_player_to_move())
+
+    def seek(self, ply):
+        """
+        Get the board at the specified ply (0 being the initial board).
+
+        Returns
+        -------
+        Board
+            An independent copy of the board at the specified ply.
+        """
+
+        if not 0 <= ply <= len(self.moves):
+            msg = 'Ply {0} is out of range (0 to {1})'.format(ply, len(self.moves))
+            raise IndexError(msg)
+
+        snapshot_ply = self._find_snapshot_ply(ply)
+
+        # Walk from the current cursor if it is closer than the nearest snapshot.
+        if abs(ply - self._cursor_ply) > ply - snapshot_ply:
+            if snapshot_ply == 0:
+                self._cursor_board = self._initial_board.clone()
+            else:
+                self._cursor_board = self._snapshots[snapshot_ply].clone()
+                self._snapshots.move_to_end(snapshot_ply)
+            self._cursor_ply = snapshot_ply
+
+        while self._cursor_ply < ply:
+            self._redo(self._cursor_board, self._change_log[self._cursor_ply])
+            self._cursor_ply += 1
+        while self._cursor_ply > ply:
+            self._cursor_ply -= 1
+            self._undo(self._cursor_board, self._change_log[self._cursor_ply])
+
+        return self._cursor_board.clone()
+
+    def _find_snapshot_ply(self, ply):
+        snapshot_ply = ply - ply % self.snapshot_interval
+        while snapshot_ply > 0 and snapshot_ply not in self._snapshots:
+            snapshot_ply -= self.snapshot_interval
+        return snapshot_ply
+
+    @staticmethod
+    def _redo(board, changes):
+        for index, _, _, new_owner, new_class in changes:
+            board.remove_piece(index)
+            if new_owner:
+                board.add_piece(index, new_owner, new_class)
+
+    @staticmethod
+    def _undo(board, changes):
+        for index, old_owner, old_class, _, _ in changes:
+            board.remove_piece(index)
+            if old_owner:
+                board.add_piece(index, old_owner, old_class)
+
+    def evict_snapshots(self, max_snapshots=None):
+        """
+        Evict the least recently used snapshots until the memory budget is met.
+
+        Parameters
+        ----------
+        max_snapshots : int, optional
+            The number of snapshots to keep. Defaults to the budget specified for the game.
+        """
+
+        if max_snapshots is None:
+            max_snapshots = self.max_snapshots
+        if max_snapshots is None:
+            return
+
+        while len(self._snapshots) > max_snapshots:
+            self._snapshots.popitem(last=False)
+
+    def get_snapshot_plies(self):
+        """
+        Get the plies for which a board snapshot is currently stored.
+        """
+
+        return sorted(self._snapshots.keys())
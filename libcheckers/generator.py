@@ -0,0 +1,174 @@
+import random
+import time
+
+from libcheckers import BoardConfig
+from libcheckers.enum import Player, PieceClass
+from libcheckers.movement import Board, ForwardMove, get_move_path
+from libcheckers.serialization import save_position_binary
+from libcheckers.utils import get_opponent, is_black_home_row, is_white_home_row
+
+
+DEFAULT_MAX_PLIES = 200
+
+
+def create_starting_board():
+    """
+    Create a board with the standard starting position of international checkers.
+    """
+
+    board = Board()
+    for index in range(1, 21):
+        board.add_piece(index, Player.BLACK, PieceClass.MAN)
+    for index in range(31, 51):
+        board.add_piece(index, Player.WHITE, PieceClass.MAN)
+    return board
+
+
+class RandomPositionGenerator(object):
+    """
+    Generates reproducible random positions for fuzzing and load testing.
+
+    All randomness comes from a single seeded random number generator, so the same seed
+    always produces the same sequence of positions.
+    """
+
+    def __init__(self, seed=None):
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+    def choose_move(self, moves):
+        """
+        Choose a random move from the list of available moves.
+        """
+
+        # Different move generators may order capture moves differently. Sort them to make
+        # the choice independent of the backend.
+        if len(moves) > 1 and not isinstance(moves[0], ForwardMove):
+            moves = sorted(moves, key=get_move_path)
+        return moves[self.rng.randrange(len(moves))]
+
+    def play_random_game(self, board=None, player=Player.WHITE, max_plies=DEFAULT_MAX_PLIES):
+        """
+        Play a game of random legal moves, yielding every position along the way.
+
+        The same board object is modified in place and yielded after every move,
+        so the consumer must clone it if it needs to keep it.
+
+        Yields
+        ------
+        tuple
+            A 2-tuple: (board, player to move).
+        """
+
+        board = create_starting_board() if board is None else board.clone()
+        for _ in range(max_plies):
+            moves = board.get_available_moves(player)
+            if not moves:
+                return
+            self.choose_move(moves).apply_in_place(board)
+            player = get_opponent(player)
+            yield board, player
+
+    def random_game_position(self, min_plies=10, max_plies=80):
+        """
+        Get a position reached by playing random moves from the starting position.
+
+        Parameters
+        ----------
+        min_plies : int
+            The minimum number of plies to play.
+        max_plies : int
+            The maximum number of plies to play. The position will be earlier than
+            `min_plies` if the game ends before that.
+
+        Returns
+        -------
+        tuple
+            A 2-tuple: (board, player to move).
+        """
+
+        target_ply = self.rng.randint(min_plies, max_plies)
+        board, player = create_starting_board(), Player.WHITE
+        for board, player in self.play_random_game(board, player, target_ply):
+            pass
+        return board.clone(), player
+
+    def random_placement(self, white_pieces=None, black_pieces=None, king_probability=0.2):
+        """
+        Get a board with pieces placed randomly. The placement is legal-looking (e.g. there are
+        no men on the opponent's home row), but not necessarily reachable from the starting position.
+
+        Parameters
+        ----------
+        white_pieces : int, optional
+            The number of white pieces. Random (1 to 20) by default.
+        black_pieces : int, optional
+            The number of black pieces. Random (1 to 20) by default.
+        king_probability : float
+            The probability of each piece being a king.
+
+        Returns
+        -------
+        Board
+        """
+
+        if white_pieces is None:
+            white_pieces = self.rng.randint(1, 20)
+        if black_pieces is None:
+            black_pieces = self.rng.randint(1, 20)
+
+        squares = self.rng.sample(range(1, BoardConfig.total_squares + 1), white_pieces + black_pieces)
+        board = Board()
+        for i, index in enumerate(squares):
+            player = Player.WHITE if i < white_pieces else Player.BLACK
+            is_promotion_row = is_black_home_row if player == Player.WHITE else is_white_home_row
+            if is_promotion_row(index) or self.rng.random() < king_probability:
+                board.add_piece(index, player, PieceClass.KING)
+            else:
+                board.add_piece(index, player, PieceClass.MAN)
+
+        return board
+
+    def stream(self, count=None, mode='game', serialized=False, rate=None, **kwargs):
+        """
+        Stream random positions.
+
+        Parameters
+        ----------
+        count : int, optional
+            The number of positions to generate. Infinite by default.
+        mode : str
+            'game' for positions from random games, 'placement' for random piece placements.
+        serialized : bool
+            If True, yield positions in the compact binary format (see `serialization.save_position_binary`),
+            which `libcheckers analyze` reads as binary input, instead of Board objects.
+            Random placements are saved with White to move.
+        rate : float, optional
+            The maximum number of positions per second. Unlimited by default.
+        kwargs
+            Extra arguments for `random_game_position` or `random_placement`.
+
+        Yields
+        ------
+        Board or bytes
+        """
+
+        if mode not in ('game', 'placement'):
+            raise ValueError('Unknown mode: {0}'.format(mode))
+
+        start_time = time.time()
+        generated = 0
+        while count is None or generated < count:
+            if mode == 'game':
+                board, player = self.random_game_position(**kwargs)
+            else:
+                board, player = self.random_placement(**kwargs), Player.WHITE
+
+            # Throttle to the target rate.
+            if rate:
+                delay = start_time + generated / rate - time.time()
+                if delay > 0:
+                    time.sleep(delay)
+
+            generated += 1
+            yield save_position_binary(board, player) if serialized else board
@@ -0,0 +1,338 @@
+import math
+import random
+import time
+
+from libcheckers.enum import Player, PieceClass, GameOverReason
+from libcheckers.movement import get_move_path
+from libcheckers.utils import get_opponent, is_black_home_row, is_white_home_row
+
+
+DEFAULT_EXPLORATION = math.sqrt(2)
+DEFAULT_MAX_ROLLOUT_PLIES = 150
+
+
+def random_rollout_policy(board, player, moves, rng):
+    """
+    Choose a uniformly random move.
+    """
+
+    return rng.choice(moves)
+
+
+def promotion_rollout_policy(board, player, moves, rng):
+    """
+    Choose a random move that promotes a man to a king if there is one, or any random move otherwise.
+    """
+
+    is_promotion_row = is_black_home_row if player == Player.WHITE else is_white_home_row
+    promoting_moves = []
+    for move in moves:
+        path = get_move_path(move)
+        if board.piece_class[path[0]] == PieceClass.MAN and is_promotion_row(path[-1]):
+            promoting_moves.append(move)
+    return rng.choice(promoting_moves or moves)
+
+
+def rollout(board, player, rollout_policy, rng, max_plies=DEFAULT_MAX_ROLLOUT_PLIES):
+    """
+    Play the game out from the specified position, modifying the board in place.
+
+    Returns
+    -------
+    int
+        The GameOverReason of the finished game. Games that exceed `max_plies` are counted as draws.
+    """
+
+    for _ in range(max_plies):
+        moves = board.get_available_moves(player)
+        if not moves:
+            return GameOverReason.BLACK_WON if player == Player.WHITE else GameOverReason.WHITE_WON
+
+        # The full game over check is expensive, so only run it when the material allows a draw.
+        if board.get_piece_count(Player.WHITE) == 1 and board.get_piece_count(Player.BLACK) == 1:
+            game_over_reason = board.check_game_over(player)
+            if game_over_reason is not None:
+                return game_over_reason
+
+        rollout_policy(board, player, moves, rng).apply_in_place(board)
+        player = get_opponent(player)
+
+    return GameOverReason.DRAW
+
+
+def get_reward(game_over_reason, player):
+    """
+    Convert the outcome of a game into a reward for the specified player.
+    """
+
+    if game_over_reason == GameOverReason.DRAW:
+        return 0.5
+    if game_over_reason == GameOverReason.WHITE_WON:
+        return 1.0 if player == Player.WHITE else 0.0
+    return 1.0 if player == Player.BLACK else 0.0
+
+
+class Node(object):
+    """
+    A node of the Monte Carlo search tree.
+    """
+
+    def __init__(self, player, move=None, parent=None):
+        self.player = player            # The player to move in this node
+        self.move = move                # The move that led to this node from its parent
+        self.parent = parent
+        self.children = []
+        self.untried_moves = None
+        self.visits = 0
+        self.reward = 0.0               # Total reward of the player who made `move`
+
+    def select_child(self, exploration):
+        """
+        Select the most promising child node according to the UCT formula.
+        """
+
+        log_visits = math.log(self.visits)
+        return max(
+            self.children,
+            key=lambda child: (
+                child.reward / child.visits +
+                exploration * math.sqrt(log_visits / child.visits)
+            )
+        )
+
+
+class SearchStats(object):
+    """
+    Performance statistics of a single search.
+    """
+
+    def __init__(self, playouts, elapsed):
+        self.playouts = playouts
+        self.elapsed = elapsed
+
+    @property
+    def playouts_per_second(self):
+        return self.playouts / self.elapsed if self.elapsed > 0 else 0.0
+
+    def __repr__(self):
+        return 'Playouts: {0} in {1:.3f}s ({2:.1f}/s)'.format(
+            self.playouts,
+            self.elapsed,
+            self.playouts_per_second,
+        )
+
+
+class MCTS(object):
+    """
+    Monte Carlo Tree Search with UCT selection.
+
+    The tree is reused between moves: after calling `advance` with the move actually played,
+    the statistics of the corresponding subtree are kept for the next search.
+
+    Parallel searches share one process pool, which is kept between searches and shut down by `close`.
+    """
+
+    def __init__(self, exploration=DEFAULT_EXPLORATION, rollout_policy=random_rollout_policy,
+                 max_rollout_plies=DEFAULT_MAX_ROLLOUT_PLIES, seed=None, executor=None):
+        """
+        Parameters
+        ----------
+        exploration : float
+            The exploration constant of the UCT formula.
+        rollout_policy : callable
+            A function that accepts (board, player, moves, rng) and chooses a move for the rollout.
+            Must be a module-level function to be usable with parallel search.
+        max_rollout_plies : int
+            Rollouts longer than this are counted as draws.
+        seed : int, optional
+            The seed of the random number generator.
+        executor : concurrent.futures.Executor, optional
+            The executor for parallel search. If omitted, a process pool is created on the first
+            parallel search and shut down by `close`.
+        """
+
+        self.exploration = exploration
+        self.rollout_policy = rollout_policy
+        self.max_rollout_plies = max_rollout_plies
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+        self.root = None
+        self.root_board = None
+        self.last_search_stats = None
+
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._executor_workers = None
+
+    def _ensure_root(self, board, player):
+        is_same_position = (
+            self.root is not None and
+            self.root.player == player and
+            self.root_board.position_hash == board.position_hash
+        )
+        if not is_same_position:
+            self.root = Node(player)
+            self.root_board = board.clone()
+
+    def search(self, board, player, iterations=None, time_limit=None, workers=None):
+        """
+        Run the search and choose the best move for the specified player.
+
+        Parameters
+        ----------
+        board : Board
+            The position to search.
+        player : int
+            The player to move.
+        iterations : int, optional
+            The number of playouts to run (per worker when searching in parallel).
+        time_limit : float, optional
+            The maximum number of seconds to search for (applies to each worker when searching in parallel).
+        workers : int, optional
+            If specified, run root-parallel search in a pool with this many processes.
+
+        Returns
+        -------
+        BaseMove or None
+            The most visited move, or None if there are no moves available.
+        """
+
+        if iterations is None and time_limit is None:
+            msg = 'Either the number of iterations or the time limit must be specified'
+            raise ValueError(msg)
+
+        if workers:
+            return self._search_parallel(board, player, iterations, time_limit, workers)
+
+        self._ensure_root(board, player)
+        start_time = time.time()
+        playouts = 0
+
+        while iterations is None or playouts < iterations:
+            if time_limit is not None and time.time() - start_time >= time_limit:
+                break
+            self._run_iteration()
+            playouts += 1
+
+        self.last_search_stats = SearchStats(playouts, time.time() - start_time)
+
+        if not self.root.children:
+            return None
+        return max(self.root.children, key=lambda child: child.visits).move
+
+    def _run_iteration(self):
+        node = self.root
+        board = self.root_board.clone()
+
+        # Selection: descend through fully expanded nodes, applying moves to a single board.
+        while node.untried_moves == [] and node.children:
+            node = node.select_child(self.exploration)
+            node.move.apply_in_place(board)
+
+        # Expansion.
+        if node.untried_moves is None:
+            node.untried_moves = board.get_available_moves(node.player)
+            self.rng.shuffle(node.untried_moves)
+        if node.untried_moves:
+            move = node.untried_moves.pop()
+            move.apply_in_place(board)
+            child = Node(get_opponent(node.player), move, node)
+            node.children.append(child)
+            node = child
+
+        # Simulation.
+        game_over_reason = rollout(board, node.player, self.rollout_policy, self.rng, self.max_rollout_plies)
+
+        # Backpropagation.
+        while node is not None:
+            node.visits += 1
+            node.reward += get_reward(game_over_reason, get_opponent(node.player))
+            node = node.parent
+
+    def _search_parallel(self, board, player, iterations, time_limit, workers):
+        start_time = time.time()
+        base_seed = self.rng.randrange(2 ** 32)
+
+        executor = self._get_executor(workers)
+        futures = [
+            executor.submit(
+                _run_root_worker,
+                board, player, iterations, time_limit, base_seed + worker_index,
+                self.exploration, self.rollout_policy, self.max_rollout_plies,
+            )
+            for worker_index in range(workers)
+        ]
+        worker_results = [future.result() for future in futures]
+
+        # Aggregate the root statistics of the independent trees.
+        moves = []
+        visits = []
+        playouts = 0
+        for root_stats, worker_playouts in worker_results:
+            playouts += worker_playouts
+            for move, move_visits in root_stats:
+                if move in moves:
+                    visits[moves.index(move)] += move_visits
+                else:
+                    moves.append(move)
+                    visits.append(move_visits)
+
+        self.last_search_stats = SearchStats(playouts, time.time() - start_time)
+        self.root = None
+        self.root_board = None
+
+        if not moves:
+            return None
+        return moves[visits.index(max(visits))]
+
+    def _get_executor(self, workers):
+        if self._owns_executor and self._executor is not None and self._executor_workers != workers:
+            self.close()
+        if self._executor is None:
+            # Imported here to keep multiprocessing out of the import path of single-process users.
+            from concurrent.futures import ProcessPoolExecutor
+            self._executor = ProcessPoolExecutor(max_workers=workers)
+            self._executor_workers = workers
+        return self._executor
+
+    def close(self):
+        """
+        Shut down the process pool if it was created by the search.
+        """
+
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def advance(self, move):
+        """
+        Reuse the subtree of the specified move (typically the one actually played) for the next search.
+        """
+
+        if self.root is None:
+            return
+
+        for child in self.root.children:
+            if child.move == move:
+                move.apply_in_place(self.root_board)
+                child.parent = None
+                self.root = child
+                return
+
+        self.root = None
+        self.root_board = None
+
+
+def _run_root_worker(board, player, iterations, time_limit, seed, exploration, rollout_policy,
+                     max_rollout_plies):
+    mcts = MCTS(exploration, rollout_policy, max_rollout_plies, seed)
+    mcts.search(board, player, iterations=iterations, time_limit=time_limit)
+    root_stats = [(child.move, child.visits) for child in mcts.root.children]
+    return root_stats, mcts.last_search_stats.playouts
@@ -1,17 +1,42 @@
+import time
 from abc import abstractmethod
-from collections import deque
-from copy import deepcopy
 
-from libcheckers import BoardConfig, InvalidMoveException
-from libcheckers.enum import Player, PieceClass, GameOverReason
+from libcheckers import BoardConfig, BudgetExceededException, InvalidMoveException
+from libcheckers.enum import Player, PieceClass, GameOverReason, MoveError
 from libcheckers.utils import (
     index_to_coords,
     coords_to_index,
+    diagonal_rays,
+    free_move_rays,
     get_indexes_between,
     get_lines_of_sight,
-    is_black_home_row,
-    is_white_home_row,
+    get_mask_count,
+    get_mask_indexes,
+    get_zobrist_key,
+    promotion_masks,
 )
+from libcheckers.stats import APPLY, CAPTURE_SEARCH, CHECK_GAME_OVER, FREE_MOVES, get_active_stats, timed
+from libcheckers.storage import LIST_STORAGE, copy_plane, create_plane, get_empty_value
+
+# The compiled move generator is optional. If it has not been built, the pure Python one is used.
+try:
+    from libcheckers import _movegen as native_movegen
+except ImportError:
+    native_movegen = None
+
+
+# Message templates for InvalidMoveException, formatted lazily with (start index, end index).
+_move_error_messages = {
+    MoveError.EMPTY_START_SQUARE: 'Cannot move from an empty square ({0})',
+    MoveError.OCCUPIED_END_SQUARE: 'Cannot move to a non-empty square ({1})',
+    MoveError.BACKWARD_MOVE: 'Cannot freely move backwards unless the piece is a king',
+    MoveError.OWN_PIECE_IN_WAY: 'Cannot capture when own pieces are in the way ({0} to {1})',
+    MoveError.NOT_ONE_OPPONENT: 'Cannot capture: must have exactly one opponent piece along the way',
+    MoveError.NON_DIAGONAL_MOVE: 'Non-diagonal move detected ({0} to {1})',
+}
+
+# The players whose pieces are counted in the piece lists. Captured pieces (see `Player.ZOMBIE`) are not.
+_piece_list_players = (Player.WHITE, Player.BLACK)
 
 
 class BaseMove(object):
@@ -20,7 +45,25 @@ class BaseMove(object):
     """
 
     @abstractmethod
-    def apply(self, board):
+    def get_error(self, board):
+        """
+        Check whether the move can be applied to the specified board, without raising exceptions.
+
+        Parameters
+        ----------
+        board
+            The board to check the move against.
+
+        Returns
+        -------
+        int or None
+            A MoveError code, or None if the move can be applied.
+        """
+
+        return None
+
+    @timed(APPLY)
+    def apply(self, board, validate=True):
         """
         Apply a move to a board and retrieve the board produced by the move.
 
@@ -28,6 +71,9 @@ class BaseMove(object):
         ----------
         board
             The board to apply the move to.
+        validate : bool
+            If False, skip all checks. Only use for moves that are known to be legal,
+            e.g. the ones returned by `Board.get_available_moves`.
 
         Returns
         -------
@@ -35,7 +81,35 @@ class BaseMove(object):
             A new board that will be produced after applying this move.
         """
 
-        return board
+        if validate:
+            error = self.get_error(board)
+            if error is not None:
+                raise self.create_exception(error)
+
+        new_board = board.clone()
+        self.apply_in_place(new_board)
+        return new_board
+
+    @abstractmethod
+    def apply_in_place(self, board):
+        """
+        Apply a move that is known to be legal (e.g. one returned by `Board.get_available_moves`)
+        directly to the specified board, without validating it or copying the board.
+
+        Parameters
+        ----------
+        board
+            The board to modify.
+        """
+
+        pass
+
+    def create_exception(self, error):
+        """
+        Create the exception describing the specified MoveError code for this move.
+        """
+
+        return InvalidMoveException(_move_error_messages[error], error, (self.start_index, self.end_index))
 
     @abstractmethod
     def __eq__(self, other):
@@ -55,24 +129,22 @@ class ForwardMove(BaseMove):
         self.start_index = start_index
         self.end_index = end_index
 
-    def apply(self, board):
-        if not board.owner[self.start_index]:
-            msg = 'Cannot move from an empty square ({0})'.format(self.start_index)
-            raise InvalidMoveException(msg)
+    def get_error(self, board):
+        own_color = board.owner[self.start_index]
+        if not own_color:
+            return MoveError.EMPTY_START_SQUARE
         if board.owner[self.end_index]:
-            msg = 'Cannot move to a non-empty square ({0})'.format(self.end_index)
-            raise InvalidMoveException(msg)
+            return MoveError.OCCUPIED_END_SQUARE
         is_backward_move = (
-            (board.owner[self.start_index] == Player.WHITE and self.end_index > self.start_index) or
-            (board.owner[self.start_index] == Player.BLACK and self.end_index < self.start_index)
+            (own_color == Player.WHITE and self.end_index > self.start_index) or
+            (own_color == Player.BLACK and self.end_index < self.start_index)
         )
         if is_backward_move and board.piece_class[self.start_index] != PieceClass.KING:
-            msg = 'Cannot freely move backwards unless the piece is a king'
-            raise InvalidMoveException(msg)
+            return MoveError.BACKWARD_MOVE
+        return None
 
-        new_board = board.clone()
-        new_board.move_piece(self.start_index, self.end_index)
-        return new_board
+    def apply_in_place(self, board):
+        board.move_piece(self.start_index, self.end_index)
 
     def __eq__(self, other):
         return (isinstance(other, ForwardMove) and
@@ -92,46 +164,54 @@ class CaptureMove(BaseMove):
         self.start_index = start_index
         self.end_index = end_index
 
+    def get_error(self, board):
+        owner = board.owner
+        own_color = owner[self.start_index]
+        if not own_color:
+            return MoveError.EMPTY_START_SQUARE
+        if owner[self.end_index]:
+            return MoveError.OCCUPIED_END_SQUARE
+
+        start_row, start_col = index_to_coords(self.start_index)
+        end_row, end_col = index_to_coords(self.end_index)
+        if abs(start_row - end_row) != abs(start_col - end_col):
+            return MoveError.NON_DIAGONAL_MOVE
+
+        opponent_count = 0
+        for index in get_indexes_between(self.start_index, self.end_index):
+            if owner[index] == own_color:
+                return MoveError.OWN_PIECE_IN_WAY
+            if owner[index]:
+                opponent_count += 1
+        if opponent_count != 1:
+            return MoveError.NOT_ONE_OPPONENT
+        return None
+
     def find_opponent_square(self, board):
         """
         Retrieve the index of the square that contains the enemy piece to be captured.
+        Raises InvalidMoveException if the capture is not possible.
         """
 
-        path_indexes = get_indexes_between(self.start_index, self.end_index)
-        own_color = board.owner[self.start_index]
-
-        own_path_squares = [
-            index
-            for index in path_indexes
-            if board.owner[index] == own_color
-        ]
-        opponent_path_squares = [
-            index
-            for index in path_indexes
-            if board.owner[index] and board.owner[index] != own_color
-        ]
+        error = self.get_error(board)
+        if error is not None:
+            raise self.create_exception(error)
+        return self.find_captured_square(board)
 
-        if len(own_path_squares) > 0:
-            msg = 'Cannot capture when own pieces are in the way: {0}'
-            raise InvalidMoveException(msg.format(', '.join(str(index) for index in own_path_squares)))
-        if len(opponent_path_squares) != 1:
-            msg = 'Cannot capture: must have exactly one opponent piece along the way'
-            raise InvalidMoveException(msg)
-        if not board.owner[self.start_index]:
-            msg = 'Cannot move from an empty square ({0})'.format(self.start_index)
-            raise InvalidMoveException(msg)
-        if board.owner[self.end_index]:
-            msg = 'Cannot move to a non-empty square ({0})'.format(self.end_index)
-            raise InvalidMoveException(msg)
+    def find_captured_square(self, board):
+        """
+        Retrieve the index of the captured square for a move that is known to be legal.
+        Unlike `find_opponent_square`, does not validate the move.
+        """
 
-        return opponent_path_squares[0]
+        for index in get_indexes_between(self.start_index, self.end_index):
+            if board.owner[index]:
+                return index
 
-    def apply(self, board):
-        opponent_square = self.find_opponent_square(board)
-        new_board = board.clone()
-        new_board.move_piece(self.start_index, self.end_index)
-        new_board.remove_piece(opponent_square)
-        return new_board
+    def apply_in_place(self, board):
+        opponent_square = self.find_captured_square(board)
+        board.move_piece(self.start_index, self.end_index)
+        board.remove_piece(opponent_square)
 
     def __eq__(self, other):
         return (isinstance(other, CaptureMove) and
@@ -150,33 +230,50 @@ class ComboCaptureMove(BaseMove):
     def __init__(self, moves):
         self.moves = moves
 
-    def apply(self, board):
-        new_board = board
+    def _apply_steps(self, board, validate):
+        # According to the rules, men should not be promoted when merely passing through
+        # the home row. They actually need to finish the move there to be promoted.
+        old_class = board.piece_class[self.moves[0].start_index]
         zombies_to_clear = []
 
         for i, move in enumerate(self.moves):
-            # According to the rules, men should not be promoted when merely passing through
-            # the home row. They actually need to finish the move there to be promoted.
-            old_class = new_board.piece_class[move.start_index]
+            if validate:
+                error = move.get_error(board)
+                if error is not None:
+                    return move, error
 
             # Remove captured pieces only after the move is finished. Otherwise king moves
             # like "forward, capture right, then capture left" would be allowed.
-            opponent_square = move.find_opponent_square(new_board)
+            opponent_square = move.find_captured_square(board)
             zombies_to_clear.append(opponent_square)
+            board.mark_captured(opponent_square)
+            board.move_piece(move.start_index, move.end_index)
 
-            new_board = move.apply(new_board)
-            new_board.owner[opponent_square] = Player.ZOMBIE
-
-            # Restore the piece class if it was "accidentally" promoted in between the moves.
+            # Only the final square of the move can promote the piece.
             if i < len(self.moves) - 1:
-                new_board.piece_class[move.end_index] = old_class
+                board.set_piece_class(move.end_index, old_class)
 
         # Wipe the zombies.
         for zombie in zombies_to_clear:
-            new_board.remove_piece(zombie)
+            board.remove_piece(zombie)
+
+        return None, None
 
+    def get_error(self, board):
+        _, error = self._apply_steps(board.clone(), validate=True)
+        return error
+
+    @timed(APPLY)
+    def apply(self, board, validate=True):
+        new_board = board.clone()
+        failed_move, error = self._apply_steps(new_board, validate)
+        if error is not None:
+            raise failed_move.create_exception(error)
         return new_board
 
+    def apply_in_place(self, board):
+        self._apply_steps(board, validate=False)
+
     def __eq__(self, other):
         return (isinstance(other, ComboCaptureMove) and
                 len(self.moves) == len(other.moves) and
@@ -186,84 +283,261 @@ class ComboCaptureMove(BaseMove):
         return 'Combo x{0}: [{1}]'.format(len(self.moves), ', '.join(str(move) for move in self.moves))
 
 
+def get_move_path(move):
+    """
+    Get the squares visited by a move: the starting square followed by every landing square.
+    """
+
+    steps = move.moves if isinstance(move, ComboCaptureMove) else [move]
+    return [steps[0].start_index] + [step.end_index for step in steps]
+
+
+class CaptureSearchBudget(object):
+    """
+    Limits the work spent on generating capture sequences for a single position,
+    so that pathological positions (e.g. many kings with many capture paths) cannot exhaust
+    the time or memory of the process. A limit of None means unlimited.
+    """
+
+    def __init__(self, max_nodes=None, max_sequences=None, time_limit=None):
+        """
+        Parameters
+        ----------
+        max_nodes : int, optional
+            Maximum number of capture steps to expand.
+        max_sequences : int, optional
+            Maximum number of complete capture sequences to produce.
+        time_limit : float, optional
+            Maximum number of seconds to spend.
+        """
+
+        self.max_nodes = max_nodes
+        self.max_sequences = max_sequences
+        self.time_limit = time_limit
+
+    def get_deadline(self):
+        """
+        Get the absolute time at which a search started now must stop, or None if there is no time limit.
+        """
+
+        return time.time() + self.time_limit if self.time_limit is not None else None
+
+    def check(self, nodes, sequences, deadline):
+        """
+        Raise BudgetExceededException if a search with the specified counters is over the budget.
+        """
+
+        if self.max_nodes is not None and nodes > self.max_nodes:
+            raise BudgetExceededException('max_nodes', self.max_nodes)
+        if self.max_sequences is not None and sequences > self.max_sequences:
+            raise BudgetExceededException('max_sequences', self.max_sequences)
+        if deadline is not None and time.time() > deadline:
+            raise BudgetExceededException('time_limit', self.time_limit)
+
+
 class Board(object):
     """
     Represents an international checkers game board and
     contains the movement logic of the game pieces.
     """
 
-    def __init__(self):
-        self.owner = [None] * (BoardConfig.total_squares + 1)
-        self.piece_class = [None] * (BoardConfig.total_squares + 1)
+    def __init__(self, storage=LIST_STORAGE):
+        """
+        Parameters
+        ----------
+        storage : str
+            How to store the owner and piece class of every square (see `libcheckers.storage`):
+            'list' (the default, None for empty squares), 'array' or 'numpy' (one byte per square,
+            0 for empty squares). All board operations work the same way with any storage type.
+        """
+
+        self.storage = storage
+        self._empty = get_empty_value(storage)
+        self.owner = create_plane(storage)
+        self.piece_class = create_plane(storage)
+
+        # Piece lists and king counts, maintained incrementally by the mutation methods below.
+        # The owner and piece_class arrays should not be modified directly, or these will go stale.
+        # Both are indexed by player. The piece lists are square bit masks: bit N is set if square N
+        # is occupied, which takes a few dozen bytes per board instead of kilobytes for sets.
+        self._player_squares = [0, 0, 0]
+        self._king_counts = [0, 0, 0]
+
+        # Zobrist hash of the piece placement, also maintained incrementally.
+        self.position_hash = 0
+
+        # Optional incremental mobility and attack maps (see `enable_attack_maps`).
+        self.attack_maps = None
+
+    def enable_attack_maps(self):
+        """
+        Start maintaining incremental mobility and attack maps for this board.
+        Boards produced from this one by applying moves will inherit and update the maps.
+
+        Returns
+        -------
+        AttackMaps
+            The attack maps attached to this board.
+        """
+
+        # Imported here to keep the attack map tables out of the import path when they are not used.
+        from libcheckers.attack_maps import AttackMaps
+
+        if self.attack_maps is None:
+            self.attack_maps = AttackMaps(self)
+        return self.attack_maps
+
+    def disable_attack_maps(self):
+        """
+        Stop maintaining mobility and attack maps for this board.
+        """
+
+        self.attack_maps = None
 
     def move_piece(self, start_index, end_index):
         """
         Move an existing game piece from point A to point B.
         """
 
-        self.owner[end_index] = self.owner[start_index]
-        self.owner[start_index] = None
+        player = self.owner[start_index]
+
+        self.owner[end_index] = player
+        self.owner[start_index] = self._empty
 
         self.piece_class[end_index] = self.piece_class[start_index]
-        self.piece_class[start_index] = None
+        self.piece_class[start_index] = self._empty
+
+        if player in _piece_list_players:
+            squares = self._player_squares[player]
+            self._player_squares[player] = squares & ~(1 << start_index) | 1 << end_index
+            self.position_hash ^= (
+                get_zobrist_key(start_index, player, self.piece_class[end_index]) ^
+                get_zobrist_key(end_index, player, self.piece_class[end_index])
+            )
+
+        if self.attack_maps is not None:
+            self.attack_maps.invalidate(start_index)
+            self.attack_maps.invalidate(end_index)
 
         # Promote the piece if it has reached the opponent's home row.
-        if self.owner[end_index] == Player.WHITE and is_black_home_row(end_index):
-            self.piece_class[end_index] = PieceClass.KING
-        if self.owner[end_index] == Player.BLACK and is_white_home_row(end_index):
-            self.piece_class[end_index] = PieceClass.KING
+        if promotion_masks.get(player, 0) >> end_index & 1:
+            self.set_piece_class(end_index, PieceClass.KING)
 
     def add_piece(self, index, player, piece_class):
         """
         Place a new piece on the board with the specified owner and class.
         """
 
+        if self.owner[index]:
+            self.remove_piece(index)
+
         self.owner[index] = player
         self.piece_class[index] = piece_class
 
+        self._player_squares[player] |= 1 << index
+        if piece_class == PieceClass.KING:
+            self._king_counts[player] += 1
+        self.position_hash ^= get_zobrist_key(index, player, piece_class)
+
+        if self.attack_maps is not None:
+            self.attack_maps.invalidate(index)
+
     def remove_piece(self, index):
         """
         Clear the specified square from the board.
         """
 
-        self.owner[index] = None
-        self.piece_class[index] = None
+        player = self.owner[index]
+        if player in _piece_list_players:
+            self._player_squares[player] &= ~(1 << index)
+            if self.piece_class[index] == PieceClass.KING:
+                self._king_counts[player] -= 1
+            self.position_hash ^= get_zobrist_key(index, player, self.piece_class[index])
+
+        self.owner[index] = self._empty
+        self.piece_class[index] = self._empty
+
+        if self.attack_maps is not None:
+            self.attack_maps.invalidate(index)
+
+    def mark_captured(self, index):
+        """
+        Mark the piece at the specified square as captured without removing it from the board.
+        Captured pieces still block movement until the end of the turn (see `Player.ZOMBIE`).
+        """
+
+        player = self.owner[index]
+        if player in _piece_list_players:
+            self._player_squares[player] &= ~(1 << index)
+            if self.piece_class[index] == PieceClass.KING:
+                self._king_counts[player] -= 1
+            self.position_hash ^= get_zobrist_key(index, player, self.piece_class[index])
+
+        self.owner[index] = Player.ZOMBIE
+
+        if self.attack_maps is not None:
+            self.attack_maps.invalidate(index)
+
+    def set_piece_class(self, index, piece_class):
+        """
+        Change the class of the piece at the specified square (e.g. promote or demote it).
+        """
+
+        player = self.owner[index]
+        if player in _piece_list_players:
+            if self.piece_class[index] == PieceClass.KING:
+                self._king_counts[player] -= 1
+            if piece_class == PieceClass.KING:
+                self._king_counts[player] += 1
+            self.position_hash ^= (
+                get_zobrist_key(index, player, self.piece_class[index]) ^
+                get_zobrist_key(index, player, piece_class)
+            )
+
+        self.piece_class[index] = piece_class
+
+        if self.attack_maps is not None:
+            self.attack_maps.invalidate(index)
 
     def get_player_squares(self, player):
         """
         Get all squares on the board owned by the specified player.
         """
 
-        return [
-            index
-            for index in range(1, BoardConfig.total_squares + 1)
-            if self.owner[index] == player
-        ]
+        return get_mask_indexes(self._player_squares[player])
 
-    def get_free_movement_destinations(self, index):
+    def get_piece_count(self, player):
         """
-        Get all allowed destinations for free movement for the piece at the specified square.
+        Get the number of pieces (men and kings) owned by the specified player.
         """
 
-        own_color = self.owner[index]
-        own_class = self.piece_class[index]
+        return get_mask_count(self._player_squares[player])
 
-        visibility_range = BoardConfig.board_dim if own_class == PieceClass.KING else 1
-        lines_of_sight = get_lines_of_sight(index, visibility_range)
+    def get_king_count(self, player):
+        """
+        Get the number of kings owned by the specified player.
+        """
+
+        return self._king_counts[player]
+
+    def get_free_movement_destinations(self, index):
+        """
+        Get all allowed destinations for free movement for the piece at the specified square.
+        Empty squares and captured pieces (see `Player.ZOMBIE`) have no destinations.
+        """
 
-        # Men can only move forward, and the direction of forward depends on the color.
-        if own_class == PieceClass.MAN and own_color == Player.WHITE:
-            lines_of_sight = lines_of_sight[:2]
-        if own_class == PieceClass.MAN and own_color == Player.BLACK:
-            lines_of_sight = lines_of_sight[-2:]
+        owner = self.owner
+        rays = free_move_rays.get((owner[index], self.piece_class[index]))
+        if rays is None:
+            return []
 
         result = []
-        for line in lines_of_sight:
-            for i in range(0, len(line)):
+        for ray in rays[index]:
+            for square in ray:
                 # Cannot move beyond another piece if not capturing.
-                if self.owner[line[i]]:
+                if owner[square]:
                     break
-                result.append(line[i])
+                result.append(square)
 
         return result
 
@@ -328,118 +602,240 @@ class Board(object):
 
         return result
 
-    def get_capture_sequence_candidates(self, player):
+    def get_capture_sequence_candidates(self, player, budget=None):
         """
         Get all possible capture move sequences (not necessarily maximum ones)
         starting from every piece owned by the specified player.
         """
 
-        player_squares = self.get_player_squares(player)
+        return list(self.iter_capture_sequences(player, budget))
+
+    def iter_capture_sequences(self, player, budget=None):
+        """
+        Generate all possible capture move sequences (not necessarily maximum ones)
+        starting from every piece owned by the specified player, one at a time.
+
+        The capture tree is traversed depth-first, so memory use is bounded by the length
+        of the longest sequence rather than by the number of sequences.
 
-        # Check if there are any pieces in our line of sight that can be captured.
-        attack_options = []
-        for attacker in player_squares:
-            attack_options.extend([
-                (attacker, target)
-                for target in self.get_capturable_pieces(attacker)
-            ])
+        Parameters
+        ----------
+        player : int
+            The player to generate the captures for.
+        budget : CaptureSearchBudget, optional
+            Limits on the work done. Raises BudgetExceededException once any of them is exceeded.
+
+        Yields
+        ------
+        list
+            A sequence of CaptureMove steps, in the same order as the former breadth-first search
+            produced sequences of equal length.
+        """
 
-        # Run a tree traversal (BFS) to find all capture sequences, and choose the longest ones.
-        capture_sequences = []
+        deadline = budget.get_deadline() if budget is not None else None
+        nodes = 0
+        sequences = 0
+
+        # Intermediate boards of the search should not drag the attack maps along.
+        root_board = self
+        if self.attack_maps is not None:
+            root_board = self.clone()
+            root_board.disable_attack_maps()
+
+        # First step in each possible sequence: every piece in our line of sight that can be captured.
+        first_moves = [
+            CaptureMove(attacker, landing)
+            for attacker in self.get_player_squares(player)
+            for target in self.get_capturable_pieces(attacker)
+            for landing in self.get_available_capture_landing_positions(attacker, target)
+        ]
 
-        # Each item in the queue is a 3-tuple: (board, move, previous moves).
-        queue = deque()
+        # Each stack frame is a 2-tuple: (board, iterator over the capture steps to try on it).
+        # `path` holds the steps that led to the board in the topmost frame.
+        stack = [(root_board, iter(first_moves))]
+        path = []
 
-        # Initial queue items: first step in each possible sequence.
-        for attacker, target in attack_options:
-            queue.extend([
-                (self, CaptureMove(attacker, landing), [])
-                for landing in self.get_available_capture_landing_positions(attacker, target)
-            ])
+        while stack:
+            board_before, moves = stack[-1]
+            move = next(moves, None)
+            if move is None:
+                stack.pop()
+                if path:
+                    path.pop()
+                continue
 
-        # Main search queue.
-        while queue:
-            board_before, move, prev_moves = queue.popleft()
+            nodes += 1
+            if budget is not None:
+                budget.check(nodes, sequences, deadline)
 
             # No not allow promoting the piece if it does not finish the move on the home row.
             class_before = board_before.piece_class[move.start_index]
 
             # Keep the captured pieces because they cannot be removed till the end of turn.
-            opponent_quare = move.find_opponent_square(board_before)
-            board_after = move.apply(board_before)
-            board_after.owner[opponent_quare] = Player.ZOMBIE
-            board_after.piece_class[move.end_index] = class_before
+            opponent_square = move.find_captured_square(board_before)
+            board_after = move.apply(board_before, validate=False)
+            board_after.mark_captured(opponent_square)
+            board_after.set_piece_class(move.end_index, class_before)
 
-            next_attack_options = [
-                (move.end_index, target)
+            next_moves = [
+                CaptureMove(move.end_index, landing)
                 for target in board_after.get_capturable_pieces(move.end_index)
+                for landing in board_after.get_available_capture_landing_positions(move.end_index, target)
             ]
 
-            # Terminal position, nothing more to capture.
-            if not next_attack_options:
-                capture_sequences.append(prev_moves + [move])
+            if next_moves:
+                # Search deeper for the consecutive captures.
+                path.append(move)
+                stack.append((board_after, iter(next_moves)))
+            else:
+                # Terminal position, nothing more to capture.
+                sequences += 1
+                if budget is not None:
+                    budget.check(nodes, sequences, deadline)
+                yield path + [move]
 
-            # Search deeper for the consecutive captures.
-            for attacker, target in next_attack_options:
-                queue.extend([
-                    (board_after, CaptureMove(attacker, landing), prev_moves + [move])
-                    for landing in board_after.get_available_capture_landing_positions(attacker, target)
-                ])
+    def has_capture_moves(self, player):
+        """
+        Quickly check whether the specified player has at least one capture available,
+        without building any capture sequences.
+        """
+
+        owner = self.owner
+        for index in get_mask_indexes(self._player_squares[player]):
+            is_king = self.piece_class[index] == PieceClass.KING
+            for ray in diagonal_rays[index]:
+                for i in range(0, len(ray) - 1):
+                    square_owner = owner[ray[i]]
+                    # Kings can see the piece to capture from a distance, men only next to them.
+                    if not square_owner:
+                        if is_king:
+                            continue
+                        break
+                    # The first piece on the line must be an opponent's piece followed by an empty square.
+                    if square_owner != player and square_owner != Player.ZOMBIE and not owner[ray[i + 1]]:
+                        return True
+                    break
+
+        return False
 
-        return capture_sequences
+    def get_capture_moves(self, player):
+        """
+        Get only the maximum capture moves available to the specified player (e.g. for quiescence search).
+        Returns an empty list right away if the player cannot capture anything.
+        """
+
+        if not self.has_capture_moves(player):
+            return []
+
+        # Captures are mandatory, so if there are any, they are the only available moves.
+        return self.get_available_moves(player)
 
-    def get_available_moves(self, player):
+    def get_available_moves(self, player, budget=None):
         """
         For the specified player, get the list of all allowed moves that are applicable
         to this board according to the game rules.
+
+        Uses the compiled move generator if it is available, or the pure Python one otherwise.
+        If a CaptureSearchBudget is specified, the pure Python generator is always used,
+        because the compiled one cannot be interrupted.
         """
 
-        result = []
-        capture_sequences = self.get_capture_sequence_candidates(player)
+        if native_movegen is not None and budget is None:
+            return self.get_available_moves_native(player)
+        return self.get_available_moves_python(player, budget)
 
-        if not capture_sequences:
-            # There are no pieces we must capture. Free movement is allowed.
+    def get_available_moves_native(self, player):
+        """
+        Same as `get_available_moves`, but always uses the compiled move generator.
+        """
+
+        stats = get_active_stats()
+        if stats is not None:
+            start_time = stats.start()
+        # A failed call is recorded as free movement, since it is not known whether a capture was found.
+        is_capture = False
+        try:
+            is_capture, paths = native_movegen.generate_moves(self.owner, self.piece_class, player)
+        finally:
+            if stats is not None:
+                stats.stop(CAPTURE_SEARCH if is_capture else FREE_MOVES, start_time)
+
+        if not is_capture:
+            return [ForwardMove(start, end) for start, end in paths]
+
+        if len(paths[0]) == 2:
+            return [CaptureMove(start, end) for start, end in paths]
+        return [
+            ComboCaptureMove([CaptureMove(path[i], path[i + 1]) for i in range(len(path) - 1)])
+            for path in paths
+        ]
+
+    def get_available_moves_python(self, player, budget=None):
+        """
+        Same as `get_available_moves`, but always uses the pure Python move generator.
+        """
+
+        stats = get_active_stats()
+        if stats is not None:
+            start_time = stats.start()
+
+        # There's a piece we must capture. Rules demand we capture as many as possible,
+        # so only the longest sequences seen so far are kept.
+        max_sequences = []
+        try:
+            for seq in self.iter_capture_sequences(player, budget):
+                if not max_sequences or len(seq) > len(max_sequences[0]):
+                    max_sequences = [seq]
+                elif len(seq) == len(max_sequences[0]):
+                    max_sequences.append(seq)
+        finally:
+            if stats is not None:
+                stats.stop(CAPTURE_SEARCH, start_time)
+
+        if max_sequences:
+            return [ComboCaptureMove(seq) if len(seq) > 1 else seq[0] for seq in max_sequences]
+
+        if stats is not None:
+            start_time = stats.start()
+
+        # There are no pieces we must capture. Free movement is allowed.
+        result = []
+        try:
             for source in self.get_player_squares(player):
                 result.extend([
                     ForwardMove(source, destination)
                     for destination in self.get_free_movement_destinations(source)
                 ])
-        else:
-            # There's a piece we must capture. Rules demand we capture as many as possible.
-            max_seq_length = max(len(seq) for seq in capture_sequences)
-            result.extend([
-                ComboCaptureMove(seq) if len(seq) > 1 else seq[0]
-                for seq in capture_sequences
-                if len(seq) == max_seq_length
-            ])
-
+        finally:
+            if stats is not None:
+                stats.stop(FREE_MOVES, start_time)
         return result
 
-    def check_game_over(self, player_turn):
+    @timed(CHECK_GAME_OVER)
+    def check_game_over(self, player_turn, budget=None, available_moves=None):
         """
         Check if the game board is in a terminal state from the specified player's point of view.
         (e.g. a certain player has won or lost, or there is a draw).
+        The budget, if specified, applies to the move generation of the player to move.
+        If the caller has already generated the moves of the player to move, they can be passed
+        as `available_moves` to avoid generating them again.
         """
 
-        white_moves = self.get_available_moves(Player.WHITE)
-        black_moves = self.get_available_moves(Player.BLACK)
+        if available_moves is None:
+            available_moves = self.get_available_moves(player_turn, budget)
 
         # If a player is unable to move, they lose.
-        if player_turn == Player.WHITE and not white_moves:
-            return GameOverReason.BLACK_WON
-        if player_turn == Player.BLACK and not black_moves:
-            return GameOverReason.WHITE_WON
+        if not available_moves:
+            return GameOverReason.BLACK_WON if player_turn == Player.WHITE else GameOverReason.WHITE_WON
 
         # If both players have only one king left, the game is a draw.
-        white_squares = self.get_player_squares(Player.WHITE)
-        black_squares = self.get_player_squares(Player.BLACK)
         only_one_king_each = (
-            len(white_squares) == 1 and
-            len(black_squares) == 1 and
-            self.piece_class[white_squares[0]] == PieceClass.KING and
-            self.piece_class[black_squares[0]] == PieceClass.KING and
-            not self.get_capturable_pieces(white_squares[0]) and
-            not self.get_capturable_pieces(black_squares[0])
+            self.get_piece_count(Player.WHITE) == 1 and
+            self.get_piece_count(Player.BLACK) == 1 and
+            self.get_king_count(Player.WHITE) == 1 and
+            self.get_king_count(Player.BLACK) == 1 and
+            not self.get_capturable_pieces(self.get_player_squares(Player.WHITE)[0]) and
+            not self.get_capturable_pieces(self.get_player_squares(Player.BLACK)[0])
         )
         if only_one_king_each:
             return GameOverReason.DRAW
@@ -451,10 +847,105 @@ class Board(object):
         Create an independent copy of this board.
         """
 
-        return deepcopy(self)
+        if self.attack_maps is not None:
+            # Imported here because the copy module is only needed to clone the attack maps
+            # along with the board.
+            from copy import deepcopy
+            return deepcopy(self)
+
+        # A flat copy: the planes and piece lists are the only mutable state of a board.
+        board = object.__new__(type(self))
+        board.__dict__.update(self.__dict__)
+        board.owner = copy_plane(self.storage, self.owner)
+        board.piece_class = copy_plane(self.storage, self.piece_class)
+        board._player_squares = self._player_squares[:]
+        board._king_counts = self._king_counts[:]
+        return board
+
+    def expand(self, player):
+        """
+        Get every position the specified player can move to from this one.
+
+        The moves are generated once, and every child is a flat copy of this board
+        with the move applied in place, without validating the move again.
+
+        Returns
+        -------
+        list
+            A list of 2-tuples: (move, board produced by the move), in the order of `get_available_moves`.
+        """
+
+        children = []
+        for move in self.get_available_moves(player):
+            child = self.clone()
+            move.apply_in_place(child)
+            children.append((move, child))
+        return children
+
+    def freeze(self):
+        """
+        Create an immutable snapshot of this board that can be shared between threads.
+
+        Returns
+        -------
+        FrozenBoard
+        """
+
+        return FrozenBoard(self)
 
     def __repr__(self):
         return 'White: {0} | Black: {1}'.format(
             ', '.join(str(idx) for idx in self.get_player_squares(Player.WHITE)),
             ', '.join(str(idx) for idx in self.get_player_squares(Player.BLACK)),
         )
+
+
+class FrozenBoard(Board):
+    """
+    An immutable board that is safe to share between threads without locking.
+
+    All read-only operations (move generation, game over checks, applying moves with `apply`)
+    work as usual. Methods that would modify the board raise a TypeError instead, and `clone`
+    returns a regular mutable Board.
+    """
+
+    def __init__(self, board):
+        super(FrozenBoard, self).__init__(board.storage)
+        self.owner = tuple(board.owner)
+        self.piece_class = tuple(board.piece_class)
+        self._player_squares = tuple(board._player_squares)
+        self._king_counts = tuple(board._king_counts)
+        self.position_hash = board.position_hash
+
+    def _raise_frozen(self, *args, **kwargs):
+        raise TypeError('A frozen board cannot be modified. Use clone() to get a mutable copy.')
+
+    enable_attack_maps = _raise_frozen
+    move_piece = _raise_frozen
+    add_piece = _raise_frozen
+    remove_piece = _raise_frozen
+    mark_captured = _raise_frozen
+    set_piece_class = _raise_frozen
+
+    def clone(self):
+        board = Board(self.storage)
+        board.owner = create_plane(self.storage, self.owner)
+        board.piece_class = create_plane(self.storage, self.piece_class)
+        board._player_squares = list(self._player_squares)
+        board._king_counts = list(self._king_counts)
+        board.position_hash = self.position_hash
+        return board
+
+    def freeze(self):
+        return self
+
+    def __hash__(self):
+        return self.position_hash
+
+    def __eq__(self, other):
+        return (isinstance(other, FrozenBoard) and
+                self.owner == other.owner and
+                self.piece_class == other.piece_class)
+
+    def __ne__(self, other):
+        return not self == other
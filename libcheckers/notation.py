@@ -0,0 +1,227 @@
+import re
+
+from libcheckers import BoardConfig, InvalidMoveException
+from libcheckers.enum import Player
+from libcheckers.generator import create_starting_board
+from libcheckers.movement import ForwardMove, get_move_path
+from libcheckers.utils import get_opponent
+
+
+DEFAULT_CHUNK_SIZE = 64
+
+_move_pattern = re.compile(r'^\d+(?:[-x]\d+)+$')
+_move_number_pattern = re.compile(r'^(?:\d+\.+|\.\.\.)$')
+_game_results = frozenset(['2-0', '1-1', '0-2', '1-0', '0-1', '*'])
+
+
+def format_move(move, short=False):
+    """
+    Format a move in the standard notation: "32-28" for free moves and "28x19x10" for captures.
+
+    Parameters
+    ----------
+    move : BaseMove
+        The move to format.
+    short : bool
+        If True, write captures with the starting and final squares only ("28x10").
+        Use `parse_move` with a board to resolve such notation back into a move.
+
+    Returns
+    -------
+    str
+    """
+
+    if isinstance(move, ForwardMove):
+        return '{0}-{1}'.format(move.start_index, move.end_index)
+
+    path = get_move_path(move)
+    if short:
+        path = [path[0], path[-1]]
+    return 'x'.join(str(index) for index in path)
+
+
+def parse_move_path(text):
+    """
+    Parse a move written in the standard notation without checking it against a board.
+
+    Returns
+    -------
+    tuple
+        A 2-tuple: (whether the move is a capture, list of squares).
+    """
+
+    text = text.strip()
+    if not _move_pattern.match(text) or ('-' in text and 'x' in text):
+        raise ValueError('Invalid move notation: {0!r}'.format(text))
+
+    is_capture = 'x' in text
+    path = [int(index) for index in text.split('x' if is_capture else '-')]
+    if not all(1 <= index <= BoardConfig.total_squares for index in path):
+        raise ValueError('Square out of range in move notation: {0!r}'.format(text))
+    if not is_capture and len(path) != 2:
+        raise ValueError('A free move must have exactly two squares: {0!r}'.format(text))
+
+    return is_capture, path
+
+
+def _is_subsequence(squares, path):
+    path_iterator = iter(path)
+    return all(square in path_iterator for square in squares)
+
+
+def parse_move(text, board, player):
+    """
+    Parse a move written in the standard notation and resolve it against the legal moves of a position.
+
+    Captures may be written with the full path ("28x19x10"), with the starting and final squares only
+    ("28x10"), or with any subset of the intermediate landing squares. Such notation is resolved through
+    the capture generator, and must match exactly one legal capture.
+
+    Parameters
+    ----------
+    text : str
+        The move notation.
+    board : Board
+        The position to play the move in.
+    player : int
+        The player to move.
+
+    Returns
+    -------
+    BaseMove
+        The matching legal move.
+    """
+
+    is_capture, path = parse_move_path(text)
+
+    if not is_capture:
+        # Fast path: a free move is legal if no capture is available and the piece can reach the square.
+        start_index, end_index = path
+        is_legal = (
+            board.owner[start_index] == player and
+            end_index in board.get_free_movement_destinations(start_index) and
+            not board.has_capture_moves(player)
+        )
+        if not is_legal:
+            raise InvalidMoveException('Illegal move: {0}', message_args=(text,))
+        return ForwardMove(start_index, end_index)
+
+    candidates = [
+        move
+        for move in board.get_capture_moves(player)
+        if _matches_capture_path(get_move_path(move), path)
+    ]
+    if not candidates:
+        raise InvalidMoveException('Illegal move: {0}', message_args=(text,))
+    if len(candidates) > 1:
+        # The notation omits the landing squares that would tell the captures apart.
+        msg = 'Ambiguous move: {0} matches {1}'
+        candidates_text = ', '.join(format_move(move) for move in candidates)
+        raise InvalidMoveException(msg, message_args=(text, candidates_text))
+    return candidates[0]
+
+
+def _matches_capture_path(move_path, path):
+    return (
+        move_path[0] == path[0] and
+        move_path[-1] == path[-1] and
+        _is_subsequence(path[1:-1], move_path[1:-1])
+    )
+
+
+def tokenize_game(text):
+    """
+    Split a game record into move notations, skipping move numbers and the game result.
+    """
+
+    return [
+        token
+        for token in text.split()
+        if not _move_number_pattern.match(token) and token not in _game_results
+    ]
+
+
+def parse_game(text, board=None, first_player=Player.WHITE):
+    """
+    Parse a whole game record, e.g. "1. 32-28 19-23 2. 28x19 14x23".
+
+    Parameters
+    ----------
+    text : str
+        The game record. Move numbers and the game result are optional.
+    board : Board, optional
+        The starting position. The standard starting position by default. Not modified.
+    first_player : int
+        The player who makes the first move.
+
+    Returns
+    -------
+    list
+        The parsed moves.
+    """
+
+    board = create_starting_board() if board is None else board.clone()
+    player = first_player
+    moves = []
+
+    for token in tokenize_game(text):
+        move = parse_move(token, board, player)
+        move.apply_in_place(board)
+        moves.append(move)
+        player = get_opponent(player)
+
+    return moves
+
+
+def format_game(moves, first_player=Player.WHITE):
+    """
+    Format a list of moves as a game record with move numbers.
+    """
+
+    tokens = []
+    offset = 0 if first_player == Player.WHITE else 1
+    if offset:
+        tokens.append('1. ...')
+    for ply, move in enumerate(moves, start=offset):
+        if ply % 2 == 0:
+            tokens.append('{0}.'.format(ply // 2 + 1))
+        tokens.append(format_move(move))
+    return ' '.join(tokens)
+
+
+def _parse_games_chunk(texts, first_player):
+    return [parse_game(text, first_player=first_player) for text in texts]
+
+
+def parse_games(texts, first_player=Player.WHITE, workers=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Parse many game records from the standard starting position.
+
+    Parameters
+    ----------
+    texts : iterable
+        The game records.
+    first_player : int
+        The player who makes the first move in every game.
+    workers : int, optional
+        If specified, parse the games in a pool with this many processes.
+    chunk_size : int
+        The number of games sent to a worker at once.
+
+    Returns
+    -------
+    list
+        A list of parsed move lists, in the same order as the records.
+    """
+
+    texts = list(texts)
+    if not workers:
+        return _parse_games_chunk(texts, first_player)
+
+    # Imported here to keep multiprocessing out of the import path of single-process users.
+    from concurrent.futures import ProcessPoolExecutor
+
+    chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_parse_games_chunk, chunk, first_player) for chunk in chunks]
+        return [moves for future in futures for moves in future.result()]
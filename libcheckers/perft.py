@@ -0,0 +1,38 @@
+from libcheckers.movement import Board
+from libcheckers.utils import get_opponent
+
+
+def perft(board, player, depth, move_generator=Board.get_available_moves):
+    """
+    Count the leaf nodes of the move tree of the specified depth (performance test).
+    Used to validate move generators against each other and against published counts.
+
+    Parameters
+    ----------
+    board : Board
+        The board to start from.
+    player : int
+        The player to move first.
+    depth : int
+        The number of plies to explore.
+    move_generator : callable, optional
+        The function that accepts (board, player) and returns the list of available moves.
+
+    Returns
+    -------
+    int
+        The number of distinct move sequences of the specified length.
+    """
+
+    if depth == 0:
+        return 1
+
+    moves = move_generator(board, player)
+    if depth == 1:
+        return len(moves)
+
+    opponent = get_opponent(player)
+    return sum(
+        perft(move.apply(board, validate=False), opponent, depth - 1, move_generator)
+        for move in moves
+    )
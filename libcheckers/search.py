@@ -0,0 +1,351 @@
+import random
+import threading
+import time
+
+from libcheckers.enum import Player
+from libcheckers.utils import get_opponent, zobrist_black_to_move_key
+
+
+MAN_VALUE = 100
+KING_VALUE = 300
+
+# Scores beyond this threshold mean a forced win or loss. The exact score encodes the distance in plies.
+WIN_SCORE = 1000000
+WIN_THRESHOLD = WIN_SCORE - 1000
+
+DEFAULT_MAX_DEPTH = 64
+DEFAULT_TABLE_SIZE = 1 << 20
+
+# How often (in nodes) the workers check the clock.
+_TIME_CHECK_INTERVAL = 1024
+
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+
+def evaluate_material(board, player):
+    """
+    Evaluate the position by the material balance from the point of view of the specified player.
+    """
+
+    opponent = get_opponent(player)
+    own_kings = board.get_king_count(player)
+    opponent_kings = board.get_king_count(opponent)
+    return (
+        (board.get_piece_count(player) - own_kings) * MAN_VALUE + own_kings * KING_VALUE -
+        (board.get_piece_count(opponent) - opponent_kings) * MAN_VALUE - opponent_kings * KING_VALUE
+    )
+
+
+def get_search_key(board, player):
+    """
+    Get the transposition table key of a position: the hash of the board combined with the player to move.
+    """
+
+    return board.position_hash ^ zobrist_black_to_move_key if player == Player.BLACK else board.position_hash
+
+
+class TranspositionTable(object):
+    """
+    A transposition table shared by all search threads.
+
+    Entries are immutable tuples stored in a dict: a single dict lookup or assignment is atomic
+    (under the GIL, and thanks to per-object locking on free-threaded builds), so readers always see
+    either a complete old entry or a complete new one, and no explicit locking is needed.
+    A lost update only costs a repeated search of that position.
+    """
+
+    def __init__(self, max_entries=DEFAULT_TABLE_SIZE):
+        self.max_entries = max_entries
+        self._entries = {}
+
+    def get(self, key):
+        """
+        Get the entry for the specified position key.
+
+        Returns
+        -------
+        tuple or None
+            A 4-tuple: (depth, score, bound, best move), or None if the position is not in the table.
+        """
+
+        return self._entries.get(key)
+
+    def store(self, key, depth, score, bound, best_move):
+        """
+        Store a search result, unless the table already has a deeper result for the same position.
+        """
+
+        existing_entry = self._entries.get(key)
+        if existing_entry is not None and existing_entry[0] > depth:
+            return
+
+        # Crude but thread-safe size control: start over when the table is full.
+        if existing_entry is None and len(self._entries) >= self.max_entries:
+            self._entries.clear()
+
+        self._entries[key] = (depth, score, bound, best_move)
+
+    def clear(self):
+        self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class SearchResult(object):
+    """
+    The result of a search: the best move found and the search statistics.
+    """
+
+    def __init__(self, move, score, depth, nodes, elapsed):
+        self.move = move
+        self.score = score
+        self.depth = depth
+        self.nodes = nodes
+        self.elapsed = elapsed
+
+    @property
+    def nodes_per_second(self):
+        return self.nodes / self.elapsed if self.elapsed > 0 else 0.0
+
+    def __repr__(self):
+        return 'Search: {0} (score {1}, depth {2}, {3} nodes in {4:.3f}s)'.format(
+            self.move,
+            self.score,
+            self.depth,
+            self.nodes,
+            self.elapsed,
+        )
+
+
+class _SearchAborted(Exception):
+    pass
+
+
+class _SearchWorker(object):
+    """
+    A single search thread. Each worker has its own board copies and counters,
+    and shares only the transposition table and the stop signal with the others.
+    """
+
+    def __init__(self, worker_index, table, evaluate, stop_event, deadline, seed):
+        self.worker_index = worker_index
+        self.table = table
+        self.evaluate = evaluate
+        self.stop_event = stop_event
+        self.deadline = deadline
+        self.rng = random.Random(seed)
+        self.nodes = 0
+        self.completed_depth = 0
+        self.best_move = None
+        self.best_score = None
+        self._root_move = None
+
+    def _check_stop(self):
+        self.nodes += 1
+        if self.nodes % _TIME_CHECK_INTERVAL == 0 and self.deadline is not None:
+            if time.time() >= self.deadline:
+                self.stop_event.set()
+        if self.stop_event.is_set():
+            raise _SearchAborted()
+
+    def _order_moves(self, moves, tt_move):
+        # The helper threads diversify the move order so that they explore different parts of the tree
+        # first and fill the shared table with useful results for the main thread (lazy SMP).
+        if self.worker_index > 0:
+            moves = list(moves)
+            self.rng.shuffle(moves)
+        if tt_move is not None and tt_move in moves:
+            moves = [tt_move] + [move for move in moves if move != tt_move]
+        return moves
+
+    def negamax(self, board, player, depth, alpha, beta, ply):
+        self._check_stop()
+
+        key = get_search_key(board, player)
+        original_alpha = alpha
+        tt_move = None
+
+        entry = self.table.get(key)
+        if entry is not None:
+            entry_depth, entry_score, entry_bound, tt_move = entry
+            if entry_depth >= depth and ply > 0:
+                entry_score = _score_from_table(entry_score, ply)
+                if entry_bound == EXACT:
+                    return entry_score
+                if entry_bound == LOWER_BOUND:
+                    alpha = max(alpha, entry_score)
+                elif entry_bound == UPPER_BOUND:
+                    beta = min(beta, entry_score)
+                if alpha >= beta:
+                    return entry_score
+
+        if depth <= 0:
+            # Quiescence: keep resolving forced captures, and evaluate only quiet positions.
+            moves = board.get_capture_moves(player)
+            if not moves:
+                if board.get_available_moves(player):
+                    return self.evaluate(board, player)
+                return -WIN_SCORE + ply
+        else:
+            moves = board.get_available_moves(player)
+            if not moves:
+                return -WIN_SCORE + ply
+
+        opponent = get_opponent(player)
+        best_score = -WIN_SCORE - 1
+        best_move = None
+
+        for move in self._order_moves(moves, tt_move):
+            child = board.clone()
+            move.apply_in_place(child)
+            score = -self.negamax(child, opponent, depth - 1, -beta, -alpha, ply + 1)
+            if score > best_score:
+                best_score = score
+                best_move = move
+            alpha = max(alpha, score)
+            if alpha >= beta:
+                break
+
+        if best_score <= original_alpha:
+            bound = UPPER_BOUND
+        elif best_score >= beta:
+            bound = LOWER_BOUND
+        else:
+            bound = EXACT
+        self.table.store(key, max(depth, 0), _score_to_table(best_score, ply), bound, best_move)
+
+        if ply == 0:
+            self._root_move = best_move
+        return best_score
+
+    def run(self, board, player, max_depth):
+        # Odd helper threads search one ply deeper, so that the threads work on different depths at once.
+        depth_offset = self.worker_index % 2
+        try:
+            for depth in range(1 + depth_offset, max_depth + 1 + depth_offset):
+                score = self.negamax(board, player, depth, -WIN_SCORE - 1, WIN_SCORE + 1, 0)
+                self.best_move = self._root_move
+                self.best_score = score
+                self.completed_depth = depth
+        except _SearchAborted:
+            pass
+
+
+def _score_to_table(score, ply):
+    # Win/loss scores are stored relative to the position, not to the root of the search.
+    if score > WIN_THRESHOLD:
+        return score + ply
+    if score < -WIN_THRESHOLD:
+        return score - ply
+    return score
+
+
+def _score_from_table(score, ply):
+    if score > WIN_THRESHOLD:
+        return score - ply
+    if score < -WIN_THRESHOLD:
+        return score + ply
+    return score
+
+
+class AlphaBetaSearch(object):
+    """
+    Iterative deepening alpha-beta (negamax) search with a transposition table and quiescence search.
+
+    With more than one thread, the search runs in the lazy SMP style: all threads search the same root
+    position independently, sharing only the transposition table. The helper threads diversify their move
+    order and depth, and the main thread benefits from the results they store in the table.
+    On free-threaded Python builds the threads run in parallel; on standard builds they only add
+    overhead, so a single thread (which does not start any threads at all) is the default.
+
+    The search only knows about the board: draws by repetition and other game-level rules are not detected.
+    """
+
+    def __init__(self, evaluate=evaluate_material, threads=1, table=None, seed=None):
+        """
+        Parameters
+        ----------
+        evaluate : callable
+            A function that accepts (board, player) and returns the score of a quiet position
+            from the point of view of the specified player.
+        threads : int
+            The number of search threads.
+        table : TranspositionTable, optional
+            The transposition table. A new one is created by default. Kept between searches.
+        seed : int, optional
+            The seed for the move order diversification of the helper threads.
+        """
+
+        self.evaluate = evaluate
+        self.threads = threads
+        self.table = table if table is not None else TranspositionTable()
+        self.seed = seed
+
+    def search(self, board, player, max_depth=None, time_limit=None):
+        """
+        Search for the best move for the specified player.
+
+        Parameters
+        ----------
+        board : Board
+            The position to search. Not modified; frozen before being shared with the threads.
+        player : int
+            The player to move.
+        max_depth : int, optional
+            The maximum search depth in plies.
+        time_limit : float, optional
+            The maximum number of seconds to search for.
+            The result of the deepest completed iteration is used.
+
+        Returns
+        -------
+        SearchResult
+        """
+
+        if max_depth is None and time_limit is None:
+            raise ValueError('Either the maximum depth or the time limit must be specified')
+
+        start_time = time.time()
+        root_board = board.freeze()
+        stop_event = threading.Event()
+        deadline = start_time + time_limit if time_limit is not None else None
+        max_depth = max_depth or DEFAULT_MAX_DEPTH
+        rng = random.Random(self.seed)
+
+        workers = [
+            _SearchWorker(
+                worker_index, self.table, self.evaluate, stop_event, deadline, rng.randrange(2 ** 32),
+            )
+            for worker_index in range(self.threads)
+        ]
+        helper_threads = [
+            threading.Thread(target=worker.run, args=(root_board, player, max_depth))
+            for worker in workers[1:]
+        ]
+        for thread in helper_threads:
+            thread.daemon = True
+            thread.start()
+
+        # The main thread decides when the search is over.
+        main_worker = workers[0]
+        main_worker.run(root_board, player, max_depth)
+        stop_event.set()
+        for thread in helper_threads:
+            thread.join()
+
+        # If the first iteration was interrupted, fall back to any legal move.
+        move = main_worker.best_move
+        if move is None:
+            moves = root_board.get_available_moves(player)
+            move = moves[0] if moves else None
+
+        return SearchResult(
+            move,
+            main_worker.best_score,
+            main_worker.completed_depth,
+            sum(worker.nodes for worker in workers),
+            time.time() - start_time,
+        )
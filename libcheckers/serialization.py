@@ -1,6 +1,8 @@
 from libcheckers import BoardConfig
 from libcheckers.enum import Player, PieceClass, GameOverReason
 from libcheckers.movement import Board, ForwardMove, CaptureMove, ComboCaptureMove
+from libcheckers.stats import SERIALIZATION, timed
+from libcheckers.storage import LIST_STORAGE
 
 
 _player_serializer = {
@@ -19,20 +21,31 @@ _game_over_serializer = {
     GameOverReason.DRAW: 'draw',
 }
 
+# Compact binary format: one byte per square, 0 for empty squares.
+_binary_square_codes = {
+    (Player.WHITE, PieceClass.MAN): 1,
+    (Player.WHITE, PieceClass.KING): 2,
+    (Player.BLACK, PieceClass.MAN): 3,
+    (Player.BLACK, PieceClass.KING): 4,
+}
+_binary_square_decoder = dict(zip(_binary_square_codes.values(), _binary_square_codes.keys()))
+
 _player_deserializer = dict(zip(_player_serializer.values(), _player_serializer.keys()))
 _piece_class_deserializer = dict(zip(_piece_class_serializer.values(), _piece_class_serializer.keys()))
 _game_over_deserializer = dict(zip(_game_over_serializer.values(), _game_over_serializer.keys()))
 
 
-def load_board(board_dict):
-    board = Board()
+@timed(SERIALIZATION)
+def load_board(board_dict, storage=LIST_STORAGE):
+    board = Board(storage)
     for index, square_data in board_dict.items():
-        board.owner[int(index)] = load_player(square_data['player'])
-        board.piece_class[int(index)] = load_piece_class(square_data['class'])
+        player = load_player(square_data['player'])
+        board.add_piece(int(index), player, load_piece_class(square_data['class']))
 
     return board
 
 
+@timed(SERIALIZATION)
 def save_board(board):
     board_dict = {}
     for index in range(1, BoardConfig.total_squares + 1):
@@ -45,6 +58,67 @@ def save_board(board):
     return board_dict
 
 
+@timed(SERIALIZATION)
+def load_board_binary(data, storage=LIST_STORAGE):
+    """
+    Load a board from the compact binary format produced by `save_board_binary`.
+    """
+
+    if len(data) != BoardConfig.total_squares:
+        msg = 'Binary board must be exactly {0} bytes long'.format(BoardConfig.total_squares)
+        raise ValueError(msg)
+
+    board = Board(storage)
+    for index, code in enumerate(bytearray(data), start=1):
+        if code:
+            player, piece_class = _binary_square_decoder[code]
+            board.add_piece(index, player, piece_class)
+
+    return board
+
+
+@timed(SERIALIZATION)
+def save_board_binary(board):
+    """
+    Save a board in a compact binary format: one byte per square, 0 for empty squares.
+    """
+
+    return bytes(bytearray(
+        _binary_square_codes[board.owner[index], board.piece_class[index]] if board.owner[index] else 0
+        for index in range(1, BoardConfig.total_squares + 1)
+    ))
+
+
+def load_position_binary(data, storage=LIST_STORAGE):
+    """
+    Load a position from the compact binary format produced by `save_position_binary`.
+
+    Returns
+    -------
+    tuple
+        A 2-tuple: (board, player to move).
+    """
+
+    if len(data) != BoardConfig.total_squares + 1:
+        msg = 'Binary position must be exactly {0} bytes long'.format(BoardConfig.total_squares + 1)
+        raise ValueError(msg)
+
+    player = bytearray(data)[BoardConfig.total_squares]
+    if player not in (Player.WHITE, Player.BLACK):
+        raise ValueError('Invalid player to move: {0}'.format(player))
+    return load_board_binary(data[:BoardConfig.total_squares], storage), player
+
+
+def save_position_binary(board, player):
+    """
+    Save a position in a compact binary format: the board as in `save_board_binary`,
+    followed by one byte for the player to move (1 or 2).
+    """
+
+    return save_board_binary(board) + bytes(bytearray([player]))
+
+
+@timed(SERIALIZATION)
 def save_move(move):
     move_data = {}
     if isinstance(move, ForwardMove):
@@ -67,6 +141,7 @@ def save_move(move):
     return move_data
 
 
+@timed(SERIALIZATION)
 def load_move(move_dict):
     if move_dict['type'] == 'ForwardMove':
         return ForwardMove(move_dict['startIndex'], move_dict['endIndex'])
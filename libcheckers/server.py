@@ -0,0 +1,353 @@
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from libcheckers.arbiter import DEFAULT_MAX_PLIES, MatchArbiter, is_legal_move
+from libcheckers.enum import Player, ForfeitReason
+from libcheckers.game import get_move_summary
+from libcheckers.generator import create_starting_board
+from libcheckers.serialization import (
+    load_board,
+    save_board,
+    load_move,
+    save_move,
+    load_player,
+    save_player,
+)
+from libcheckers.utils import get_opponent
+
+
+def evaluate_position(board_data, player_data):
+    """
+    Check whether a serialized position is terminal for the player to move.
+    Intended to run in a worker process.
+
+    Returns
+    -------
+    int or None
+        A GameOverReason value, or None if the game can continue.
+    """
+
+    board = load_board(board_data)
+    return board.check_game_over(load_player(player_data))
+
+
+def process_turn(board_data, player_data, move_data):
+    """
+    Validate a move submitted by a client, apply it and check whether the game is over.
+    Intended to run in a worker process so that move generation does not block the event loop.
+
+    Parameters
+    ----------
+    board_data : dict
+        The serialized board before the move.
+    player_data : str
+        The serialized player who makes the move.
+    move_data : dict
+        The serialized move submitted by the client.
+
+    Returns
+    -------
+    tuple
+        A 4-tuple: (whether the move is legal, serialized board after the move,
+        GameOverReason from the opponent's point of view or None,
+        `game.get_move_summary` of the move or None).
+    """
+
+    board = load_board(board_data)
+    player = load_player(player_data)
+    move = load_move(move_data)
+
+    if not is_legal_move(board, player, move):
+        return False, board_data, None, None
+
+    new_board = move.apply(board, validate=False)
+    opponent = get_opponent(player)
+    move_summary = get_move_summary(board, new_board, move, opponent)
+    return True, save_board(new_board), new_board.check_game_over(opponent), move_summary
+
+
+class BaseClient(object):
+    """
+    Represents a participant of a match. Receives positions and responds with moves.
+    """
+
+    async def wait_until_ready(self):
+        """
+        Wait until the client can start choosing a move right away, e.g. for a free worker
+        when it is shared between matches. The move time limit only starts after this returns.
+        """
+
+        return None
+
+    async def request_move(self, board_data, player_data):
+        """
+        Choose a move for the specified player.
+
+        Parameters
+        ----------
+        board_data : dict
+            The serialized current board.
+        player_data : str
+            The serialized player to move.
+
+        Returns
+        -------
+        dict
+            The serialized move.
+        """
+
+        raise NotImplementedError()
+
+
+class LocalClient(BaseClient):
+    """
+    An in-process client that delegates move selection to a plain Python function.
+
+    The strategy runs on worker threads of the client's own, so that the event loop can still
+    enforce the move time limit. A move is only requested when a worker is free (see `wait_until_ready`),
+    so the time a move waits for a worker is not charged to the bot. A worker whose move timed out
+    stays busy until the strategy returns.
+    """
+
+    def __init__(self, strategy, max_workers=None):
+        """
+        Parameters
+        ----------
+        strategy : callable
+            A function that accepts (board, player) and returns a move object.
+        max_workers : int, optional
+            The number of moves the client can choose at the same time. Defaults to the number of CPUs:
+            more threads would only slow each other down.
+        """
+
+        self.strategy = strategy
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+        self._executor = None
+        self._free_workers = None
+        self._loop = None
+
+    def _get_free_workers(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._free_workers = asyncio.Semaphore(self.max_workers)
+        return self._free_workers
+
+    def _choose_move(self, board_data, player_data):
+        move = self.strategy(load_board(board_data), load_player(player_data))
+        return save_move(move)
+
+    async def wait_until_ready(self):
+        await self._get_free_workers().acquire()
+
+    async def request_move(self, board_data, player_data):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        loop = asyncio.get_running_loop()
+        free_workers = self._get_free_workers()
+
+        def release_worker(_):
+            # Called when the strategy returns, even if the server has stopped waiting for the move.
+            try:
+                loop.call_soon_threadsafe(free_workers.release)
+            except RuntimeError:
+                # The event loop has been closed, along with the semaphore.
+                pass
+
+        future = self._executor.submit(self._choose_move, board_data, player_data)
+        future.add_done_callback(release_worker)
+        return await asyncio.wrap_future(future)
+
+    def close(self):
+        """
+        Shut down the worker threads of the client.
+        """
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+class MatchResult(object):
+    """
+    The outcome of a single match played on the server.
+    """
+
+    def __init__(self, game_over_reason, moves, board_data, forfeited_by=None, forfeit_reason=None,
+                 draw_rule=None):
+        self.game_over_reason = game_over_reason
+        self.moves = moves
+        self.board_data = board_data
+        self.forfeited_by = forfeited_by
+        self.forfeit_reason = forfeit_reason
+        self.draw_rule = draw_rule
+
+    def __repr__(self):
+        return 'MatchResult: reason={0}, plies={1}, forfeit={2}'.format(
+            self.game_over_reason,
+            len(self.moves),
+            self.forfeit_reason,
+        )
+
+
+class MatchServer(object):
+    """
+    Runs many concurrent checkers matches on a single asyncio event loop.
+
+    The event loop only shuttles serialized boards and moves between clients,
+    while move legality checks and game over detection are delegated to an executor
+    (a process pool by default).
+    """
+
+    def __init__(self, move_time_limit=None, max_plies=DEFAULT_MAX_PLIES,
+                 max_concurrent_matches=None, executor=None, max_workers=None):
+        """
+        Parameters
+        ----------
+        move_time_limit : float, optional
+            Maximum number of seconds a client may take to respond with a move.
+            A client that exceeds it forfeits the match.
+        max_plies : int
+            The match is declared a draw after this many plies.
+        max_concurrent_matches : int, optional
+            Maximum number of matches that can be in progress at the same time.
+        executor : concurrent.futures.Executor, optional
+            The executor for CPU-bound rule checks. If omitted, a process pool is created
+            on first use and shut down by `close`.
+        max_workers : int, optional
+            The number of worker processes for the default executor.
+        """
+
+        self.move_time_limit = move_time_limit
+        self.max_plies = max_plies
+        self.max_concurrent_matches = max_concurrent_matches
+        self.max_workers = max_workers
+
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._semaphore = None
+
+    def _get_executor(self):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def _get_semaphore(self):
+        if self._semaphore is None and self.max_concurrent_matches:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent_matches)
+        return self._semaphore
+
+    async def _run_in_executor(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), func, *args)
+
+    async def _request_move(self, client, board_data, player_data):
+        request = client.request_move(board_data, player_data)
+        if self.move_time_limit is None:
+            return await request
+        return await asyncio.wait_for(request, self.move_time_limit)
+
+    async def play_match(self, white_client, black_client, board=None, first_player=Player.WHITE):
+        """
+        Play a single match between two clients until the game is over.
+
+        Parameters
+        ----------
+        white_client : BaseClient
+            The client playing white.
+        black_client : BaseClient
+            The client playing black.
+        board : Board, optional
+            The initial board. Defaults to the standard starting position.
+        first_player : int
+            The player who makes the first move.
+
+        Returns
+        -------
+        MatchResult
+        """
+
+        semaphore = self._get_semaphore()
+        if semaphore is None:
+            return await self._play_match(white_client, black_client, board, first_player)
+        async with semaphore:
+            return await self._play_match(white_client, black_client, board, first_player)
+
+    async def _play_match(self, white_client, black_client, board, first_player):
+        board = board if board is not None else create_starting_board()
+        board_data = save_board(board)
+        clients = {Player.WHITE: white_client, Player.BLACK: black_client}
+        arbiter = MatchArbiter(first_player, self.max_plies, board)
+        moves = []
+
+        arbiter.start(await self._run_in_executor(evaluate_position, board_data, save_player(first_player)))
+
+        while not arbiter.is_over:
+            client = clients[arbiter.player]
+            player_data = save_player(arbiter.player)
+            try:
+                await client.wait_until_ready()
+                move_data = await self._request_move(client, board_data, player_data)
+                load_move(move_data)
+            except asyncio.TimeoutError:
+                arbiter.forfeit(ForfeitReason.TIMEOUT)
+                continue
+            except Exception:
+                # Whatever goes wrong with one client, including a malformed move, only ends its match.
+                arbiter.forfeit(ForfeitReason.CLIENT_ERROR)
+                continue
+
+            # Failures of the rule checks are the server's own, so they are not blamed on the client.
+            is_legal, board_data, game_over_reason, move_summary = await self._run_in_executor(
+                process_turn, board_data, player_data, move_data,
+            )
+
+            if arbiter.accept_move(is_legal, game_over_reason, move_summary):
+                moves.append(move_data)
+
+        return MatchResult(
+            arbiter.game_over_reason,
+            moves,
+            board_data,
+            arbiter.forfeited_by,
+            arbiter.forfeit_reason,
+            arbiter.draw_rule,
+        )
+
+    async def play_matches(self, pairings):
+        """
+        Play multiple matches concurrently.
+
+        Parameters
+        ----------
+        pairings : list
+            A list of (white_client, black_client) tuples.
+
+        Returns
+        -------
+        list
+            A list of MatchResult objects in the same order as the pairings.
+        """
+
+        return await asyncio.gather(*[
+            self.play_match(white_client, black_client)
+            for white_client, black_client in pairings
+        ])
+
+    def close(self):
+        """
+        Shut down the executor if it was created by the server.
+        """
+
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
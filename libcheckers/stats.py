@@ -0,0 +1,173 @@
+import _thread
+from functools import wraps
+from time import perf_counter
+
+
+# The operations timed by the library.
+CAPTURE_SEARCH = 'capture_search'       # Searching for captures in move generation
+FREE_MOVES = 'free_moves'               # Generating free moves when there are no captures
+APPLY = 'apply'                         # Applying moves with `apply`
+CHECK_GAME_OVER = 'check_game_over'     # Game over checks, including their own move generation
+SERIALIZATION = 'serialization'         # Loading and saving boards and moves
+
+CATEGORIES = (CAPTURE_SEARCH, FREE_MOVES, APPLY, CHECK_GAME_OVER, SERIALIZATION)
+
+
+# A thread-local from the low-level module, so that importing the instrumented modules
+# does not import threading.
+class _ActiveStats(_thread._local):
+    stats = None
+
+
+_active = _ActiveStats()
+
+
+def get_active_stats():
+    """
+    Get the Stats object collecting statistics in the current thread, or None.
+    """
+
+    return _active.stats
+
+
+class Stats(object):
+    """
+    Collects the number of calls and the time spent in the library operations (see CATEGORIES)
+    made by the current thread while the object is active:
+
+        with Stats() as stats:
+            board.get_available_moves(player)
+        print(stats.format())
+
+    The compiled move generator cannot be split into the two move generation categories, so each of its calls
+    is recorded as CAPTURE_SEARCH or FREE_MOVES as a whole, depending on the moves it finds.
+
+    Only the outermost library call is timed, so time is never counted twice: e.g. the move
+    generation inside `check_game_over` counts as CHECK_GAME_OVER only. When no Stats object is active,
+    the instrumented functions only pay for one thread-local lookup, so the instrumentation can stay on.
+
+    Stats objects from other threads or processes can be combined with `merge`.
+    """
+
+    def __init__(self):
+        self.calls = dict.fromkeys(CATEGORIES, 0)
+        self.time = dict.fromkeys(CATEGORIES, 0.0)
+        self._depth = 0
+        self._previous = []
+
+    def start(self):
+        """
+        Enter a timed library call. Returns the start time to pass to `stop`.
+        """
+
+        self._depth += 1
+        return perf_counter()
+
+    def stop(self, category, start_time):
+        """
+        Leave a timed library call, recording it if it was the outermost one.
+        """
+
+        self._depth -= 1
+        if not self._depth:
+            self.calls[category] += 1
+            self.time[category] += perf_counter() - start_time
+
+    def merge(self, other):
+        """
+        Add the statistics of another Stats object (or of its `to_dict` export) to this one.
+
+        Returns
+        -------
+        Stats
+            This object.
+        """
+
+        data = other.to_dict() if isinstance(other, Stats) else other
+        for category, item in data.items():
+            self.calls[category] = self.calls.get(category, 0) + item['calls']
+            self.time[category] = self.time.get(category, 0.0) + item['time']
+        return self
+
+    @property
+    def total_time(self):
+        return sum(self.time.values())
+
+    def to_dict(self):
+        """
+        Export the statistics as a JSON-serializable dict: {category: {'calls': int, 'time': seconds}}.
+        """
+
+        return dict(
+            (category, {'calls': self.calls[category], 'time': self.time[category]})
+            for category in self.calls
+        )
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls().merge(data)
+
+    def to_json(self):
+        # Imported here, so that the instrumented modules do not import json until statistics are exported.
+        import json
+        return json.dumps(self.to_dict(), sort_keys=True)
+
+    def format(self):
+        """
+        Format the statistics as a table for display.
+        """
+
+        lines = ['{0:<16} {1:>10} {2:>12} {3:>10}'.format('Operation', 'Calls', 'Total (ms)', 'Avg (us)')]
+        for category in sorted(self.calls):
+            calls = self.calls[category]
+            lines.append('{0:<16} {1:>10} {2:>12.3f} {3:>10.2f}'.format(
+                category,
+                calls,
+                self.time[category] * 1000,
+                self.time[category] / calls * 1000000 if calls else 0.0,
+            ))
+        return '\n'.join(lines)
+
+    def __enter__(self):
+        self._previous.append(_active.stats)
+        _active.stats = self
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _active.stats = self._previous.pop()
+
+
+def merge_stats(items):
+    """
+    Combine many Stats objects or their `to_dict` exports (e.g. collected in worker processes).
+
+    Returns
+    -------
+    Stats
+    """
+
+    result = Stats()
+    for item in items:
+        result.merge(item)
+    return result
+
+
+def timed(category):
+    """
+    Decorate a library function to record its calls under the specified category
+    while a Stats object is active.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            stats = _active.stats
+            if stats is None:
+                return func(*args, **kwargs)
+            start_time = stats.start()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                stats.stop(category, start_time)
+        return wrapper
+    return decorator
@@ -0,0 +1,162 @@
+import sys
+from array import array
+
+from libcheckers import BoardConfig
+from libcheckers.enum import Player
+
+
+# Python lists of small ints, with None for empty squares. The default.
+LIST_STORAGE = 'list'
+
+# array('b'): one signed byte per square, with 0 for empty squares.
+ARRAY_STORAGE = 'array'
+
+# NumPy int8 arrays, with 0 for empty squares. Requires NumPy, which is imported only when used.
+NUMPY_STORAGE = 'numpy'
+
+STORAGE_TYPES = (LIST_STORAGE, ARRAY_STORAGE, NUMPY_STORAGE)
+
+BOARDS_PER_MILLION = 1000000
+
+
+def get_empty_value(storage):
+    """
+    Get the value that marks an empty square in the board planes of the specified storage type.
+    """
+
+    return None if storage == LIST_STORAGE else 0
+
+
+def create_plane(storage, values=None):
+    """
+    Create a board plane (an owner or piece class array, indexed by square) of the specified storage type.
+
+    Parameters
+    ----------
+    storage : str
+        One of STORAGE_TYPES.
+    values : iterable, optional
+        The initial values, including the unused item at index 0. Empty squares may be
+        either None or 0. By default, all squares are empty.
+
+    Returns
+    -------
+    list, array or numpy.ndarray
+    """
+
+    size = BoardConfig.total_squares + 1
+
+    if storage == LIST_STORAGE:
+        return [None] * size if values is None else [value or None for value in values]
+
+    values = [0] * size if values is None else [value or 0 for value in values]
+    if storage == ARRAY_STORAGE:
+        return array('b', values)
+    if storage == NUMPY_STORAGE:
+        import numpy
+        return numpy.array(values, dtype=numpy.int8)
+
+    raise ValueError('Unknown board storage: {0}'.format(storage))
+
+
+def copy_plane(storage, plane):
+    """
+    Create an independent copy of a board plane of the specified storage type.
+    """
+
+    # Slicing copies lists and arrays, but only creates a view of a NumPy array.
+    return plane.copy() if storage == NUMPY_STORAGE else plane[:]
+
+
+def get_plane_size(plane):
+    """
+    Get the memory used by a board plane, in bytes.
+
+    Square values are small ints and None, which are shared singletons in CPython,
+    so only the container itself is counted.
+    """
+
+    return sys.getsizeof(plane)
+
+
+def get_board_size(board):
+    """
+    Get the memory used by the piece data of a board, in bytes: the owner and piece class planes,
+    the bit masks of occupied squares of each player and the king counts.
+    """
+
+    return (
+        get_plane_size(board.owner) +
+        get_plane_size(board.piece_class) +
+        sys.getsizeof(board._player_squares) +
+        sys.getsizeof(board._player_squares[Player.WHITE]) +
+        sys.getsizeof(board._player_squares[Player.BLACK]) +
+        sys.getsizeof(board._king_counts)
+    )
+
+
+def _create_starting_board(storage):
+    from libcheckers.enum import PieceClass
+    from libcheckers.movement import Board
+
+    board = Board(storage)
+    for index in range(1, 21):
+        board.add_piece(index, Player.BLACK, PieceClass.MAN)
+    for index in range(31, 51):
+        board.add_piece(index, Player.WHITE, PieceClass.MAN)
+    return board
+
+
+def get_memory_report(storages=None):
+    """
+    Measure the memory used by the piece data of a board in the starting position for each storage type.
+
+    Parameters
+    ----------
+    storages : list, optional
+        The storage types to measure. By default, all types that are available in this environment.
+
+    Returns
+    -------
+    dict
+        Storage type -> dict with 'bytes_per_board' (see `get_board_size`), 'plane_bytes_per_board'
+        (the owner and piece class planes only), 'megabytes_per_million_boards'
+        and 'savings' (the fraction of memory saved compared to list storage).
+    """
+
+    if storages is None:
+        storages = [LIST_STORAGE, ARRAY_STORAGE]
+        try:
+            create_plane(NUMPY_STORAGE)
+            storages.append(NUMPY_STORAGE)
+        except ImportError:
+            pass
+
+    list_size = get_board_size(_create_starting_board(LIST_STORAGE))
+    report = {}
+    for storage in storages:
+        board = _create_starting_board(storage)
+        board_size = get_board_size(board)
+        report[storage] = {
+            'bytes_per_board': board_size,
+            'plane_bytes_per_board': get_plane_size(board.owner) + get_plane_size(board.piece_class),
+            'megabytes_per_million_boards': board_size * BOARDS_PER_MILLION / float(1 << 20),
+            'savings': 1 - board_size / float(list_size),
+        }
+    return report
+
+
+def main():
+    report = get_memory_report()
+    sys.stdout.write('{0:<8} {1:>16} {2:>16} {3:>24} {4:>8}\n'.format(
+        'Storage', 'Bytes per board', 'Planes only', 'MB per million boards', 'Savings',
+    ))
+    for storage in STORAGE_TYPES:
+        if storage in report:
+            line = '{0:<8} {1[bytes_per_board]:>16} {1[plane_bytes_per_board]:>16} ' \
+                   '{1[megabytes_per_million_boards]:>24.1f} {1[savings]:>8.0%}\n'
+            sys.stdout.write(line.format(storage, report[storage]))
+
+
+if __name__ == '__main__':
+    main()
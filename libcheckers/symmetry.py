@@ -0,0 +1,111 @@
+from libcheckers import BoardConfig
+from libcheckers.enum import Player
+from libcheckers.movement import Board, ForwardMove, CaptureMove, ComboCaptureMove
+from libcheckers.utils import index_to_coords, coords_to_index
+
+
+def _build_rotation_table():
+    table = [0]
+    for index in range(1, BoardConfig.total_squares + 1):
+        row, col = index_to_coords(index)
+        table.append(coords_to_index(BoardConfig.board_dim + 1 - row, BoardConfig.board_dim + 1 - col))
+    return table
+
+
+# rotation_table[index] is the square that `index` maps to when the board is rotated by 180 degrees.
+# The rotation is its own inverse, so the same table maps the squares back.
+rotation_table = _build_rotation_table()
+
+_swapped_players = {
+    Player.WHITE: Player.BLACK,
+    Player.BLACK: Player.WHITE,
+}
+
+# The player to move in the canonical form of every position.
+CANONICAL_PLAYER = Player.WHITE
+
+
+def flip_player(player):
+    """
+    Get the player that takes the place of the specified one after flipping the board.
+    """
+
+    return _swapped_players[player]
+
+
+def flip_board(board):
+    """
+    Rotate the board by 180 degrees and swap the colors of all pieces.
+
+    The resulting position is equivalent to the original one with the other player to move.
+    Pieces captured in an unfinished turn (`Player.ZOMBIE`) are not carried over.
+
+    Returns
+    -------
+    Board
+        A new board. Flipping it again restores the original position.
+    """
+
+    flipped_board = Board(board.storage)
+    for player in (Player.WHITE, Player.BLACK):
+        flipped_player = _swapped_players[player]
+        for index in board.get_player_squares(player):
+            flipped_board.add_piece(rotation_table[index], flipped_player, board.piece_class[index])
+    return flipped_board
+
+
+def flip_move(move):
+    """
+    Map a move onto the flipped board (see `flip_board`).
+    """
+
+    if isinstance(move, ComboCaptureMove):
+        return ComboCaptureMove([flip_move(step) for step in move.moves])
+    if isinstance(move, CaptureMove):
+        return CaptureMove(rotation_table[move.start_index], rotation_table[move.end_index])
+    if isinstance(move, ForwardMove):
+        return ForwardMove(rotation_table[move.start_index], rotation_table[move.end_index])
+    raise TypeError('Unknown move type: {0}'.format(type(move).__name__))
+
+
+def canonicalize(board, player):
+    """
+    Map a position to its canonical form, in which White is always the player to move.
+
+    Positions with Black to move are flipped (see `flip_board`), so that a position and
+    its color-flipped twin share a single canonical form.
+
+    Parameters
+    ----------
+    board : Board
+        The board to canonicalize.
+    player : int
+        The player to move.
+
+    Returns
+    -------
+    tuple
+        A 2-tuple: (canonical board, whether the board was flipped).
+        The canonical board may be the original board object if no flip was needed.
+    """
+
+    if player == CANONICAL_PLAYER:
+        return board, False
+    return flip_board(board), True
+
+
+def canonicalize_move(move, is_flipped):
+    """
+    Map a move between the original and the canonical form of a position.
+    Works in both directions, since flipping is its own inverse.
+    """
+
+    return flip_move(move) if is_flipped else move
+
+
+def decanonicalize(board, is_flipped):
+    """
+    Restore the original board from its canonical form.
+    """
+
+    return flip_board(board) if is_flipped else board
@@ -1,9 +1,53 @@
 import pytest
 
+from libcheckers import benchmark as benchmark_utils
 from libcheckers.enum import Player, PieceClass
 from libcheckers.movement import Board
 
 
+def pytest_addoption(parser):
+    group = parser.getgroup('libcheckers benchmarks')
+    group.addoption('--benchmark-history', default=None,
+                    help='Time the benchmarks and append the results to this history file.')
+    group.addoption('--benchmark-label', default=None,
+                    help='A label for the recorded benchmark run (e.g. a commit hash).')
+    group.addoption('--benchmark-repeat', type=int, default=benchmark_utils.DEFAULT_REPEAT,
+                    help='The number of timing samples per benchmark.')
+
+
+def pytest_configure(config):
+    config.benchmark_results = {}
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    history_path = config.getoption('benchmark_history')
+    if history_path and config.benchmark_results:
+        label = config.getoption('benchmark_label')
+        benchmark_utils.append_history(history_path, config.benchmark_results, label)
+
+
+@pytest.fixture
+def benchmark_timer(request):
+    """
+    Time a function when running with --benchmark-history, or just call it once otherwise,
+    so that the benchmarks double as smoke tests in regular test runs.
+    Not named `benchmark`, so that it does not shadow the fixture of pytest-benchmark when it is installed.
+    """
+
+    config = request.config
+
+    def run(func):
+        if config.getoption('benchmark_history'):
+            config.benchmark_results[request.node.name] = benchmark_utils.measure(
+                func,
+                repeat=config.getoption('benchmark_repeat'),
+            )
+        return func()
+
+    return run
+
+
 @pytest.fixture
 def starting_board():
     board = Board()
@@ -14,6 +58,17 @@ def starting_board():
     return board
 
 
+@pytest.fixture
+def middlegame_board():
+    # Reached after 30 random plies from the starting position. White to move.
+    board = Board()
+    for index in [32, 35, 36, 37, 38, 41, 42, 43, 44, 45, 47, 49, 50]:
+        board.add_piece(index, Player.WHITE, PieceClass.MAN)
+    for index in [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 15, 17, 21, 23, 29]:
+        board.add_piece(index, Player.BLACK, PieceClass.MAN)
+    return board
+
+
 @pytest.fixture
 def completely_filled_board():
     board = Board()
@@ -0,0 +1,86 @@
+from libcheckers.arbiter import MatchArbiter, is_legal_move
+from libcheckers.enum import Player, PieceClass, GameOverReason, ForfeitReason, DrawRule
+from libcheckers.game import get_move_summary
+from libcheckers.movement import Board, ForwardMove, CaptureMove
+
+
+def test_is_legal_move(one_vs_one_men_capture_board):
+    board = one_vs_one_men_capture_board
+    assert is_legal_move(board, Player.WHITE, CaptureMove(28, 19))
+    assert not is_legal_move(board, Player.WHITE, ForwardMove(28, 22))
+    assert not is_legal_move(board, Player.WHITE, None)
+
+
+def test_arbiter_alternates_players():
+    arbiter = MatchArbiter()
+    arbiter.start(None)
+    assert not arbiter.is_over
+    assert arbiter.accept_move(True)
+    assert arbiter.player == Player.BLACK
+    assert arbiter.plies == 1
+    assert arbiter.accept_move(True, GameOverReason.BLACK_WON)
+    assert arbiter.is_over
+    assert arbiter.game_over_reason == GameOverReason.BLACK_WON
+    assert arbiter.forfeited_by is None
+
+
+def test_arbiter_terminal_start():
+    arbiter = MatchArbiter(Player.BLACK)
+    arbiter.start(GameOverReason.WHITE_WON)
+    assert arbiter.is_over
+    assert arbiter.plies == 0
+
+
+def test_arbiter_ply_limit():
+    arbiter = MatchArbiter(max_plies=2)
+    arbiter.start(None)
+    arbiter.accept_move(True)
+    assert not arbiter.is_over
+    arbiter.accept_move(True)
+    assert arbiter.game_over_reason == GameOverReason.DRAW
+
+    arbiter = MatchArbiter(max_plies=0)
+    arbiter.start(None)
+    assert arbiter.game_over_reason == GameOverReason.DRAW
+
+
+def test_arbiter_illegal_move_forfeits():
+    arbiter = MatchArbiter(Player.BLACK)
+    arbiter.start(None)
+    assert not arbiter.accept_move(False)
+    assert arbiter.plies == 0
+    assert arbiter.game_over_reason == GameOverReason.WHITE_WON
+    assert arbiter.forfeited_by == Player.BLACK
+    assert arbiter.forfeit_reason == ForfeitReason.ILLEGAL_MOVE
+
+
+def test_arbiter_forfeit():
+    arbiter = MatchArbiter()
+    arbiter.start(None)
+    arbiter.forfeit(ForfeitReason.TIMEOUT)
+    assert arbiter.game_over_reason == GameOverReason.BLACK_WON
+    assert arbiter.forfeited_by == Player.WHITE
+    assert arbiter.forfeit_reason == ForfeitReason.TIMEOUT
+
+
+def test_arbiter_draw_rules():
+    board = Board()
+    board.add_piece(46, Player.WHITE, PieceClass.KING)
+    board.add_piece(47, Player.WHITE, PieceClass.KING)
+    board.add_piece(4, Player.BLACK, PieceClass.KING)
+    board.add_piece(5, Player.BLACK, PieceClass.KING)
+    arbiter = MatchArbiter(max_plies=100, board=board)
+    arbiter.start(None)
+
+    player = Player.WHITE
+    cycle = [ForwardMove(46, 41), ForwardMove(4, 10), ForwardMove(41, 46), ForwardMove(10, 4)] * 2
+    for move in cycle:
+        new_board = move.apply(board)
+        player = Player.BLACK if player == Player.WHITE else Player.WHITE
+        assert not arbiter.is_over
+        assert arbiter.accept_move(True, None, get_move_summary(board, new_board, move, player))
+        board = new_board
+
+    assert arbiter.plies == 8
+    assert arbiter.draw_rule == DrawRule.REPETITION
+    assert arbiter.game_over_reason == GameOverReason.DRAW
@@ -0,0 +1,73 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from libcheckers.arena import BoardArena, BoardHandle, SLOT_SIZE
+from libcheckers.enum import Player, PieceClass
+
+
+def advance_board_in_worker(handle):
+    board = handle.load()
+    player = handle.load_player()
+    move = board.get_available_moves(player)[0]
+    handle.store(move.apply(board), Player.BLACK if player == Player.WHITE else Player.WHITE)
+    return repr(move)
+
+
+def test_arena_write_read(starting_board, insane_king_combo_board):
+    with BoardArena(capacity=4) as arena:
+        arena.write(0, starting_board, Player.WHITE)
+        arena.write(3, insane_king_combo_board)
+        assert str(arena.read(0)) == str(starting_board)
+        assert arena.read_player(0) == Player.WHITE
+        assert arena.read(3).piece_class == insane_king_combo_board.piece_class
+        assert arena.read_player(3) is None
+        assert arena.read(1).get_piece_count(Player.WHITE) == 0
+
+
+def test_arena_slot_out_of_range(starting_board):
+    with BoardArena(capacity=2) as arena:
+        with pytest.raises(IndexError):
+            arena.write(2, starting_board)
+        with pytest.raises(IndexError):
+            arena.handle(-1)
+
+
+def test_arena_attach_by_name(two_vs_one_kings_board):
+    with BoardArena(capacity=3) as arena:
+        other_arena = BoardArena(name=arena.name)
+        assert other_arena.capacity == 3
+        other_arena.write(1, two_vs_one_kings_board, Player.BLACK)
+        assert arena.read(1).get_king_count(Player.WHITE) == 2
+        view = arena.view(1)
+        assert len(view) == SLOT_SIZE
+        assert view[17] == 4
+        view.release()
+        other_arena.close()
+
+
+def test_board_handle_pickles_compactly(starting_board):
+    with BoardArena(capacity=1000) as arena:
+        arena.write(999, starting_board)
+        handle = arena.handle(999)
+        payload = pickle.dumps(handle)
+        assert len(payload) < 200
+        restored_handle = pickle.loads(payload)
+        assert restored_handle == handle
+        assert str(restored_handle.load()) == str(starting_board)
+
+
+def test_board_handle_in_worker_process(starting_board):
+    with BoardArena(capacity=2) as arena:
+        arena.write(0, starting_board, Player.WHITE)
+        with ProcessPoolExecutor(max_workers=1) as executor:
+            move_repr = executor.submit(advance_board_in_worker, arena.handle(0)).result()
+        assert move_repr == 'Move: 31 -> 26'
+        assert arena.read_player(0) == Player.BLACK
+        assert arena.read(0).owner[26] == Player.WHITE
+        assert arena.read(0).piece_class[26] == PieceClass.MAN
+
+
+def test_board_handle_repr():
+    assert repr(BoardHandle('arena', 5)) == 'BoardHandle: arena[5]'
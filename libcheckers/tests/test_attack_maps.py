@@ -0,0 +1,74 @@
+from libcheckers.enum import Player, PieceClass
+from libcheckers.movement import Board
+
+
+def assert_maps_match_board(board):
+    maps = board.attack_maps
+    for player in (Player.WHITE, Player.BLACK):
+        for index in board.get_player_squares(player):
+            assert maps.get_free_movement_destinations(index) == board.get_free_movement_destinations(index)
+            assert maps.get_capturable_pieces(index) == board.get_capturable_pieces(index)
+
+    for index in range(1, 51):
+        expected_attackers = [
+            attacker
+            for player in (Player.WHITE, Player.BLACK)
+            for attacker in board.get_player_squares(player)
+            if index in board.get_capturable_pieces(attacker)
+        ]
+        assert maps.get_attackers(index) == sorted(expected_attackers)
+
+
+def test_attack_maps_initial_state(two_vs_one_kings_board):
+    board = two_vs_one_kings_board
+    maps = board.enable_attack_maps()
+    assert maps.get_attackers(18) == [31, 34]
+    assert maps.get_attackers(31) == [18]
+    assert maps.get_capture_count(Player.WHITE) == 2
+    assert maps.get_mobility(Player.WHITE) == 16
+    assert_maps_match_board(board)
+
+
+def test_attack_maps_follow_board_mutations(one_vs_one_men_surrender_board):
+    board = one_vs_one_men_surrender_board
+    maps = board.enable_attack_maps()
+    assert maps.get_attackers(18) == []
+
+    board.add_piece(23, Player.WHITE, PieceClass.MAN)
+    assert maps.get_attackers(23) == [18]
+    assert_maps_match_board(board)
+
+    board.move_piece(28, 32)
+    board.remove_piece(18)
+    assert maps.get_attackers(23) == []
+    assert maps.get_free_movement_destinations(18) == []
+    assert_maps_match_board(board)
+
+
+def test_attack_maps_inherited_by_child_boards(starting_board):
+    board = starting_board
+    board.enable_attack_maps()
+    player = Player.WHITE
+    for _ in range(40):
+        moves = board.get_available_moves(player)
+        if not moves:
+            break
+        board = moves[len(moves) // 3].apply(board)
+        player = Player.BLACK if player == Player.WHITE else Player.WHITE
+        assert board.attack_maps is not None
+        assert board.attack_maps.board is board
+        assert_maps_match_board(board)
+
+
+def test_attack_maps_combo_capture(insane_king_combo_board):
+    board = insane_king_combo_board
+    board.enable_attack_maps()
+    move = board.get_available_moves(Player.WHITE)[0]
+    new_board = move.apply(board)
+    assert_maps_match_board(new_board)
+    assert_maps_match_board(board)
+
+
+def test_attack_maps_disabled_by_default():
+    board = Board()
+    assert board.attack_maps is None
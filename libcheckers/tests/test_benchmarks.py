@@ -0,0 +1,177 @@
+import json
+
+import pytest
+
+from libcheckers.benchmark import measure, append_history, load_history, compare_runs, is_free_threaded, main
+from libcheckers.enum import Player, GameOverReason
+from libcheckers.movement import ForwardMove, CaptureMove, ComboCaptureMove
+from libcheckers.search import AlphaBetaSearch
+from libcheckers.serialization import load_board, save_board
+
+
+# Run with `pytest libcheckers/tests/test_benchmarks.py --benchmark-history=benchmarks.jsonl`
+# to record timings, then `python -m libcheckers.benchmark benchmarks.jsonl` to check for regressions.
+# Without --benchmark-history, every benchmark runs once as a regular test.
+
+
+@pytest.mark.parametrize('board_fixture, player, expected_move_count', [
+    ('starting_board', Player.WHITE, 9),
+    ('middlegame_board', Player.WHITE, 10),
+    ('two_vs_one_kings_board', Player.WHITE, 6),
+    ('two_vs_two_protected_kings_board', Player.BLACK, 11),
+    ('insane_king_combo_board', Player.WHITE, 1),
+])
+def test_benchmark_get_available_moves(request, benchmark_timer, board_fixture, player, expected_move_count):
+    board = request.getfixturevalue(board_fixture)
+    moves = benchmark_timer(lambda: board.get_available_moves(player))
+    assert len(moves) == expected_move_count
+
+
+# Man moves dominate the starting position, so this mostly measures the free movement tables.
+@pytest.mark.parametrize('player', [Player.WHITE, Player.BLACK])
+def test_benchmark_man_moves_starting_board(benchmark_timer, starting_board, player):
+    squares = starting_board.get_player_squares(player)
+    destinations = benchmark_timer(
+        lambda: [starting_board.get_free_movement_destinations(index) for index in squares]
+    )
+    assert sum(len(squares) for squares in destinations) == 9
+
+
+@pytest.mark.parametrize('player', [Player.WHITE, Player.BLACK])
+def test_benchmark_python_movegen_starting_board(benchmark_timer, starting_board, player):
+    assert len(benchmark_timer(lambda: starting_board.get_available_moves_python(player))) == 9
+
+
+@pytest.mark.parametrize('board_fixture, player, expected_result', [
+    ('starting_board', Player.WHITE, False),
+    ('middlegame_board', Player.WHITE, False),
+    ('insane_king_combo_board', Player.WHITE, True),
+])
+def test_benchmark_has_capture_moves(request, benchmark_timer, board_fixture, player, expected_result):
+    board = request.getfixturevalue(board_fixture)
+    assert benchmark_timer(lambda: board.has_capture_moves(player)) == expected_result
+
+
+def test_benchmark_apply_forward_move(benchmark_timer, starting_board):
+    move = ForwardMove(32, 28)
+    new_board = benchmark_timer(lambda: move.apply(starting_board))
+    assert new_board.owner[28] == Player.WHITE
+
+
+def test_benchmark_apply_capture_move(benchmark_timer, one_vs_one_men_capture_board):
+    move = CaptureMove(28, 19)
+    new_board = benchmark_timer(lambda: move.apply(one_vs_one_men_capture_board))
+    assert new_board.owner[23] is None
+
+
+def test_benchmark_apply_combo_capture_move(benchmark_timer, insane_king_combo_board):
+    move = insane_king_combo_board.get_available_moves(Player.WHITE)[0]
+    assert isinstance(move, ComboCaptureMove)
+    new_board = benchmark_timer(lambda: move.apply(insane_king_combo_board))
+    assert new_board.get_piece_count(Player.BLACK) == 1
+
+
+@pytest.mark.parametrize('board_fixture, player, expected_child_count', [
+    ('starting_board', Player.WHITE, 9),
+    ('middlegame_board', Player.WHITE, 10),
+    ('insane_king_combo_board', Player.WHITE, 1),
+])
+def test_benchmark_expand(request, benchmark_timer, board_fixture, player, expected_child_count):
+    board = request.getfixturevalue(board_fixture)
+    children = benchmark_timer(lambda: board.expand(player))
+    assert len(children) == expected_child_count
+
+
+@pytest.mark.parametrize('board_fixture, player, expected_reason', [
+    ('starting_board', Player.WHITE, None),
+    ('middlegame_board', Player.WHITE, None),
+    # Neither king can ever be captured, so the game ends right away.
+    ('one_vs_one_kings_cornered_board', Player.WHITE, GameOverReason.DRAW),
+])
+def test_benchmark_check_game_over(request, benchmark_timer, board_fixture, player, expected_reason):
+    board = request.getfixturevalue(board_fixture)
+    assert benchmark_timer(lambda: board.check_game_over(player)) == expected_reason
+
+
+@pytest.mark.parametrize('board_fixture', [
+    'starting_board',
+    'middlegame_board',
+    'insane_king_combo_board',
+])
+def test_benchmark_serialization_round_trip(request, benchmark_timer, board_fixture):
+    board = request.getfixturevalue(board_fixture)
+    loaded_board = benchmark_timer(lambda: load_board(save_board(board)))
+    assert loaded_board.owner == board.owner
+    assert loaded_board.piece_class == board.piece_class
+
+
+# Thread scaling of the lazy SMP search: on free-threaded builds, more threads should reach the same depth
+# faster (or search deeper in the same time); on standard builds, a single thread must not get slower.
+@pytest.mark.parametrize('threads', [1, 2, 4])
+def test_benchmark_search_threads(benchmark_timer, middlegame_board, threads):
+    result = benchmark_timer(lambda: AlphaBetaSearch(threads=threads, seed=0).search(
+        middlegame_board,
+        Player.WHITE,
+        max_depth=4,
+    ))
+    assert result.depth == 4
+
+
+# The benchmark utilities themselves.
+
+def make_run(results):
+    return {'results': dict((name, {'median': value}) for name, value in results.items())}
+
+
+def test_measure_reports_statistics():
+    stats = measure(lambda: sum(range(100)), repeat=3, min_sample_time=0.001)
+    assert stats['repeat'] == 3
+    assert stats['number'] >= 1
+    assert 0 < stats['min'] <= stats['median'] <= stats['max']
+
+
+def test_history_round_trip(tmpdir):
+    path = str(tmpdir.join('history.jsonl'))
+    append_history(path, {'bench': {'median': 1.0}}, label='first')
+    append_history(path, {'bench': {'median': 2.0}})
+
+    history = load_history(path)
+    assert len(history) == 2
+    assert history[0]['label'] == 'first'
+    assert history[1]['results']['bench']['median'] == 2.0
+    assert 'python' in history[0]['environment']
+
+
+def test_compare_runs_only_common_benchmarks():
+    baseline = make_run({'a': 1.0, 'b': 2.0, 'removed': 1.0})
+    current = make_run({'a': 1.05, 'b': 3.0, 'added': 1.0})
+
+    comparisons = compare_runs(baseline, current)
+    assert [comparison.name for comparison in comparisons] == ['a', 'b']
+    assert not comparisons[0].is_regression(0.1)
+    assert comparisons[1].is_regression(0.1)
+    assert not comparisons[1].is_regression(0.6)
+
+
+def test_main_flags_regressions(tmpdir, capsys):
+    path = tmpdir.join('history.jsonl')
+    path.write('\n'.join(json.dumps(make_run(results)) for results in [
+        {'a': 1.0, 'b': 1.0},
+        {'a': 1.5, 'b': 1.0},
+        {'a': 1.0, 'b': 1.0},
+    ]) + '\n')
+
+    assert main([str(path)]) == 0
+    assert main([str(path), '--baseline', '0', '--current', '1']) == 1
+    assert 'REGRESSION' in capsys.readouterr().out
+    assert main([str(path), '--baseline', '0', '--current', '1', '--threshold', '0.6']) == 0
+
+
+def test_main_requires_two_runs(tmpdir):
+    path = tmpdir.join('history.jsonl')
+    path.write(json.dumps(make_run({'a': 1.0})) + '\n')
+    assert main([str(path)]) == 2
+
+
+def test_is_free_threaded():
+    assert is_free_threaded() in (True, False)
@@ -0,0 +1,78 @@
+from concurrent.futures import ProcessPoolExecutor
+
+from libcheckers.cache import PositionCache, get_position_key
+from libcheckers.enum import Player, GameOverReason
+from libcheckers.generator import RandomPositionGenerator
+
+
+def test_cache_moves_and_game_over(tmpdir, starting_board, insane_king_combo_board,
+                                  one_vs_one_men_cornered_board):
+    cornered_board = one_vs_one_men_cornered_board
+    path = str(tmpdir.join('cache.db'))
+    with PositionCache(path) as cache:
+        assert cache.get_moves(starting_board, Player.WHITE) is None
+        assert cache.get_game_over(starting_board, Player.WHITE) == (False, None)
+
+        for board in (starting_board, insane_king_combo_board):
+            assert cache.get_available_moves(board, Player.WHITE) == board.get_available_moves(Player.WHITE)
+            assert cache.get_moves(board, Player.WHITE) == board.get_available_moves(Player.WHITE)
+        assert cache.get_moves(starting_board, Player.BLACK) is None
+
+        assert cache.check_game_over(starting_board, Player.WHITE) is None
+        assert cache.check_game_over(cornered_board, Player.BLACK) == GameOverReason.WHITE_WON
+        assert cache.get_game_over(starting_board, Player.WHITE) == (True, None)
+        assert len(cache) == 3
+
+    # The entries outlive the process that created them.
+    with PositionCache(path) as cache:
+        expected_moves = starting_board.get_available_moves(Player.WHITE)
+        assert cache.get_moves(starting_board, Player.WHITE) == expected_moves
+        assert cache.get_game_over(cornered_board, Player.BLACK) == (True, GameOverReason.WHITE_WON)
+
+
+def test_cache_rules_version_invalidates_entries(tmpdir, starting_board):
+    path = str(tmpdir.join('cache.db'))
+    with PositionCache(path, rules_version=1) as cache:
+        cache.check_game_over(starting_board, Player.WHITE)
+    with PositionCache(path, rules_version=1) as cache:
+        assert len(cache) == 1
+    with PositionCache(path, rules_version=2) as cache:
+        assert len(cache) == 0
+
+
+def test_cache_evicts_least_recently_used(tmpdir, starting_board, insane_king_combo_board, middlegame_board):
+    path = str(tmpdir.join('cache.db'))
+    with PositionCache(path, max_entries=2, eviction_interval=1, touch_interval=0) as cache:
+        cache.get_available_moves(starting_board, Player.WHITE)
+        cache.get_available_moves(insane_king_combo_board, Player.WHITE)
+        cache.get_moves(starting_board, Player.WHITE)
+        cache.get_available_moves(middlegame_board, Player.WHITE)
+
+        assert len(cache) == 2
+        assert cache.get_moves(insane_king_combo_board, Player.WHITE) is None
+        assert cache.get_moves(starting_board, Player.WHITE) is not None
+        assert cache.get_moves(middlegame_board, Player.WHITE) is not None
+
+
+def test_position_key(starting_board):
+    assert get_position_key(starting_board, Player.WHITE) != get_position_key(starting_board, Player.BLACK)
+    assert len(get_position_key(starting_board, Player.WHITE)) == 51
+
+
+def _fill_cache(path, seed):
+    generator = RandomPositionGenerator(seed=seed)
+    with PositionCache(path) as cache:
+        for _ in range(20):
+            board, player = generator.random_game_position(min_plies=1, max_plies=20)
+            cache.get_available_moves(board, player)
+    return seed
+
+
+def test_cache_shared_across_processes(tmpdir):
+    path = str(tmpdir.join('cache.db'))
+    PositionCache(path).close()
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        assert list(executor.map(_fill_cache, [path] * 4, range(4))) == list(range(4))
+
+    with PositionCache(path) as cache:
+        assert 0 < len(cache) <= 80
@@ -0,0 +1,110 @@
+import io
+import json
+
+import pytest
+
+from libcheckers.cli import BINARY_RECORD_SIZE, main
+from libcheckers.enum import Player
+from libcheckers.generator import RandomPositionGenerator
+from libcheckers.serialization import save_board, save_player, save_position_binary
+
+
+def run_cli(argv):
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    exit_code = main(argv, stdout, stderr)
+    results = [json.loads(line) for line in stdout.getvalue().splitlines()]
+    return exit_code, results, stderr.getvalue()
+
+
+@pytest.fixture
+def positions(starting_board, one_vs_one_men_capture_board, one_vs_one_men_cornered_board):
+    return [
+        (starting_board, Player.WHITE),
+        (one_vs_one_men_capture_board, Player.WHITE),
+        (one_vs_one_men_cornered_board, Player.BLACK),
+    ]
+
+
+def write_jsonl(path, positions):
+    path.write('\n'.join(
+        json.dumps({'board': save_board(board), 'player': save_player(player)})
+        for board, player in positions
+    ) + '\n')
+
+
+def test_analyze_jsonl(tmpdir, positions):
+    path = tmpdir.join('positions.jsonl')
+    write_jsonl(path, positions)
+
+    exit_code, results, stats = run_cli(['analyze', str(path)])
+    assert exit_code == 0
+    assert [result['index'] for result in results] == [0, 1, 2]
+    assert len(results[0]['moves']) == 9
+    assert '32-28' in results[0]['moves']
+    assert results[0]['game_over'] is None
+    assert results[1]['moves'] == ['28x19']
+    assert results[2]['moves'] == []
+    assert results[2]['game_over'] == 'white_won'
+    assert 'evaluation' not in results[0]
+    assert stats.startswith('Done: 3 positions (0 errors)')
+
+
+def test_analyze_binary_with_workers_and_evaluation(tmpdir, positions):
+    path = tmpdir.join('positions.bin')
+    records = [save_position_binary(board, player) for board, player in positions]
+    assert all(len(record) == BINARY_RECORD_SIZE for record in records)
+    path.write_binary(b''.join(records * 4))
+
+    exit_code, results, _ = run_cli([
+        'analyze', str(path), '--workers', '2', '--chunk-size', '2', '--depth', '2',
+    ])
+    assert exit_code == 0
+    assert len(results) == 12
+    assert [result['index'] for result in results] == list(range(12))
+    assert results[4]['moves'] == ['28x19']
+    assert results[4]['evaluation']['move'] == '28x19'
+    assert results[4]['evaluation']['depth'] == 2
+    assert 'evaluation' not in results[5]
+
+
+def test_analyze_generated_stream(tmpdir):
+    path = tmpdir.join('positions.bin')
+    records = list(RandomPositionGenerator(seed=3).stream(count=10, serialized=True))
+    path.write_binary(b''.join(records))
+
+    exit_code, results, stats = run_cli(['analyze', str(path)])
+    assert exit_code == 0
+    assert [result['index'] for result in results] == list(range(10))
+    assert all('error' not in result for result in results)
+    assert stats.startswith('Done: 10 positions (0 errors)')
+
+
+def test_analyze_reports_malformed_records(tmpdir, positions):
+    path = tmpdir.join('positions.jsonl')
+    write_jsonl(path, positions[:1])
+    path.write('not json\n{"board": {}, "player": "green"}\n', mode='a')
+
+    exit_code, results, stats = run_cli(['analyze', str(path), '--format', 'jsonl'])
+    assert exit_code == 1
+    assert len(results) == 3
+    assert 'error' not in results[0]
+    assert 'error' in results[1]
+    assert 'error' in results[2]
+    assert '(2 errors)' in stats
+
+
+@pytest.mark.parametrize('square', ['0', '51', '99', '-1', 'a1'])
+def test_analyze_reports_invalid_squares(tmpdir, square):
+    path = tmpdir.join('positions.jsonl')
+    board_data = {square: {'player': 'white', 'class': 'man'}}
+    path.write(json.dumps({'board': board_data, 'player': 'white'}) + '\n')
+
+    exit_code, results, stats = run_cli(['analyze', str(path)])
+    assert exit_code == 1
+    assert results[0]['error'].startswith('ValueError')
+    assert '(1 errors)' in stats
+
+
+def test_no_command():
+    assert run_cli([])[0] == 2
@@ -0,0 +1,122 @@
+import pytest
+
+from libcheckers import movement
+from libcheckers.difftest import (
+    check_position,
+    minimize_divergence,
+    reference_move_generator,
+    run_differential_test,
+)
+from libcheckers.enum import Player, PieceClass
+from libcheckers.movement import Board, ForwardMove, CaptureMove, ComboCaptureMove
+
+
+def no_king_long_jumps_generator(board, player):
+    # A deliberately broken generator: kings cannot land further than one square past the victim.
+    moves = board.get_available_moves_python(player)
+    return [
+        move
+        for move in moves
+        if not isinstance(move, CaptureMove) or
+        board.piece_class[move.start_index] != PieceClass.KING or
+        abs(move.end_index - move.start_index) <= 11
+    ]
+
+
+def extra_move_generator(board, player):
+    moves = board.get_available_moves_python(player)
+    if board.get_piece_count(player) >= 3:
+        moves.append(ForwardMove(1, 6))
+    return moves
+
+
+class ZombieKeepingMove(ComboCaptureMove):
+    # A deliberately broken fast path: the captured pieces are never removed from the board.
+    def apply(self, board, validate=True):
+        new_board = board.clone()
+        for step in self.moves:
+            new_board.mark_captured(step.find_captured_square(new_board))
+            new_board.move_piece(step.start_index, step.end_index)
+        return new_board
+
+
+def zombie_keeping_generator(board, player):
+    return [
+        ZombieKeepingMove(move.moves) if isinstance(move, ComboCaptureMove) else move
+        for move in board.get_available_moves_python(player)
+    ]
+
+
+def crashing_kings_generator(board, player):
+    if board.get_king_count(player):
+        raise IndexError('King moves are not implemented')
+    return board.get_available_moves_python(player)
+
+
+def test_identical_generators_agree():
+    assert run_differential_test(reference_move_generator, count=40, seed=1, chunk_size=15) is None
+
+
+@pytest.mark.skipif(movement.native_movegen is None, reason='The compiled move generator is not built')
+def test_native_generator_agrees_with_reference():
+    assert run_differential_test(Board.get_available_moves_native, count=300, seed=2) is None
+
+
+def test_divergence_detected_and_minimized():
+    divergence = run_differential_test(extra_move_generator, count=20, seed=3)
+    assert divergence is not None
+    assert divergence.position_number == 0
+    total_pieces = (
+        divergence.board.get_piece_count(Player.WHITE) +
+        divergence.board.get_piece_count(Player.BLACK)
+    )
+    assert divergence.board.get_piece_count(divergence.player) == 3
+    assert total_pieces == 3
+    assert 'Extra in candidate' in divergence.format()
+
+
+def test_minimize_divergence_demotes_kings(two_vs_one_kings_board):
+    board = two_vs_one_kings_board
+    board.add_piece(50, Player.WHITE, PieceClass.KING)
+    divergence = check_position(board, Player.BLACK, no_king_long_jumps_generator)
+    assert divergence is not None
+    minimized = minimize_divergence(divergence, no_king_long_jumps_generator)
+    assert minimized.board.get_player_squares(Player.BLACK) == [18]
+    assert minimized.board.get_king_count(Player.BLACK) == 1
+    assert minimized.board.get_piece_count(Player.WHITE) == 1
+
+
+def test_parallel_run_finds_earliest_divergence():
+    sequential = run_differential_test(extra_move_generator, count=30, seed=4, chunk_size=10)
+    parallel = run_differential_test(extra_move_generator, count=30, seed=4, chunk_size=10, workers=2)
+    assert parallel.position_number == sequential.position_number
+    assert str(parallel.board) == str(sequential.board)
+
+
+def test_candidate_exception_recorded_and_minimized(two_vs_one_kings_board):
+    divergence = check_position(two_vs_one_kings_board, Player.BLACK, crashing_kings_generator)
+    assert divergence.candidate_moves is None
+    assert divergence.error == 'IndexError: King moves are not implemented'
+
+    minimized = minimize_divergence(divergence, crashing_kings_generator)
+    assert minimized.board.get_piece_count(Player.WHITE) == 0
+    assert minimized.board.get_piece_count(Player.BLACK) == 1
+    assert minimized.board.get_king_count(Player.BLACK) == 1
+    assert 'Candidate raised: IndexError' in minimized.format()
+
+
+def test_candidate_exception_in_worker_reported():
+    divergence = run_differential_test(crashing_kings_generator, count=40, seed=5, workers=2, chunk_size=20)
+    assert divergence is not None
+    assert divergence.error.startswith('IndexError')
+
+
+def test_different_boards_after_move_detected(insane_king_combo_board):
+    divergence = check_position(insane_king_combo_board, Player.WHITE, zombie_keeping_generator)
+    assert isinstance(divergence.move, ComboCaptureMove)
+    assert all(candidate[0] == Player.ZOMBIE for _, _, candidate in divergence.changed_squares)
+    assert 'Different boards after' in divergence.format()
+
+    minimized = minimize_divergence(divergence, zombie_keeping_generator)
+    assert minimized.board.get_piece_count(Player.WHITE) == 1
+    assert minimized.board.get_piece_count(Player.BLACK) == 2
@@ -0,0 +1,182 @@
+import pytest
+
+from libcheckers.enum import Player, PieceClass, GameOverReason, DrawRule
+from libcheckers.game import Game, get_endgame_ply_limit
+from libcheckers.movement import Board, ForwardMove
+
+
+def play_game(board, plies, **kwargs):
+    game = Game(board, **kwargs)
+    boards = [board.clone()]
+    for _ in range(plies):
+        moves = game.board.get_available_moves(game.get_player_to_move())
+        if not moves:
+            break
+        boards.append(game.apply_move(moves[len(moves) // 2]).clone())
+    return game, boards
+
+
+def assert_boards_equal(actual, expected):
+    assert actual.owner == expected.owner
+    assert actual.piece_class == expected.piece_class
+    assert str(actual) == str(expected)
+
+
+def test_game_seek_every_ply(starting_board):
+    game, boards = play_game(starting_board, 60, snapshot_interval=8)
+    assert len(game) == len(boards) - 1
+    for ply in range(len(boards)):
+        assert_boards_equal(game.seek(ply), boards[ply])
+
+
+def test_game_seek_random_order(starting_board):
+    game, boards = play_game(starting_board, 60, snapshot_interval=5)
+    for ply in [37, 2, 59, 0, 31, 32, 30, 60, 1, 45]:
+        assert_boards_equal(game.seek(ply), boards[ply])
+
+
+def test_game_seek_returns_independent_board(starting_board):
+    game, boards = play_game(starting_board, 10)
+    board = game.seek(4)
+    board.remove_piece(board.get_player_squares(Player.WHITE)[0])
+    assert_boards_equal(game.seek(4), boards[4])
+
+
+def test_game_seek_out_of_range(starting_board):
+    game, _ = play_game(starting_board, 3)
+    with pytest.raises(IndexError):
+        game.seek(4)
+    with pytest.raises(IndexError):
+        game.seek(-1)
+
+
+def test_game_snapshot_eviction(starting_board):
+    game, boards = play_game(starting_board, 60, snapshot_interval=4, max_snapshots=3)
+    assert len(game.get_snapshot_plies()) == 3
+    for ply in range(len(boards)):
+        assert_boards_equal(game.seek(ply), boards[ply])
+
+    game.evict_snapshots(0)
+    assert game.get_snapshot_plies() == []
+    assert_boards_equal(game.seek(57), boards[57])
+
+
+def test_game_player_to_move(starting_board):
+    game, _ = play_game(starting_board, 3, first_player=Player.BLACK)
+    assert game.get_player_to_move(0) == Player.BLACK
+    assert game.get_player_to_move(1) == Player.WHITE
+    assert game.get_player_to_move() == Player.WHITE
+
+
+def play_moves(game, moves):
+    for move in moves:
+        assert move in game.board.get_available_moves(game.get_player_to_move())
+        game.apply_move(move)
+
+
+def test_position_hash_is_incremental(starting_board):
+    game, boards = play_game(starting_board, 80)
+    for board in boards:
+        rebuilt_board = Board()
+        for index in range(1, 51):
+            if board.owner[index]:
+                rebuilt_board.add_piece(index, board.owner[index], board.piece_class[index])
+        assert board.position_hash == rebuilt_board.position_hash
+    assert len(set(board.position_hash for board in boards)) == len(boards)
+
+
+def play_quiet_king_moves(game, plies):
+    # Make king moves that neither allow captures nor repeat earlier positions.
+    seen_keys = set()
+    for _ in range(plies):
+        player = game.get_player_to_move()
+        opponent = Player.BLACK if player == Player.WHITE else Player.WHITE
+        for move in game.board.get_available_moves(player):
+            board = move.apply(game.board)
+            is_quiet = (
+                isinstance(move, ForwardMove) and
+                game.board.piece_class[move.start_index] == PieceClass.KING and
+                all(isinstance(reply, ForwardMove) for reply in board.get_available_moves(opponent)) and
+                game.get_position_key(board, opponent) not in seen_keys
+            )
+            if is_quiet:
+                game.apply_move(move)
+                seen_keys.add(game.get_position_key(board, opponent))
+                break
+        else:
+            raise AssertionError('No quiet king moves available')
+
+
+def create_kings_and_men_board():
+    board = Board()
+    board.add_piece(50, Player.WHITE, PieceClass.KING)
+    board.add_piece(36, Player.WHITE, PieceClass.MAN)
+    board.add_piece(1, Player.BLACK, PieceClass.KING)
+    board.add_piece(15, Player.BLACK, PieceClass.MAN)
+    return board
+
+
+def test_threefold_repetition_draw():
+    game = Game(create_kings_and_men_board())
+    cycle = [ForwardMove(50, 45), ForwardMove(1, 6), ForwardMove(45, 50), ForwardMove(6, 1)]
+
+    play_moves(game, cycle)
+    assert game.check_game_over() is None
+    play_moves(game, cycle[:3])
+    assert game.check_game_over() is None
+    play_moves(game, cycle[3:])
+    assert game.draw_rule == DrawRule.REPETITION
+    assert game.check_game_over() == GameOverReason.DRAW
+
+
+def test_man_move_resets_repetition():
+    game = Game(create_kings_and_men_board())
+    cycle = [ForwardMove(50, 45), ForwardMove(1, 6), ForwardMove(45, 50), ForwardMove(6, 1)]
+
+    play_moves(game, cycle)
+    play_moves(game, [ForwardMove(36, 31), ForwardMove(15, 20)])
+    play_moves(game, cycle)
+    assert game.draw_rule is None
+
+
+def test_king_moves_draw():
+    board = Board()
+    board.add_piece(46, Player.WHITE, PieceClass.KING)
+    board.add_piece(47, Player.WHITE, PieceClass.KING)
+    board.add_piece(4, Player.BLACK, PieceClass.KING)
+    board.add_piece(5, Player.BLACK, PieceClass.KING)
+    game = Game(board)
+
+    play_quiet_king_moves(game, 49)
+    assert game.draw_rule is None
+    play_quiet_king_moves(game, 1)
+    assert game.draw_rule == DrawRule.KING_MOVES
+    assert game.check_game_over() == GameOverReason.DRAW
+
+
+def test_limited_material_draw():
+    board = Board()
+    board.add_piece(50, Player.WHITE, PieceClass.KING)
+    board.add_piece(36, Player.WHITE, PieceClass.MAN)
+    board.add_piece(1, Player.BLACK, PieceClass.KING)
+    game = Game(board)
+
+    play_quiet_king_moves(game, 9)
+    assert game.draw_rule is None
+    play_quiet_king_moves(game, 1)
+    assert game.draw_rule == DrawRule.LIMITED_MATERIAL
+    assert game.check_game_over() == GameOverReason.DRAW
+
+
+def test_get_endgame_ply_limit():
+    board = Board()
+    board.add_piece(5, Player.BLACK, PieceClass.KING)
+    board.add_piece(46, Player.WHITE, PieceClass.KING)
+    assert get_endgame_ply_limit(board) == 10
+    board.add_piece(36, Player.WHITE, PieceClass.MAN)
+    board.add_piece(37, Player.WHITE, PieceClass.MAN)
+    assert get_endgame_ply_limit(board) == 32
+    board.add_piece(38, Player.WHITE, PieceClass.MAN)
+    assert get_endgame_ply_limit(board) is None
+    board.remove_piece(46)
+    assert get_endgame_ply_limit(board) is None
@@ -0,0 +1,72 @@
+import time
+
+import pytest
+
+from libcheckers.enum import Player, PieceClass
+from libcheckers.generator import RandomPositionGenerator, create_starting_board
+from libcheckers.serialization import load_position_binary
+
+
+def test_play_random_game_is_reproducible():
+    first_game = [str(board) for board, _ in RandomPositionGenerator(seed=42).play_random_game()]
+    second_game = [str(board) for board, _ in RandomPositionGenerator(seed=42).play_random_game()]
+    other_game = [str(board) for board, _ in RandomPositionGenerator(seed=43).play_random_game()]
+    assert first_game == second_game
+    assert first_game != other_game
+
+
+def test_play_random_game_moves_are_legal():
+    board = create_starting_board()
+    player = Player.WHITE
+    for next_board, next_player in RandomPositionGenerator(seed=1).play_random_game(max_plies=100):
+        legal_boards = [str(move.apply(board)) for move in board.get_available_moves(player)]
+        assert str(next_board) in legal_boards
+        assert next_player != player
+        board, player = next_board.clone(), next_player
+
+
+def test_random_game_position_ply_range():
+    generator = RandomPositionGenerator(seed=7)
+    for _ in range(10):
+        board, player = generator.random_game_position(min_plies=2, max_plies=3)
+        pieces = board.get_piece_count(Player.WHITE) + board.get_piece_count(Player.BLACK)
+        assert 37 <= pieces <= 40
+
+
+def test_random_placement():
+    generator = RandomPositionGenerator(seed=3)
+    for _ in range(50):
+        board = generator.random_placement(white_pieces=12, black_pieces=7)
+        assert board.get_piece_count(Player.WHITE) == 12
+        assert board.get_piece_count(Player.BLACK) == 7
+        for index in range(1, 6):
+            assert not (board.owner[index] == Player.WHITE and board.piece_class[index] == PieceClass.MAN)
+        for index in range(46, 51):
+            assert not (board.owner[index] == Player.BLACK and board.piece_class[index] == PieceClass.MAN)
+
+
+def test_stream_serialized_is_reproducible():
+    first_stream = list(RandomPositionGenerator(seed=5).stream(count=5, serialized=True))
+    second_stream = list(RandomPositionGenerator(seed=5).stream(count=5, serialized=True))
+    assert first_stream == second_stream
+    assert all(len(data) == 51 for data in first_stream)
+    positions = [load_position_binary(data) for data in first_stream]
+    assert all(board.get_piece_count(Player.WHITE) > 0 for board, _ in positions)
+    assert set(player for _, player in positions) == {Player.WHITE, Player.BLACK}
+
+
+def test_stream_placement_boards():
+    boards = list(RandomPositionGenerator(seed=5).stream(count=3, mode='placement', white_pieces=2))
+    assert len(boards) == 3
+    assert all(board.get_piece_count(Player.WHITE) == 2 for board in boards)
+
+
+def test_stream_unknown_mode():
+    with pytest.raises(ValueError):
+        next(RandomPositionGenerator(seed=5).stream(mode='unknown'))
+
+
+def test_stream_respects_rate():
+    start_time = time.time()
+    list(RandomPositionGenerator(seed=5).stream(count=4, mode='placement', rate=50))
+    assert time.time() - start_time >= 0.06
@@ -0,0 +1,75 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+
+# Generous enough for slow CI machines, but catches heavy dependencies creeping into the import path.
+IMPORT_TIME_BUDGET = 0.25
+
+# json is imported only after the measurement, so that it is reported if the module imports it.
+IMPORT_SCRIPT = '''
+import sys, time
+modules_before = set(sys.modules)
+start_time = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start_time
+modules = sorted(set(sys.modules) - modules_before)
+import json
+print(json.dumps({{'elapsed': elapsed, 'modules': modules}}))
+'''
+
+HEAVY_MODULES = [
+    'asyncio',
+    'concurrent.futures',
+    'multiprocessing',
+    'numpy',
+    'sqlite3',
+    'copy',
+    'json',
+    'threading',
+    'libcheckers.attack_maps',
+]
+
+
+def cold_import(module):
+    output = subprocess.check_output([sys.executable, '-c', IMPORT_SCRIPT.format(module=module)])
+    return json.loads(output.decode('utf-8'))
+
+
+def test_package_import_is_lazy():
+    result = cold_import('libcheckers')
+    assert [module for module in result['modules'] if module.startswith('libcheckers')] == ['libcheckers']
+
+
+def test_lazy_submodule_access():
+    import libcheckers
+    assert libcheckers.movement.Board is not None
+    assert 'serialization' in dir(libcheckers)
+    with pytest.raises(AttributeError):
+        libcheckers.no_such_module
+
+
+@pytest.mark.parametrize('module', [
+    'libcheckers.serialization',
+    'libcheckers.movement',
+    'libcheckers.mcts',
+    'libcheckers.difftest',
+])
+def test_cold_import_budget(module):
+    result = cold_import(module)
+    assert result['elapsed'] < IMPORT_TIME_BUDGET
+    assert not [heavy for heavy in HEAVY_MODULES if heavy in result['modules']]
+
+
+def test_tournament_import_skips_server():
+    result = cold_import('libcheckers.tournament')
+    assert 'libcheckers.server' not in result['modules']
+    assert 'asyncio' not in result['modules']
+
+
+def test_benchmark_import_skips_search():
+    result = cold_import('libcheckers.benchmark')
+    assert 'libcheckers.search' not in result['modules']
+    assert 'threading' not in result['modules']
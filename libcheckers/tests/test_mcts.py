@@ -0,0 +1,120 @@
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+from libcheckers.enum import Player, PieceClass, GameOverReason
+from libcheckers.mcts import MCTS, rollout, random_rollout_policy, promotion_rollout_policy
+from libcheckers.movement import Board, ForwardMove, CaptureMove
+
+
+def test_rollout_finishes_game(starting_board):
+    board = starting_board.clone()
+    result = rollout(board, Player.WHITE, random_rollout_policy, random.Random(1), max_plies=1000)
+    assert result in (GameOverReason.WHITE_WON, GameOverReason.BLACK_WON, GameOverReason.DRAW)
+    assert starting_board.get_piece_count(Player.WHITE) == 20
+
+
+def test_mcts_single_available_move(one_vs_one_men_capture_board):
+    board = one_vs_one_men_capture_board
+    mcts = MCTS(seed=1)
+    assert mcts.search(board, Player.WHITE, iterations=20) == CaptureMove(28, 19)
+    assert mcts.last_search_stats.playouts == 20
+    assert mcts.last_search_stats.playouts_per_second > 0
+
+
+def test_mcts_avoids_losing_move():
+    # Every other move lets the black king capture both white men at once.
+    board = Board()
+    board.add_piece(32, Player.WHITE, PieceClass.MAN)
+    board.add_piece(24, Player.WHITE, PieceClass.MAN)
+    board.add_piece(15, Player.BLACK, PieceClass.KING)
+    mcts = MCTS(seed=1)
+    assert mcts.search(board, Player.WHITE, iterations=300) == ForwardMove(24, 19)
+
+
+def test_mcts_no_moves(completely_filled_board):
+    mcts = MCTS(seed=1)
+    assert mcts.search(completely_filled_board, Player.WHITE, iterations=5) is None
+
+
+def test_mcts_tree_reuse(starting_board):
+    board = starting_board
+    mcts = MCTS(seed=1)
+    move = mcts.search(board, Player.WHITE, iterations=50)
+    child_visits = [child.visits for child in mcts.root.children if child.move == move][0]
+
+    mcts.advance(move)
+    assert mcts.root.visits == child_visits
+    assert mcts.root.player == Player.BLACK
+
+    new_board = move.apply(board)
+    mcts.search(new_board, Player.BLACK, iterations=10)
+    assert mcts.root.visits == child_visits + 10
+
+
+def test_mcts_tree_discarded_for_unknown_position(starting_board):
+    mcts = MCTS(seed=1)
+    mcts.search(starting_board, Player.WHITE, iterations=10)
+    mcts.advance(ForwardMove(1, 50))
+    assert mcts.root is None
+
+
+def test_mcts_time_limit(starting_board):
+    mcts = MCTS(seed=1)
+    mcts.search(starting_board, Player.WHITE, time_limit=0.05)
+    assert mcts.last_search_stats.playouts > 0
+    assert mcts.last_search_stats.elapsed < 1
+
+
+def test_mcts_root_parallel(one_vs_one_men_surrender_board):
+    board = one_vs_one_men_surrender_board
+    with MCTS(seed=1) as mcts:
+        move = mcts.search(board, Player.WHITE, iterations=10, workers=2)
+    assert move in board.get_available_moves(Player.WHITE)
+    assert mcts.last_search_stats.playouts == 20
+
+
+def test_mcts_root_parallel_time_limit(one_vs_one_men_surrender_board):
+    board = one_vs_one_men_surrender_board
+    with MCTS(seed=1) as mcts:
+        move = mcts.search(board, Player.WHITE, time_limit=0.05, workers=2)
+    assert move in board.get_available_moves(Player.WHITE)
+    assert mcts.last_search_stats.playouts > 0
+
+
+def test_mcts_parallel_search_reuses_pool(one_vs_one_men_surrender_board):
+    board = one_vs_one_men_surrender_board
+    with MCTS(seed=1) as mcts:
+        mcts.search(board, Player.WHITE, iterations=5, workers=2)
+        executor = mcts._executor
+        mcts.search(board, Player.WHITE, iterations=5, workers=2)
+        assert mcts._executor is executor
+    assert mcts._executor is None
+
+
+def test_mcts_parallel_search_with_executor(one_vs_one_men_surrender_board):
+    board = one_vs_one_men_surrender_board
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        with MCTS(seed=1, executor=executor) as mcts:
+            move = mcts.search(board, Player.WHITE, iterations=5, workers=3)
+        assert move in board.get_available_moves(Player.WHITE)
+        assert mcts.last_search_stats.playouts == 15
+        # The executor belongs to the caller, so it is still usable.
+        assert executor.submit(sum, [1, 2]).result() == 3
+
+
+def test_mcts_tree_reused_for_equal_position(starting_board):
+    mcts = MCTS(seed=1)
+    mcts.search(starting_board, Player.WHITE, iterations=10)
+    mcts.search(starting_board.clone(), Player.WHITE, iterations=10)
+    assert mcts.root.visits == 20
+
+
+def test_promotion_rollout_policy_prefers_promotion():
+    board = Board()
+    board.add_piece(7, Player.WHITE, PieceClass.MAN)
+    board.add_piece(45, Player.WHITE, PieceClass.MAN)
+    board.add_piece(50, Player.BLACK, PieceClass.MAN)
+    moves = board.get_available_moves(Player.WHITE)
+    for seed in range(10):
+        move = promotion_rollout_policy(board, Player.WHITE, moves, random.Random(seed))
+        assert move.end_index in (1, 2)
@@ -1,8 +1,17 @@
 import pytest
 
-from libcheckers import InvalidMoveException
-from libcheckers.enum import Player, PieceClass, GameOverReason
-from libcheckers.movement import Board, ForwardMove, CaptureMove, ComboCaptureMove
+from libcheckers import BudgetExceededException, InvalidMoveException
+from libcheckers.enum import Player, PieceClass, GameOverReason, MoveError
+from libcheckers.generator import RandomPositionGenerator
+from libcheckers.movement import (
+    Board,
+    FrozenBoard,
+    ForwardMove,
+    CaptureMove,
+    ComboCaptureMove,
+    CaptureSearchBudget,
+    get_move_path,
+)
 
 
 def test_forward_move_to_occupied_square_raises(one_vs_one_men_capture_board):
@@ -205,6 +214,13 @@ def test_get_movement_destinations_2v1_kings(two_vs_one_kings_board):
     assert sorted(board.get_free_movement_destinations(18)) == [1, 4, 7, 9, 12, 13, 22, 23, 27, 29]
 
 
+def test_get_movement_destinations_unowned_squares(one_vs_one_men_surrender_board):
+    board = one_vs_one_men_surrender_board
+    assert board.get_free_movement_destinations(22) == []
+    board.mark_captured(18)
+    assert board.get_free_movement_destinations(18) == []
+
+
 def test_get_capture_landing_pos_men(one_vs_one_men_capture_board):
     board = one_vs_one_men_capture_board
     assert board.get_available_capture_landing_positions(23, 28) == [32]
@@ -366,6 +382,12 @@ def test_combo_capture_keeps_pieces_till_end_of_move(multiple_equal_combo_captur
     assert_moves_equal(actual_moves, expected_moves)
 
 
+def test_get_move_path():
+    assert get_move_path(ForwardMove(31, 26)) == [31, 26]
+    assert get_move_path(CaptureMove(28, 19)) == [28, 19]
+    assert get_move_path(ComboCaptureMove([CaptureMove(28, 19), CaptureMove(19, 10)])) == [28, 19, 10]
+
+
 def test_get_available_moves_insane_combo(insane_king_combo_board):
     board = insane_king_combo_board
     actual_moves = board.get_available_moves(Player.WHITE)
@@ -444,3 +466,272 @@ def test_game_over_one_king_each_adjacent_not_draw():
     board.add_piece(32, Player.BLACK, PieceClass.KING)
     assert board.check_game_over(Player.WHITE) is None
     assert board.check_game_over(Player.BLACK) is None
+
+
+def test_piece_counts_starting_pos(starting_board):
+    board = starting_board
+    assert board.get_piece_count(Player.WHITE) == 20
+    assert board.get_piece_count(Player.BLACK) == 20
+    assert board.get_king_count(Player.WHITE) == 0
+    assert board.get_king_count(Player.BLACK) == 0
+
+
+def test_piece_lists_follow_combo_capture(insane_king_combo_board):
+    board = insane_king_combo_board
+    move = board.get_available_moves(Player.WHITE)[0]
+    new_board = move.apply(board)
+    assert new_board.get_player_squares(Player.WHITE) == [40, 43, 48]
+    assert new_board.get_player_squares(Player.BLACK) == [35]
+    assert new_board.get_king_count(Player.WHITE) == 1
+    assert new_board.get_piece_count(Player.BLACK) == 1
+
+    # The original board must not be affected.
+    assert board.get_piece_count(Player.BLACK) == 7
+
+
+def test_king_count_follows_promotion():
+    board = Board()
+    board.add_piece(6, Player.WHITE, PieceClass.MAN)
+    board.add_piece(41, Player.BLACK, PieceClass.KING)
+    new_board = ForwardMove(6, 1).apply(board)
+    assert new_board.get_king_count(Player.WHITE) == 1
+    new_board.remove_piece(41)
+    assert new_board.get_king_count(Player.BLACK) == 0
+    assert new_board.get_piece_count(Player.BLACK) == 0
+
+
+def test_piece_lists_match_board_arrays(starting_board):
+    board = starting_board
+    player = Player.WHITE
+    for _ in range(40):
+        moves = board.get_available_moves(player)
+        if not moves:
+            break
+        board = moves[len(moves) // 2].apply(board)
+        player = Player.BLACK if player == Player.WHITE else Player.WHITE
+
+        for owner in (Player.WHITE, Player.BLACK):
+            scanned_squares = [index for index in range(1, 51) if board.owner[index] == owner]
+            scanned_kings = [
+                index for index in scanned_squares if board.piece_class[index] == PieceClass.KING
+            ]
+            assert board.get_player_squares(owner) == scanned_squares
+            assert board.get_king_count(owner) == len(scanned_kings)
+
+
+def test_apply_in_place_matches_apply(starting_board):
+    board = starting_board
+    player = Player.WHITE
+    for ply in range(150):
+        moves = board.get_available_moves(player)
+        if not moves:
+            break
+        for move in moves:
+            expected_board = move.apply(board)
+            actual_board = board.clone()
+            move.apply_in_place(actual_board)
+            assert actual_board.owner == expected_board.owner
+            assert actual_board.piece_class == expected_board.piece_class
+            assert str(actual_board) == str(expected_board)
+        board = moves[(ply * 5) % len(moves)].apply(board)
+        player = Player.BLACK if player == Player.WHITE else Player.WHITE
+
+
+def test_apply_in_place_combo_no_promotion_in_passing():
+    board = Board()
+    board.add_piece(11, Player.WHITE, PieceClass.MAN)
+    board.add_piece(7, Player.BLACK, PieceClass.MAN)
+    board.add_piece(8, Player.BLACK, PieceClass.MAN)
+    ComboCaptureMove([CaptureMove(11, 2), CaptureMove(2, 13)]).apply_in_place(board)
+    assert board.get_player_squares(Player.WHITE) == [13]
+    assert board.piece_class[13] == PieceClass.MAN
+    assert board.get_player_squares(Player.BLACK) == []
+
+
+def test_get_capture_moves_no_captures(starting_board):
+    assert not starting_board.has_capture_moves(Player.WHITE)
+    assert starting_board.get_capture_moves(Player.WHITE) == []
+
+
+def test_get_capture_moves_insane_combo(insane_king_combo_board):
+    board = insane_king_combo_board
+    assert board.has_capture_moves(Player.WHITE)
+    assert board.get_capture_moves(Player.WHITE) == board.get_available_moves(Player.WHITE)
+    assert board.has_capture_moves(Player.BLACK)
+
+
+def test_has_capture_moves_protected_and_distant_pieces():
+    board = Board()
+    board.add_piece(46, Player.WHITE, PieceClass.KING)
+    board.add_piece(19, Player.BLACK, PieceClass.MAN)
+    board.add_piece(14, Player.BLACK, PieceClass.MAN)
+    board.add_piece(36, Player.WHITE, PieceClass.MAN)
+    assert not board.has_capture_moves(Player.WHITE)
+
+    board.remove_piece(14)
+    assert board.has_capture_moves(Player.WHITE)
+
+    board.mark_captured(19)
+    assert not board.has_capture_moves(Player.WHITE)
+
+
+def test_has_capture_moves_matches_available_moves():
+    generator = RandomPositionGenerator(seed=11)
+    boards = [generator.random_game_position(0, 120)[0] for _ in range(50)]
+    boards += [generator.random_placement(king_probability=0.4) for _ in range(50)]
+    for board in boards:
+        for player in (Player.WHITE, Player.BLACK):
+            moves = board.get_available_moves(player)
+            has_captures = bool(moves) and not isinstance(moves[0], ForwardMove)
+            assert board.has_capture_moves(player) == has_captures
+            assert board.get_capture_moves(player) == (moves if has_captures else [])
+
+
+def test_get_error_codes(one_vs_one_men_capture_board, two_vs_two_protected_kings_board, starting_board):
+    board = one_vs_one_men_capture_board
+    assert ForwardMove(28, 22).get_error(board) is None
+    assert ForwardMove(1, 6).get_error(board) == MoveError.EMPTY_START_SQUARE
+    assert ForwardMove(28, 23).get_error(board) == MoveError.OCCUPIED_END_SQUARE
+    assert ForwardMove(28, 33).get_error(board) == MoveError.BACKWARD_MOVE
+    assert CaptureMove(28, 19).get_error(board) is None
+    assert CaptureMove(28, 17).get_error(board) == MoveError.NOT_ONE_OPPONENT
+    assert CaptureMove(28, 30).get_error(board) == MoveError.NON_DIAGONAL_MOVE
+    assert CaptureMove(29, 15).get_error(two_vs_two_protected_kings_board) == MoveError.NOT_ONE_OPPONENT
+    assert CaptureMove(37, 28).get_error(starting_board) == MoveError.OWN_PIECE_IN_WAY
+
+
+def test_invalid_move_exception_message(one_vs_one_men_capture_board):
+    with pytest.raises(InvalidMoveException) as exc_info:
+        ForwardMove(1, 6).apply(one_vs_one_men_capture_board)
+    assert exc_info.value.code == MoveError.EMPTY_START_SQUARE
+    assert str(exc_info.value) == 'Cannot move from an empty square (1)'
+    assert str(InvalidMoveException('Plain message')) == 'Plain message'
+    assert InvalidMoveException('Plain message').code is None
+
+
+def test_combo_capture_get_error(insane_king_combo_board):
+    board = insane_king_combo_board
+    move = board.get_available_moves(Player.WHITE)[0]
+    assert move.get_error(board) is None
+
+    broken_move = ComboCaptureMove(move.moves[:1] + move.moves[2:])
+    assert broken_move.get_error(board) is not None
+    with pytest.raises(InvalidMoveException) as exc_info:
+        broken_move.apply(board)
+    assert exc_info.value.code == broken_move.get_error(board)
+
+    # Checking a combo does not modify the board.
+    assert board.get_piece_count(Player.BLACK) == 7
+
+
+def test_apply_without_validation_matches_apply(middlegame_board, insane_king_combo_board):
+    for board, player in [(middlegame_board, Player.WHITE), (insane_king_combo_board, Player.WHITE)]:
+        for move in board.get_available_moves(player):
+            expected_board = move.apply(board)
+            actual_board = move.apply(board, validate=False)
+            assert actual_board.owner == expected_board.owner
+            assert actual_board.piece_class == expected_board.piece_class
+            assert actual_board.position_hash == expected_board.position_hash
+
+
+def test_iter_capture_sequences_is_lazy(insane_king_combo_board):
+    sequences = insane_king_combo_board.iter_capture_sequences(Player.WHITE)
+    assert next(sequences) == [CaptureMove(1, 12)]
+    assert len(list(sequences)) == 8
+
+
+# The capture sequences found by the former breadth-first search, in its order.
+breadth_first_capture_sequences = {
+    ('insane_king_combo_board', Player.WHITE): [
+        [CaptureMove(1, 12)],
+        [CaptureMove(1, 18), CaptureMove(18, 4)],
+        [CaptureMove(1, 23), CaptureMove(23, 46)],
+        [CaptureMove(1, 29), CaptureMove(29, 15)],
+        [CaptureMove(1, 34), CaptureMove(34, 43)],
+        [CaptureMove(48, 37), CaptureMove(37, 46)],
+        [CaptureMove(1, 18), CaptureMove(18, 9), CaptureMove(9, 25), CaptureMove(25, 43)],
+        [CaptureMove(1, 29), CaptureMove(29, 47), CaptureMove(47, 36), CaptureMove(36, 4)],
+        [CaptureMove(1, 29), CaptureMove(29, 47), CaptureMove(47, 36),
+         CaptureMove(36, 9), CaptureMove(9, 25), CaptureMove(25, 43)],
+    ],
+    ('insane_king_combo_board', Player.BLACK): [
+        [CaptureMove(35, 44)],
+    ],
+    ('multiple_capture_options_complex_board', Player.WHITE): [],
+    ('multiple_capture_options_complex_board', Player.BLACK): [
+        [CaptureMove(23, 34)],
+        [CaptureMove(23, 40)],
+        [CaptureMove(23, 45)],
+        [CaptureMove(23, 12), CaptureMove(12, 1)],
+    ],
+}
+
+
+@pytest.mark.parametrize('board_fixture, player', sorted(breadth_first_capture_sequences))
+def test_capture_sequences_keep_breadth_first_order(request, board_fixture, player):
+    expected = breadth_first_capture_sequences[board_fixture, player]
+    actual = request.getfixturevalue(board_fixture).get_capture_sequence_candidates(player)
+    assert len(actual) == len(expected)
+    # Depth-first search interleaves the lengths, but sequences of equal length keep their order.
+    for length in set(len(sequence) for sequence in expected):
+        assert [sequence for sequence in actual if len(sequence) == length] == \
+            [sequence for sequence in expected if len(sequence) == length]
+
+
+@pytest.mark.parametrize('budget, limit_name', [
+    (CaptureSearchBudget(max_nodes=19), 'max_nodes'),
+    (CaptureSearchBudget(max_sequences=8), 'max_sequences'),
+    (CaptureSearchBudget(time_limit=-1), 'time_limit'),
+])
+def test_capture_search_budget_exceeded(insane_king_combo_board, budget, limit_name):
+    with pytest.raises(BudgetExceededException) as exc_info:
+        insane_king_combo_board.get_available_moves(Player.WHITE, budget)
+    assert exc_info.value.limit_name == limit_name
+    assert limit_name in str(exc_info.value)
+
+
+def test_capture_search_budget_sufficient(insane_king_combo_board, starting_board):
+    budget = CaptureSearchBudget(max_nodes=20, max_sequences=9, time_limit=60)
+    board = insane_king_combo_board
+    assert board.get_available_moves(Player.WHITE, budget) == board.get_available_moves_python(Player.WHITE)
+    assert board.check_game_over(Player.WHITE, budget) is None
+
+    # Free moves are not limited by the capture budget.
+    assert len(starting_board.get_available_moves(Player.WHITE, CaptureSearchBudget(max_nodes=0))) == 9
+
+
+@pytest.mark.parametrize('board_fixture', [
+    'starting_board',
+    'middlegame_board',
+    'insane_king_combo_board',
+    'combo_via_home_row_board',
+    'multiple_capture_options_complex_board',
+])
+def test_expand_matches_apply(request, board_fixture):
+    board = request.getfixturevalue(board_fixture)
+    for player in (Player.WHITE, Player.BLACK):
+        children = board.expand(player)
+        assert [move for move, _ in children] == board.get_available_moves(player)
+        for move, child in children:
+            expected_board = move.apply(board)
+            assert child.owner == expected_board.owner
+            assert child.piece_class == expected_board.piece_class
+            assert child.position_hash == expected_board.position_hash
+            assert child.get_player_squares(player) == expected_board.get_player_squares(player)
+            assert child.get_king_count(player) == expected_board.get_king_count(player)
+
+
+def test_expand_frozen_and_attack_maps_boards(middlegame_board):
+    expected_children = middlegame_board.expand(Player.WHITE)
+    frozen_children = middlegame_board.freeze().expand(Player.WHITE)
+    board = middlegame_board.clone()
+    board.enable_attack_maps()
+    for (move, child), (frozen_move, frozen_child) in zip(expected_children, frozen_children):
+        assert frozen_move == move
+        assert frozen_child.owner == child.owner
+        assert not isinstance(frozen_child, FrozenBoard)
+    for move, child in board.expand(Player.WHITE):
+        assert child.attack_maps is not None
+        assert child.attack_maps.board is child
+        assert child.attack_maps.get_free_movement_destinations(move.end_index) == \
+            child.get_free_movement_destinations(move.end_index)
@@ -0,0 +1,124 @@
+import pytest
+
+from libcheckers import InvalidMoveException
+from libcheckers.enum import Player
+from libcheckers.generator import RandomPositionGenerator, create_starting_board
+from libcheckers.movement import ForwardMove, CaptureMove, ComboCaptureMove
+from libcheckers.notation import (
+    format_move,
+    format_game,
+    parse_move,
+    parse_move_path,
+    parse_game,
+    parse_games,
+    tokenize_game,
+)
+
+
+def play_random_games(count, seed, max_plies=80):
+    games = []
+    generator = RandomPositionGenerator(seed)
+    for _ in range(count):
+        board = create_starting_board()
+        player = Player.WHITE
+        moves = []
+        for _ in range(max_plies):
+            available_moves = board.get_available_moves(player)
+            if not available_moves:
+                break
+            move = generator.choose_move(available_moves)
+            move.apply_in_place(board)
+            moves.append(move)
+            player = Player.BLACK if player == Player.WHITE else Player.WHITE
+        games.append(moves)
+    return games
+
+
+def test_format_move():
+    assert format_move(ForwardMove(32, 28)) == '32-28'
+    assert format_move(CaptureMove(28, 19)) == '28x19'
+    combo = ComboCaptureMove([CaptureMove(28, 19), CaptureMove(19, 10), CaptureMove(10, 1)])
+    assert format_move(combo) == '28x19x10x1'
+    assert format_move(combo, short=True) == '28x1'
+
+
+def test_parse_move_path():
+    assert parse_move_path('32-28') == (False, [32, 28])
+    assert parse_move_path(' 28x19x10 ') == (True, [28, 19, 10])
+    for text in ['', '32', '32-28-23', '32x28-23', '0-5', '32-51', 'a-b', '32--28']:
+        with pytest.raises(ValueError):
+            parse_move_path(text)
+
+
+def test_parse_forward_move(starting_board):
+    assert parse_move('32-28', starting_board, Player.WHITE) == ForwardMove(32, 28)
+    assert parse_move('19-23', starting_board, Player.BLACK) == ForwardMove(19, 23)
+    for text, player in [('32-37', Player.WHITE), ('32-23', Player.WHITE), ('19-23', Player.WHITE),
+                         ('36-31', Player.WHITE), ('28-22', Player.WHITE)]:
+        with pytest.raises(InvalidMoveException):
+            parse_move(text, starting_board, player)
+
+
+def test_parse_forward_move_when_capture_is_mandatory(one_vs_one_men_capture_board):
+    board = one_vs_one_men_capture_board
+    with pytest.raises(InvalidMoveException):
+        parse_move('28-22', board, Player.WHITE)
+    assert parse_move('28x19', board, Player.WHITE) == CaptureMove(28, 19)
+
+
+def test_parse_combo_short_notation(insane_king_combo_board):
+    board = insane_king_combo_board
+    move = board.get_available_moves(Player.WHITE)[0]
+    full_text = format_move(move)
+    short_text = format_move(move, short=True)
+    assert parse_move(full_text, board, Player.WHITE) == move
+    assert parse_move(short_text, board, Player.WHITE) == move
+    with pytest.raises(InvalidMoveException):
+        parse_move('1x50', board, Player.WHITE)
+
+
+def test_parse_ambiguous_capture(multiple_equal_combo_captures_board):
+    board = multiple_equal_combo_captures_board
+    moves = board.get_available_moves(Player.BLACK)
+    assert len(moves) > 1
+
+    # The full path always identifies a single move.
+    for move in moves:
+        assert parse_move(format_move(move), board, Player.BLACK) == move
+
+    short_texts = [format_move(move, short=True) for move in moves]
+    ambiguous_texts = [text for text in short_texts if short_texts.count(text) > 1]
+    for text in ambiguous_texts:
+        with pytest.raises(InvalidMoveException) as exc_info:
+            parse_move(text, board, Player.BLACK)
+        assert 'Ambiguous' in str(exc_info.value)
+
+
+def test_tokenize_game():
+    assert tokenize_game('1. 32-28 19-23 2. 28x19 14x23 1-1') == ['32-28', '19-23', '28x19', '14x23']
+
+
+def test_parse_and_format_game_round_trip():
+    for moves in play_random_games(count=10, seed=4):
+        text = format_game(moves)
+        assert text.startswith('1. ')
+        assert parse_game(text) == moves
+
+
+def test_parse_game_with_custom_start(one_vs_one_men_capture_board):
+    moves = parse_game('28x19', board=one_vs_one_men_capture_board)
+    assert moves == [CaptureMove(28, 19)]
+    assert one_vs_one_men_capture_board.owner[23] == Player.BLACK
+
+
+def test_parse_game_black_first():
+    text = format_game([ForwardMove(19, 23), ForwardMove(32, 28)], first_player=Player.BLACK)
+    assert text == '1. ... 19-23 2. 32-28'
+    assert parse_game(text, first_player=Player.BLACK) == [ForwardMove(19, 23), ForwardMove(32, 28)]
+
+
+def test_parse_games():
+    games = play_random_games(count=6, seed=9, max_plies=40)
+    texts = [format_game(moves) for moves in games]
+    assert parse_games(texts) == games
+    assert parse_games(texts, workers=2, chunk_size=2) == games
@@ -0,0 +1,64 @@
+import pytest
+
+from libcheckers import movement
+from libcheckers.enum import Player
+from libcheckers.movement import Board
+from libcheckers.perft import perft
+
+
+requires_native_movegen = pytest.mark.skipif(
+    movement.native_movegen is None,
+    reason='The compiled move generator is not built',
+)
+
+move_generators = [
+    Board.get_available_moves_python,
+    pytest.param(Board.get_available_moves_native, marks=requires_native_movegen),
+]
+
+
+@pytest.mark.parametrize('move_generator', move_generators)
+def test_perft_starting_pos(starting_board, move_generator):
+    board = starting_board
+    assert perft(board, Player.WHITE, 0, move_generator) == 1
+    assert perft(board, Player.WHITE, 1, move_generator) == 9
+    assert perft(board, Player.WHITE, 2, move_generator) == 81
+    assert perft(board, Player.WHITE, 3, move_generator) == 658
+    assert perft(board, Player.WHITE, 4, move_generator) == 4265
+
+
+def normalize_moves(moves):
+    return sorted(repr(move) for move in moves)
+
+
+@requires_native_movegen
+@pytest.mark.parametrize('board_fixture, depth', [
+    ('starting_board', 4),
+    ('multiple_capture_options_men_board', 4),
+    ('multiple_equal_combo_captures_board', 4),
+    ('multiple_capture_options_complex_board', 4),
+    ('insane_king_combo_board', 4),
+    ('combo_via_home_row_board', 5),
+    ('two_vs_one_kings_board', 4),
+    ('two_vs_two_protected_kings_board', 3),
+])
+def test_perft_backends_match(request, board_fixture, depth):
+    board = request.getfixturevalue(board_fixture)
+    for player in (Player.WHITE, Player.BLACK):
+        python_count = perft(board, player, depth, Board.get_available_moves_python)
+        native_count = perft(board, player, depth, Board.get_available_moves_native)
+        assert python_count == native_count
+
+
+@requires_native_movegen
+def test_native_moves_match_python_moves_along_game(starting_board):
+    board = starting_board
+    player = Player.WHITE
+    for ply in range(120):
+        python_moves = board.get_available_moves_python(player)
+        native_moves = board.get_available_moves_native(player)
+        assert normalize_moves(python_moves) == normalize_moves(native_moves)
+        if not python_moves:
+            break
+        board = python_moves[(ply * 7) % len(python_moves)].apply(board)
+        player = Player.BLACK if player == Player.WHITE else Player.WHITE
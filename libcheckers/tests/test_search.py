@@ -0,0 +1,144 @@
+import threading
+
+import pytest
+
+from libcheckers.enum import Player, PieceClass
+from libcheckers.movement import Board, ForwardMove, CaptureMove
+from libcheckers.search import (
+    AlphaBetaSearch,
+    TranspositionTable,
+    WIN_THRESHOLD,
+    evaluate_material,
+    get_search_key,
+)
+
+
+@pytest.fixture
+def losing_move_board():
+    # Every move except 24 -> 19 lets the black king capture both white men at once.
+    board = Board()
+    board.add_piece(32, Player.WHITE, PieceClass.MAN)
+    board.add_piece(24, Player.WHITE, PieceClass.MAN)
+    board.add_piece(15, Player.BLACK, PieceClass.KING)
+    return board
+
+
+def test_frozen_board_rejects_mutation(starting_board):
+    frozen_board = starting_board.freeze()
+    with pytest.raises(TypeError):
+        frozen_board.move_piece(32, 28)
+    with pytest.raises(TypeError):
+        frozen_board.add_piece(25, Player.WHITE, PieceClass.MAN)
+    with pytest.raises(TypeError):
+        frozen_board.remove_piece(32)
+    with pytest.raises(TypeError):
+        frozen_board.mark_captured(32)
+    with pytest.raises(TypeError):
+        frozen_board.set_piece_class(32, PieceClass.KING)
+    with pytest.raises(TypeError):
+        ForwardMove(32, 28).apply_in_place(frozen_board)
+    with pytest.raises(TypeError):
+        frozen_board.owner[28] = Player.WHITE
+
+
+def test_frozen_board_reads(insane_king_combo_board):
+    board = insane_king_combo_board
+    frozen_board = board.freeze()
+    assert frozen_board.freeze() is frozen_board
+    assert frozen_board.position_hash == board.position_hash
+    assert hash(frozen_board) == board.position_hash
+    assert frozen_board == board.freeze()
+    assert str(frozen_board) == str(board)
+    for player in (Player.WHITE, Player.BLACK):
+        assert frozen_board.get_available_moves(player) == board.get_available_moves(player)
+        assert frozen_board.get_available_moves_python(player) == board.get_available_moves_python(player)
+        assert frozen_board.check_game_over(player) == board.check_game_over(player)
+
+    move = board.get_available_moves(Player.WHITE)[0]
+    assert str(move.apply(frozen_board)) == str(move.apply(board))
+    assert frozen_board.owner == tuple(board.owner)
+
+
+def test_frozen_board_clone_is_mutable(one_vs_one_men_capture_board):
+    frozen_board = one_vs_one_men_capture_board.freeze()
+    board = frozen_board.clone()
+    assert type(board) is Board
+    CaptureMove(28, 19).apply_in_place(board)
+    assert board.get_piece_count(Player.BLACK) == 0
+    assert board.position_hash != frozen_board.position_hash
+    assert frozen_board.get_piece_count(Player.BLACK) == 1
+
+
+def test_frozen_board_shared_between_threads(middlegame_board):
+    frozen_board = middlegame_board.freeze()
+    expected_moves = frozen_board.get_available_moves(Player.WHITE)
+    results = []
+
+    def generate():
+        for _ in range(20):
+            results.append(frozen_board.get_available_moves(Player.WHITE) == expected_moves)
+
+    threads = [threading.Thread(target=generate) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(results) == 80
+    assert all(results)
+
+
+def test_transposition_table_keeps_deeper_entries():
+    table = TranspositionTable(max_entries=2)
+    table.store(1, 3, 10, 0, None)
+    table.store(1, 2, 20, 0, None)
+    assert table.get(1) == (3, 10, 0, None)
+    table.store(1, 4, 30, 0, None)
+    assert table.get(1) == (4, 30, 0, None)
+
+    table.store(2, 1, 0, 0, None)
+    table.store(3, 1, 0, 0, None)
+    assert len(table) == 1
+    assert table.get(1) is None
+
+
+def test_search_key_depends_on_player(starting_board):
+    assert get_search_key(starting_board, Player.WHITE) != get_search_key(starting_board, Player.BLACK)
+
+
+def test_evaluate_material(two_vs_one_kings_board):
+    assert evaluate_material(two_vs_one_kings_board, Player.WHITE) == 300
+    assert evaluate_material(two_vs_one_kings_board, Player.BLACK) == -300
+
+
+@pytest.mark.parametrize('threads', [1, 2, 3])
+def test_search_avoids_losing_move(losing_move_board, threads):
+    result = AlphaBetaSearch(threads=threads, seed=1).search(losing_move_board, Player.WHITE, max_depth=4)
+    assert result.move == ForwardMove(24, 19)
+    assert result.depth == 4
+    assert result.nodes > 0
+
+
+def test_search_finds_forced_win(one_vs_one_men_capture_board):
+    result = AlphaBetaSearch().search(one_vs_one_men_capture_board, Player.WHITE, max_depth=3)
+    assert result.move == CaptureMove(28, 19)
+    assert result.score > WIN_THRESHOLD
+
+
+def test_search_no_moves(one_vs_one_men_cornered_board):
+    result = AlphaBetaSearch().search(one_vs_one_men_cornered_board, Player.BLACK, max_depth=2)
+    assert result.move is None
+    assert result.score < -WIN_THRESHOLD
+
+
+def test_search_time_limit(middlegame_board):
+    board = middlegame_board
+    owner_before = list(board.owner)
+    result = AlphaBetaSearch(threads=2).search(board, Player.WHITE, time_limit=0.3)
+    assert result.move in board.get_available_moves(Player.WHITE)
+    assert result.elapsed < 2
+    assert board.owner == owner_before
+
+
+def test_search_requires_limit(starting_board):
+    with pytest.raises(ValueError):
+        AlphaBetaSearch().search(starting_board, Player.WHITE)
@@ -1,8 +1,14 @@
+import pytest
+
 from libcheckers.enum import Player, PieceClass, GameOverReason
 from libcheckers.movement import ForwardMove, CaptureMove, ComboCaptureMove
 from libcheckers.serialization import (
     load_board,
     save_board,
+    load_board_binary,
+    save_board_binary,
+    load_position_binary,
+    save_position_binary,
     load_move,
     save_move,
     load_player,
@@ -69,3 +75,41 @@ def test_serialize_game_over_reason():
     assert load_game_over_reason(save_game_over_reason(GameOverReason.WHITE_WON)) == GameOverReason.WHITE_WON
     assert load_game_over_reason(save_game_over_reason(GameOverReason.BLACK_WON)) == GameOverReason.BLACK_WON
     assert load_game_over_reason(save_game_over_reason(GameOverReason.DRAW)) == GameOverReason.DRAW
+
+
+def test_serialize_board_binary():
+    payload = {
+        1: {'player': 'white', 'class': 'king'},
+        19: {'player': 'black', 'class': 'king'},
+        23: {'player': 'white', 'class': 'man'},
+        50: {'player': 'black', 'class': 'man'},
+    }
+    board = load_board(payload)
+    data = save_board_binary(board)
+    assert len(data) == 50
+    assert data[0] == 2
+    assert data[49] == 3
+    reloaded_board = load_board_binary(data)
+    assert reloaded_board.owner == board.owner
+    assert reloaded_board.piece_class == board.piece_class
+    assert reloaded_board.get_player_squares(Player.WHITE) == [1, 23]
+
+
+def test_deserialize_board_binary_wrong_length():
+    with pytest.raises(ValueError):
+        load_board_binary(b'\x00' * 49)
+
+
+def test_serialize_position_binary(one_vs_one_men_capture_board):
+    data = save_position_binary(one_vs_one_men_capture_board, Player.BLACK)
+    assert len(data) == 51
+    assert data[:50] == save_board_binary(one_vs_one_men_capture_board)
+    assert data[50] == Player.BLACK
+    board, player = load_position_binary(data)
+    assert board.owner == one_vs_one_men_capture_board.owner
+    assert player == Player.BLACK
+
+    with pytest.raises(ValueError):
+        load_position_binary(data[:50])
+    with pytest.raises(ValueError):
+        load_position_binary(data[:50] + b'\x03')
@@ -0,0 +1,201 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from libcheckers.enum import Player, PieceClass, GameOverReason, ForfeitReason, DrawRule
+from libcheckers.movement import Board, ForwardMove
+from libcheckers.server import BaseClient, LocalClient, MatchServer, process_turn
+
+
+def first_move_strategy(board, player):
+    return board.get_available_moves(player)[0]
+
+
+def last_move_strategy(board, player):
+    return board.get_available_moves(player)[-1]
+
+
+class SlowClient(BaseClient):
+    async def request_move(self, board_data, player_data):
+        await asyncio.sleep(10)
+
+
+class CrashingClient(BaseClient):
+    async def request_move(self, board_data, player_data):
+        raise RuntimeError('Client crashed')
+
+
+def slow_strategy(board, player):
+    time.sleep(1)
+    return first_move_strategy(board, player)
+
+
+def busy_strategy(board, player):
+    # Keeps the CPU (and the GIL) busy for a while, like a bot that searches.
+    end_time = time.perf_counter() + 0.01
+    while time.perf_counter() < end_time:
+        pass
+    return first_move_strategy(board, player)
+
+
+def king_shuffle_strategy(board, player):
+    # Move one king back and forth between two squares, as long as no capture is available.
+    shuffle_squares = {47, 42, 4, 9}
+    for move in board.get_available_moves(player):
+        if move.start_index in shuffle_squares and move.end_index in shuffle_squares:
+            return move
+    return first_move_strategy(board, player)
+
+
+class MalformedMoveClient(BaseClient):
+    async def request_move(self, board_data, player_data):
+        return {'type': 'ForwardMove'}
+
+
+class FailingRulesExecutor(ThreadPoolExecutor):
+    def submit(self, fn, *args, **kwargs):
+        if fn is process_turn:
+            raise RuntimeError('Rules worker died')
+        return super(FailingRulesExecutor, self).submit(fn, *args, **kwargs)
+
+
+class IllegalMoveClient(BaseClient):
+    async def request_move(self, board_data, player_data):
+        return {'type': 'ForwardMove', 'startIndex': 1, 'endIndex': 50}
+
+
+def test_play_match_until_game_over(one_vs_one_men_capture_board):
+    board = one_vs_one_men_capture_board
+    with MatchServer(executor=ThreadPoolExecutor(max_workers=2)) as server:
+        result = asyncio.run(server.play_match(
+            LocalClient(first_move_strategy),
+            LocalClient(first_move_strategy),
+            board=board,
+        ))
+    assert result.game_over_reason == GameOverReason.WHITE_WON
+    assert result.moves == [{'type': 'CaptureMove', 'startIndex': 28, 'endIndex': 19}]
+    assert result.forfeited_by is None
+
+
+def test_play_match_in_process_pool(one_vs_one_men_surrender_board):
+    board = one_vs_one_men_surrender_board
+    with MatchServer(max_workers=1) as server:
+        result = asyncio.run(server.play_match(
+            LocalClient(first_move_strategy),
+            LocalClient(last_move_strategy),
+            board=board,
+        ))
+    # White steps into the black man, which captures it and leaves White without pieces.
+    assert result.game_over_reason == GameOverReason.BLACK_WON
+    assert result.moves == [
+        {'type': 'ForwardMove', 'startIndex': 28, 'endIndex': 22},
+        {'type': 'CaptureMove', 'startIndex': 18, 'endIndex': 27},
+    ]
+    assert result.board_data == {27: {'player': 'black', 'class': 'man'}}
+    assert result.forfeited_by is None
+
+
+def test_play_match_timeout_forfeits():
+    board = Board()
+    board.add_piece(28, Player.WHITE, PieceClass.MAN)
+    board.add_piece(13, Player.BLACK, PieceClass.MAN)
+    with MatchServer(move_time_limit=0.05, executor=ThreadPoolExecutor(max_workers=1)) as server:
+        result = asyncio.run(server.play_match(SlowClient(), LocalClient(first_move_strategy), board=board))
+    assert result.game_over_reason == GameOverReason.BLACK_WON
+    assert result.forfeited_by == Player.WHITE
+    assert result.forfeit_reason == ForfeitReason.TIMEOUT
+
+
+def test_play_match_local_client_timeout_forfeits():
+    board = Board()
+    board.add_piece(28, Player.WHITE, PieceClass.MAN)
+    board.add_piece(13, Player.BLACK, PieceClass.MAN)
+    with MatchServer(move_time_limit=0.05, executor=ThreadPoolExecutor(max_workers=1)) as server:
+        white_client = LocalClient(slow_strategy)
+        result = asyncio.run(server.play_match(white_client, LocalClient(first_move_strategy), board=board))
+    assert result.forfeited_by == Player.WHITE
+    assert result.forfeit_reason == ForfeitReason.TIMEOUT
+
+
+def test_client_crash_only_ends_its_own_match():
+    client = LocalClient(first_move_strategy)
+    with MatchServer(max_plies=4, executor=ThreadPoolExecutor(max_workers=1)) as server:
+        results = asyncio.run(server.play_matches([(CrashingClient(), client), (client, client)]))
+    assert results[0].game_over_reason == GameOverReason.BLACK_WON
+    assert results[0].forfeited_by == Player.WHITE
+    assert results[0].forfeit_reason == ForfeitReason.CLIENT_ERROR
+    assert results[1].game_over_reason == GameOverReason.DRAW
+    assert len(results[1].moves) == 4
+
+
+def test_play_match_illegal_move_forfeits():
+    board = Board()
+    board.add_piece(28, Player.WHITE, PieceClass.MAN)
+    board.add_piece(13, Player.BLACK, PieceClass.MAN)
+    with MatchServer(executor=ThreadPoolExecutor(max_workers=1)) as server:
+        result = asyncio.run(server.play_match(
+            LocalClient(lambda board, player: ForwardMove(28, 22)),
+            IllegalMoveClient(),
+            board=board,
+        ))
+    assert result.game_over_reason == GameOverReason.WHITE_WON
+    assert result.forfeited_by == Player.BLACK
+    assert result.forfeit_reason == ForfeitReason.ILLEGAL_MOVE
+
+
+def test_play_many_concurrent_matches():
+    client = LocalClient(first_move_strategy)
+    executor = ThreadPoolExecutor(max_workers=4)
+    with MatchServer(max_plies=6, max_concurrent_matches=50, executor=executor) as server:
+        results = asyncio.run(server.play_matches([(client, client)] * 200))
+    assert len(results) == 200
+    assert all(result.game_over_reason == GameOverReason.DRAW for result in results)
+    assert all(result.moves == results[0].moves for result in results)
+
+
+def test_play_match_from_starting_position_respects_ply_limit():
+    client = LocalClient(first_move_strategy)
+    with MatchServer(max_plies=10, executor=ThreadPoolExecutor(max_workers=1)) as server:
+        result = asyncio.run(server.play_match(client, client))
+    assert result.game_over_reason == GameOverReason.DRAW
+    assert len(result.moves) == 10
+
+
+def test_concurrent_local_matches_do_not_time_out(starting_board):
+    # Together, the first moves of all matches take much longer than the time limit.
+    client = LocalClient(busy_strategy, max_workers=2)
+    with MatchServer(move_time_limit=0.2, max_plies=2, executor=ThreadPoolExecutor(max_workers=2)) as server:
+        results = asyncio.run(server.play_matches([(client, client)] * 40))
+    client.close()
+    assert [result.forfeit_reason for result in results] == [None] * 40
+    assert all(len(result.moves) == 2 for result in results)
+
+
+def test_play_match_king_shuffling_ends_by_draw_rules():
+    board = Board()
+    board.add_piece(47, Player.WHITE, PieceClass.KING)
+    board.add_piece(48, Player.WHITE, PieceClass.KING)
+    board.add_piece(3, Player.BLACK, PieceClass.KING)
+    board.add_piece(4, Player.BLACK, PieceClass.KING)
+    client = LocalClient(king_shuffle_strategy)
+    with MatchServer(executor=ThreadPoolExecutor(max_workers=1)) as server:
+        result = asyncio.run(server.play_match(client, client, board=board))
+    assert result.game_over_reason == GameOverReason.DRAW
+    assert result.draw_rule == DrawRule.REPETITION
+    assert len(result.moves) == 8
+
+
+def test_malformed_move_forfeits():
+    with MatchServer(executor=ThreadPoolExecutor(max_workers=1)) as server:
+        result = asyncio.run(server.play_match(MalformedMoveClient(), LocalClient(first_move_strategy)))
+    assert result.forfeited_by == Player.WHITE
+    assert result.forfeit_reason == ForfeitReason.CLIENT_ERROR
+
+
+def test_rule_check_failure_not_blamed_on_client():
+    client = LocalClient(first_move_strategy)
+    with MatchServer(executor=FailingRulesExecutor(max_workers=1)) as server:
+        with pytest.raises(RuntimeError):
+            asyncio.run(server.play_match(client, client))
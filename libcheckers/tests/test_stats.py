@@ -0,0 +1,125 @@
+import json
+import threading
+
+import pytest
+
+from libcheckers import InvalidMoveException, movement
+from libcheckers.enum import Player
+from libcheckers.movement import Board, ForwardMove
+from libcheckers.serialization import load_board, save_board
+from libcheckers.stats import (
+    APPLY,
+    CAPTURE_SEARCH,
+    CATEGORIES,
+    CHECK_GAME_OVER,
+    FREE_MOVES,
+    SERIALIZATION,
+    Stats,
+    get_active_stats,
+    merge_stats,
+)
+
+
+def test_stats_records_library_calls(starting_board, insane_king_combo_board):
+    with Stats() as stats:
+        assert get_active_stats() is stats
+        starting_board.get_available_moves(Player.WHITE)
+        insane_king_combo_board.get_available_moves(Player.WHITE)
+        ForwardMove(32, 28).apply(starting_board)
+        load_board(save_board(starting_board))
+    assert get_active_stats() is None
+
+    assert stats.calls[FREE_MOVES] == 1
+    assert stats.calls[CAPTURE_SEARCH] >= 1
+    assert stats.calls[APPLY] == 1
+    assert stats.calls[SERIALIZATION] == 2
+    assert stats.calls[CHECK_GAME_OVER] == 0
+    assert all(stats.time[category] >= 0.0 for category in CATEGORIES)
+
+
+def test_stats_python_movegen_split(starting_board, insane_king_combo_board):
+    with Stats() as stats:
+        starting_board.get_available_moves_python(Player.WHITE)
+    assert (stats.calls[CAPTURE_SEARCH], stats.calls[FREE_MOVES]) == (1, 1)
+
+    with Stats() as stats:
+        insane_king_combo_board.get_available_moves_python(Player.WHITE)
+    assert (stats.calls[CAPTURE_SEARCH], stats.calls[FREE_MOVES], stats.calls[APPLY]) == (1, 0, 0)
+
+
+def test_stats_counts_outermost_calls_only(middlegame_board):
+    with Stats() as stats:
+        middlegame_board.check_game_over(Player.WHITE)
+    assert stats.calls[CHECK_GAME_OVER] == 1
+    assert stats.calls[FREE_MOVES] == stats.calls[CAPTURE_SEARCH] == 0
+
+
+class FailingMoveGenerator(object):
+    @staticmethod
+    def generate_moves(owner, piece_class, player):
+        raise RuntimeError('Move generator failed')
+
+
+def test_stats_survive_exceptions(monkeypatch, starting_board):
+    def fail(board, index):
+        raise RuntimeError('Free movement failed')
+
+    with Stats() as stats:
+        with pytest.raises(InvalidMoveException):
+            ForwardMove(32, 37).apply(starting_board)
+        ForwardMove(32, 28).apply(starting_board)
+
+        with monkeypatch.context() as patch:
+            patch.setattr(movement, 'native_movegen', FailingMoveGenerator())
+            with pytest.raises(RuntimeError):
+                starting_board.get_available_moves_native(Player.WHITE)
+        with monkeypatch.context() as patch:
+            patch.setattr(Board, 'get_free_movement_destinations', fail)
+            with pytest.raises(RuntimeError):
+                starting_board.get_available_moves_python(Player.WHITE)
+
+        # The failed calls are recorded, and later calls are not mistaken for nested ones.
+        assert stats.calls[FREE_MOVES] == 2
+        starting_board.get_available_moves_python(Player.WHITE)
+    assert stats.calls[APPLY] == 2
+    assert stats.calls[FREE_MOVES] == 3
+
+
+def test_stats_are_thread_local(starting_board):
+    thread_stats = []
+
+    def worker():
+        thread_stats.append(get_active_stats())
+        starting_board.get_available_moves(Player.WHITE)
+
+    with Stats() as stats:
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+    assert thread_stats == [None]
+    assert stats.calls[FREE_MOVES] == 0
+
+
+def test_stats_per_move_and_per_game(starting_board):
+    game_stats = Stats()
+    board, player = starting_board, Player.WHITE
+    for _ in range(4):
+        with Stats() as move_stats:
+            board = board.get_available_moves(player)[0].apply(board)
+        assert move_stats.calls[APPLY] == 1
+        game_stats.merge(move_stats)
+        player = Player.BLACK if player == Player.WHITE else Player.WHITE
+    assert game_stats.calls[APPLY] == 4
+
+
+def test_stats_export_and_merge(starting_board):
+    with Stats() as stats:
+        starting_board.check_game_over(Player.WHITE)
+    exported = json.loads(stats.to_json())
+    assert exported[CHECK_GAME_OVER]['calls'] == 1
+
+    merged = merge_stats([stats, exported, Stats.from_dict(exported)])
+    assert merged.calls[CHECK_GAME_OVER] == 3
+    assert merged.time[CHECK_GAME_OVER] == pytest.approx(3 * stats.time[CHECK_GAME_OVER])
+    assert merged.total_time == pytest.approx(3 * stats.total_time)
+    assert CHECK_GAME_OVER in merged.format()
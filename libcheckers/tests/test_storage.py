@@ -0,0 +1,144 @@
+from array import array
+
+import pytest
+
+from libcheckers.enum import Player, PieceClass
+from libcheckers.generator import RandomPositionGenerator
+from libcheckers.movement import Board
+from libcheckers.perft import perft
+from libcheckers.serialization import load_board, save_board, load_board_binary, save_board_binary
+from libcheckers.storage import (
+    LIST_STORAGE,
+    ARRAY_STORAGE,
+    NUMPY_STORAGE,
+    copy_plane,
+    create_plane,
+    get_board_size,
+    get_empty_value,
+    get_memory_report,
+)
+
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+requires_numpy = pytest.mark.skipif(numpy is None, reason='NumPy is not installed')
+
+storage_types = [
+    ARRAY_STORAGE,
+    pytest.param(NUMPY_STORAGE, marks=requires_numpy),
+]
+
+
+def convert_board(board, storage):
+    return load_board_binary(save_board_binary(board), storage)
+
+
+def test_create_plane():
+    assert create_plane(LIST_STORAGE) == [None] * 51
+    assert create_plane(ARRAY_STORAGE) == array('b', [0] * 51)
+    assert create_plane(ARRAY_STORAGE, [None, 1, 2] + [None] * 48)[:3] == array('b', [0, 1, 2])
+    assert create_plane(LIST_STORAGE, array('b', [0, 1, 0]))[:3] == [None, 1, None]
+    assert get_empty_value(LIST_STORAGE) is None
+    assert get_empty_value(ARRAY_STORAGE) == 0
+    with pytest.raises(ValueError):
+        create_plane('tape')
+
+
+def test_memory_report():
+    report = get_memory_report([LIST_STORAGE, ARRAY_STORAGE])
+    assert report[LIST_STORAGE]['savings'] == 0
+    assert report[ARRAY_STORAGE]['plane_bytes_per_board'] < report[LIST_STORAGE]['plane_bytes_per_board'] / 2
+    assert report[ARRAY_STORAGE]['bytes_per_board'] < report[LIST_STORAGE]['bytes_per_board'] / 2
+    assert report[ARRAY_STORAGE]['savings'] > 0.5
+    assert report[ARRAY_STORAGE]['megabytes_per_million_boards'] == pytest.approx(
+        report[ARRAY_STORAGE]['bytes_per_board'] / 1.048576
+    )
+
+
+def test_memory_report_counts_piece_lists(starting_board):
+    report = get_memory_report([LIST_STORAGE, ARRAY_STORAGE])
+    assert get_board_size(starting_board) == report[LIST_STORAGE]['bytes_per_board']
+    assert report[LIST_STORAGE]['bytes_per_board'] > report[LIST_STORAGE]['plane_bytes_per_board']
+
+    # The piece lists are bit masks, so they are small next to the planes even in compact storage.
+    list_report, array_report = report[LIST_STORAGE], report[ARRAY_STORAGE]
+    piece_list_bytes = list_report['bytes_per_board'] - list_report['plane_bytes_per_board']
+    assert piece_list_bytes < array_report['plane_bytes_per_board']
+
+
+@requires_numpy
+def test_memory_report_numpy():
+    report = get_memory_report()
+    assert report[NUMPY_STORAGE]['plane_bytes_per_board'] < report[LIST_STORAGE]['plane_bytes_per_board']
+    assert report[NUMPY_STORAGE]['bytes_per_board'] > report[NUMPY_STORAGE]['plane_bytes_per_board']
+
+
+@pytest.mark.parametrize('storage', storage_types)
+def test_board_storage_basic_operations(storage):
+    board = Board(storage)
+    assert board.owner[10] == 0
+    board.add_piece(10, Player.BLACK, PieceClass.MAN)
+    board.move_piece(10, 15)
+    assert board.owner[10] == 0
+    assert board.piece_class[10] == 0
+    assert board.owner[15] == Player.BLACK
+    board.remove_piece(15)
+    assert board.get_piece_count(Player.BLACK) == 0
+    assert not board.owner[15]
+
+
+@pytest.mark.parametrize('storage', storage_types)
+def test_perft_with_storage(starting_board, storage):
+    board = convert_board(starting_board, storage)
+    assert perft(board, Player.WHITE, 3) == 658
+    assert perft(board, Player.WHITE, 3, Board.get_available_moves_python) == 658
+
+
+@pytest.mark.parametrize('storage', storage_types)
+def test_random_games_with_storage(storage):
+    generator = RandomPositionGenerator(seed=21)
+    for _ in range(20):
+        list_board = generator.random_placement(king_probability=0.3)
+        board = convert_board(list_board, storage)
+        assert board.position_hash == list_board.position_hash
+        for player in (Player.WHITE, Player.BLACK):
+            moves = board.get_available_moves(player)
+            assert moves == list_board.get_available_moves(player)
+            assert board.get_available_moves_python(player) == list_board.get_available_moves_python(player)
+            assert board.check_game_over(player) == list_board.check_game_over(player)
+            for move in moves:
+                new_board = move.apply(board)
+                assert new_board.storage == storage
+                assert save_board(new_board) == save_board(move.apply(list_board))
+
+
+@pytest.mark.parametrize('storage', storage_types)
+def test_serialization_with_storage(insane_king_combo_board, storage):
+    board = load_board(save_board(insane_king_combo_board), storage)
+    assert board.storage == storage
+    assert save_board(board) == save_board(insane_king_combo_board)
+    assert save_board_binary(board) == save_board_binary(insane_king_combo_board)
+
+
+def test_frozen_array_board(middlegame_board):
+    board = convert_board(middlegame_board, ARRAY_STORAGE)
+    mutable_board = board.freeze().clone()
+    assert mutable_board.storage == ARRAY_STORAGE
+    assert mutable_board.owner == board.owner
+
+
+@pytest.mark.parametrize('storage', [LIST_STORAGE] + storage_types)
+def test_clone_copies_planes(insane_king_combo_board, storage):
+    board = convert_board(insane_king_combo_board, storage)
+    plane_copy = copy_plane(storage, board.owner)
+    clone = board.clone()
+    clone.remove_piece(1)
+    assert board.owner[1] == Player.WHITE
+    assert plane_copy[1] == Player.WHITE
+    assert clone.storage == storage
+    assert clone.get_player_squares(Player.WHITE) == [40, 48]
+    assert board.get_player_squares(Player.WHITE) == [1, 40, 48]
@@ -0,0 +1,105 @@
+from libcheckers import BoardConfig
+from libcheckers.enum import Player, PieceClass, GameOverReason
+from libcheckers.generator import RandomPositionGenerator
+from libcheckers.movement import Board, ForwardMove, CaptureMove, ComboCaptureMove
+from libcheckers.symmetry import (
+    rotation_table,
+    flip_board,
+    flip_move,
+    flip_player,
+    canonicalize,
+    canonicalize_move,
+    decanonicalize,
+)
+
+
+def normalize_moves(moves):
+    return sorted(repr(move) for move in moves)
+
+
+def test_rotation_table():
+    assert rotation_table[0] == 0
+    for index in range(1, BoardConfig.total_squares + 1):
+        assert rotation_table[index] == BoardConfig.total_squares + 1 - index
+        assert rotation_table[rotation_table[index]] == index
+
+
+def test_flip_starting_board(starting_board):
+    flipped_board = flip_board(starting_board)
+    assert flipped_board.owner == starting_board.owner
+    assert flipped_board.piece_class == starting_board.piece_class
+    assert flipped_board.position_hash == starting_board.position_hash
+
+
+def test_flip_board_is_involution(insane_king_combo_board):
+    board = insane_king_combo_board
+    flipped_board = flip_board(board)
+    assert flipped_board.owner[50] == Player.BLACK
+    assert flipped_board.piece_class[50] == PieceClass.KING
+    assert flipped_board.owner[11] == Player.BLACK
+    assert flipped_board.owner[44] == Player.WHITE
+    assert flipped_board.get_king_count(Player.BLACK) == 1
+
+    restored_board = flip_board(flipped_board)
+    assert restored_board.owner == board.owner
+    assert restored_board.piece_class == board.piece_class
+    assert restored_board.position_hash == board.position_hash
+
+
+def test_flip_move():
+    assert flip_move(ForwardMove(32, 28)) == ForwardMove(19, 23)
+    assert flip_move(CaptureMove(28, 19)) == CaptureMove(23, 32)
+    assert flip_move(ComboCaptureMove([CaptureMove(28, 19), CaptureMove(19, 10)])) == ComboCaptureMove([
+        CaptureMove(23, 32),
+        CaptureMove(32, 41),
+    ])
+
+
+def test_flipped_moves_match_generated_moves():
+    generator = RandomPositionGenerator(seed=5)
+    boards = [generator.random_game_position(0, 100)[0] for _ in range(30)]
+    boards += [generator.random_placement(king_probability=0.5) for _ in range(30)]
+
+    for board in boards:
+        flipped_board = flip_board(board)
+        for player in (Player.WHITE, Player.BLACK):
+            moves = board.get_available_moves(player)
+            flipped_moves = flipped_board.get_available_moves(flip_player(player))
+            assert normalize_moves(flip_move(move) for move in moves) == normalize_moves(flipped_moves)
+
+            # Applying a move and flipping the result gives the same board as the other way around.
+            for move in moves[:3]:
+                expected_board = flip_board(move.apply(board))
+                actual_board = flip_move(move).apply(flipped_board)
+                assert actual_board.owner == expected_board.owner
+                assert actual_board.piece_class == expected_board.piece_class
+
+
+def test_flip_preserves_game_over(one_vs_one_men_cornered_board):
+    board = one_vs_one_men_cornered_board
+    flipped_board = flip_board(board)
+    assert board.check_game_over(Player.BLACK) == GameOverReason.WHITE_WON
+    assert flipped_board.check_game_over(Player.WHITE) == GameOverReason.BLACK_WON
+
+
+def test_canonicalize(middlegame_board):
+    board, is_flipped = canonicalize(middlegame_board, Player.WHITE)
+    assert board is middlegame_board
+    assert not is_flipped
+
+    black_to_move_board = flip_board(middlegame_board)
+    board, is_flipped = canonicalize(black_to_move_board, Player.BLACK)
+    assert is_flipped
+    assert board.owner == middlegame_board.owner
+    assert decanonicalize(board, is_flipped).owner == black_to_move_board.owner
+
+    move = board.get_available_moves(Player.WHITE)[0]
+    original_move = canonicalize_move(move, is_flipped)
+    assert original_move in black_to_move_board.get_available_moves(Player.BLACK)
+    assert canonicalize_move(original_move, is_flipped) == move
+
+
+def test_flip_empty_board():
+    board = flip_board(Board())
+    assert board.get_piece_count(Player.WHITE) == 0
+    assert board.get_piece_count(Player.BLACK) == 0
@@ -0,0 +1,184 @@
+import random
+import time
+
+import pytest
+
+from libcheckers.enum import Player
+from libcheckers.movement import ForwardMove
+from libcheckers.tournament import (
+    Tournament,
+    compute_ratings,
+    compute_standings,
+    create_round_robin_pairings,
+    format_standings,
+    load_results,
+    load_strategy,
+    play_match,
+)
+
+
+def first_move_bot(board, player):
+    return board.get_available_moves(player)[0]
+
+
+def last_move_bot(board, player):
+    return board.get_available_moves(player)[-1]
+
+
+def random_bot(board, player):
+    moves = board.get_available_moves(player)
+    return random.Random(board.position_hash).choice(moves)
+
+
+def slow_bot(board, player):
+    time.sleep(0.5)
+    return first_move_bot(board, player)
+
+
+def hanging_bot(board, player):
+    while True:
+        pass
+
+
+def crashing_bot(board, player):
+    raise RuntimeError('Bot crashed')
+
+
+def illegal_move_bot(board, player):
+    return ForwardMove(1, 2)
+
+
+def tampering_bot(board, player):
+    # Modifying the board it was given must not affect the game.
+    move = first_move_bot(board, player)
+    for index in board.get_player_squares(Player.BLACK if player == Player.WHITE else Player.WHITE):
+        board.remove_piece(index)
+    return move
+
+
+def test_round_robin_pairings():
+    pairings = create_round_robin_pairings(['a', 'b', 'c'], rounds=2)
+    assert len(pairings) == 12
+    assert pairings.count(('a', 'b')) == 2
+    assert pairings.count(('b', 'a')) == 2
+    assert ('a', 'a') not in pairings
+
+
+def test_load_strategy():
+    assert load_strategy('libcheckers.tests.test_tournament:first_move_bot') is first_move_bot
+    with pytest.raises(ValueError):
+        load_strategy('libcheckers.tests.test_tournament')
+
+
+def test_play_match_completes():
+    result = play_match(0, 'first', 'random', first_move_bot, random_bot, max_plies=300)
+    assert result['result'] in ('white_won', 'black_won', 'draw')
+    assert result['forfeit_reason'] is None
+    assert result['plies'] == len(result['moves'])
+    assert result['bot_moves']['first'] + result['bot_moves']['random'] == result['plies']
+    assert result['bot_time']['first'] >= 0.0
+    assert len(result['move_stats']) == result['plies']
+    assert all(move['library_time'] <= move['time'] for move in result['move_stats'])
+    assert result['bot_stats']['random']['free_moves']['calls'] + \
+        result['bot_stats']['random']['capture_search']['calls'] >= result['bot_moves']['random']
+    assert result['arbiter_stats']['check_game_over']['calls'] == result['plies']
+
+
+def test_play_match_board_tampering():
+    result = play_match(0, 'tamper', 'first', tampering_bot, first_move_bot, max_plies=20)
+    assert result['forfeit_reason'] is None
+    assert result['plies'] == 20
+    assert result['result'] == 'draw'
+
+
+def test_play_match_max_plies():
+    result = play_match(0, 'first', 'last', first_move_bot, last_move_bot, max_plies=10)
+    assert result['plies'] <= 10
+    if result['plies'] == 10:
+        assert result['result'] == 'draw'
+
+
+@pytest.mark.parametrize('strategy, move_time_limit, forfeit_reason', [
+    (crashing_bot, None, 'client_error'),
+    (crashing_bot, 0.2, 'client_error'),
+    (slow_bot, 0.2, 'timeout'),
+    (hanging_bot, 0.2, 'timeout'),
+    (illegal_move_bot, None, 'illegal_move'),
+    (illegal_move_bot, 0.2, 'illegal_move'),
+])
+def test_play_match_forfeits(strategy, move_time_limit, forfeit_reason):
+    start_time = time.perf_counter()
+    result = play_match(0, 'bad', 'good', strategy, first_move_bot, move_time_limit=move_time_limit)
+    assert result['result'] == 'black_won'
+    assert result['forfeited_by'] == 'white'
+    assert result['forfeit_reason'] == forfeit_reason
+    assert result['plies'] == 0
+    assert time.perf_counter() - start_time < 5
+
+
+def test_play_match_in_bot_processes():
+    result = play_match(0, 'first', 'random', first_move_bot, random_bot, move_time_limit=5, max_plies=20)
+    assert result['forfeit_reason'] is None
+    assert result['plies'] == 20
+    assert result['bot_moves'] == {'first': 10, 'random': 10}
+    assert result['bot_stats']['random']['free_moves']['calls'] + \
+        result['bot_stats']['random']['capture_search']['calls'] >= 10
+    in_process_result = play_match(0, 'first', 'random', first_move_bot, random_bot, max_plies=20)
+    assert result['moves'] == in_process_result['moves']
+
+
+def test_tournament_hanging_bot_does_not_stall(tmpdir):
+    path = str(tmpdir.join('results.jsonl'))
+    bots = {'first': first_move_bot, 'hang': hanging_bot}
+    results = Tournament(bots, path, move_time_limit=0.2, max_plies=20, workers=1).run()
+    assert len(results) == 2
+    assert all(result['forfeit_reason'] == 'timeout' for result in results)
+
+
+def test_tournament_resumes(tmpdir):
+    path = str(tmpdir.join('results.jsonl'))
+    bots = {'first': first_move_bot, 'random': random_bot, 'crash': crashing_bot}
+    pairings = create_round_robin_pairings(sorted(bots))
+
+    # Simulate a crash after two matches, with a half-written third line.
+    Tournament(bots, path, max_plies=100, workers=0).run(pairings[:2])
+    with open(path, 'a') as results_file:
+        results_file.write('{"match_id": 2, "wh')
+
+    new_results = []
+    results = Tournament(bots, path, max_plies=100, workers=2).run(pairings, on_result=new_results.append)
+    assert [result['match_id'] for result in results] == list(range(6))
+    assert sorted(result['match_id'] for result in new_results) == [2, 3, 4, 5]
+    assert len(load_results(path)) == 6
+
+    ratings = compute_ratings(results)
+    standings = compute_standings(results, ratings)
+    crash_row = [row for row in standings if row['name'] == 'crash'][0]
+    assert crash_row['losses'] == crash_row['forfeits'] == 4
+    assert standings[-1]['name'] == 'crash'
+    assert ratings['crash'] < 1500 < max(ratings.values())
+    assert sum(row['points'] for row in standings) == 2 * len(results)
+    assert 'crash' in format_standings(standings)
+
+    with pytest.raises(ValueError):
+        Tournament(bots, path, workers=0).run(list(reversed(pairings)))
+
+
+def test_ratings_and_standings():
+    bot_stats = {'a': {'apply': {'calls': 1, 'time': 0.5}}, 'b': {}}
+    results = [
+        {'match_id': 0, 'white': 'a', 'black': 'b', 'result': 'white_won', 'forfeited_by': None,
+         'bot_time': {'a': 1.0, 'b': 2.0}, 'bot_moves': {'a': 10, 'b': 10}, 'bot_stats': bot_stats},
+        {'match_id': 1, 'white': 'b', 'black': 'a', 'result': 'draw', 'forfeited_by': None,
+         'bot_time': {'a': 1.0, 'b': 2.0}, 'bot_moves': {'a': 10, 'b': 10}, 'bot_stats': bot_stats},
+    ]
+    ratings = compute_ratings(results)
+    assert ratings['a'] > 1500 > ratings['b']
+    assert ratings['a'] + ratings['b'] == pytest.approx(3000)
+
+    standings = compute_standings(results, ratings)
+    assert [row['name'] for row in standings] == ['a', 'b']
+    assert (standings[0]['points'], standings[0]['wins'], standings[0]['draws']) == (3, 1, 1)
+    assert standings[1]['time'] == pytest.approx(4.0)
+    assert standings[1]['time_per_move'] == pytest.approx(0.2)
+    assert standings[0]['library_time'] == pytest.approx(1.0)
@@ -1,8 +1,16 @@
+from libcheckers.enum import Player, PieceClass
 from libcheckers.utils import (
     index_to_coords,
     coords_to_index,
+    free_move_rays,
     get_indexes_between,
     get_lines_of_sight,
+    get_mask_count,
+    get_mask_indexes,
+    get_opponent,
+    is_black_home_row,
+    is_white_home_row,
+    promotion_masks,
 )
 
 
@@ -86,3 +94,30 @@ def test_get_lines_of_sight_edge_limited():
         [],
         [],
     ]
+
+
+def test_free_move_rays():
+    assert free_move_rays[Player.WHITE, PieceClass.MAN][33] == [[28], [29]]
+    assert free_move_rays[Player.BLACK, PieceClass.MAN][33] == [[38], [39]]
+    assert free_move_rays[Player.WHITE, PieceClass.MAN][6] == [[1]]
+    assert free_move_rays[Player.BLACK, PieceClass.MAN][46] == []
+    for player in (Player.WHITE, Player.BLACK):
+        assert free_move_rays[player, PieceClass.KING][33] == get_lines_of_sight(33, visibility_range=10)
+
+
+def test_promotion_masks():
+    for index in range(1, 51):
+        assert bool(promotion_masks[Player.WHITE] >> index & 1) == is_black_home_row(index)
+        assert bool(promotion_masks[Player.BLACK] >> index & 1) == is_white_home_row(index)
+
+
+def test_get_opponent():
+    assert get_opponent(Player.WHITE) == Player.BLACK
+    assert get_opponent(Player.BLACK) == Player.WHITE
+
+
+def test_get_mask_indexes():
+    assert get_mask_indexes(0) == []
+    assert get_mask_indexes(1 << 1 | 1 << 27 | 1 << 50) == [1, 27, 50]
+    assert get_mask_count(0) == 0
+    assert get_mask_count(1 << 1 | 1 << 27 | 1 << 50) == 3
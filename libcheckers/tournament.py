@@ -0,0 +1,529 @@
+import argparse
+import json
+import os
+import sys
+from importlib import import_module
+from time import perf_counter
+
+from libcheckers.arbiter import DEFAULT_MAX_PLIES, MatchArbiter, is_legal_move
+from libcheckers.enum import Player, ForfeitReason
+from libcheckers.game import Game
+from libcheckers.generator import create_starting_board
+from libcheckers.serialization import save_board, save_move, save_player, save_game_over_reason
+from libcheckers.stats import Stats, merge_stats
+
+
+# International draughts scoring: 2 points for a win, 1 for a draw.
+WIN_POINTS = 2
+DRAW_POINTS = 1
+
+# How long a bot process may take to exit after the match before it is killed.
+_BOT_PROCESS_EXIT_TIMEOUT = 1.0
+
+INITIAL_RATING = 1500.0
+DEFAULT_K_FACTOR = 32.0
+
+
+def create_round_robin_pairings(bot_names, rounds=1):
+    """
+    Get the pairings of a round-robin tournament in which every bot plays every other bot
+    once with each color per round.
+
+    Returns
+    -------
+    list
+        A list of (white bot name, black bot name) tuples.
+    """
+
+    return [
+        (white, black)
+        for _ in range(rounds)
+        for white in bot_names
+        for black in bot_names
+        if white != black
+    ]
+
+
+def load_strategy(spec):
+    """
+    Import a strategy function from a 'module:function' specification.
+    """
+
+    module_name, _, function_name = spec.partition(':')
+    if not function_name:
+        raise ValueError('Strategy must be specified as module:function, got {0!r}'.format(spec))
+    return getattr(import_module(module_name), function_name)
+
+
+def _choose_move(strategy, board, player):
+    """
+    Call a strategy, timing it and collecting the statistics of its library calls.
+
+    Returns
+    -------
+    tuple
+        A 4-tuple: (move or None, whether the strategy raised an exception, seconds spent,
+        `Stats.to_dict` export).
+    """
+
+    with Stats() as stats:
+        start_time = perf_counter()
+        try:
+            move = strategy(board, player)
+            is_crashed = False
+        except Exception:
+            move = None
+            is_crashed = True
+        move_time = perf_counter() - start_time
+    return move, is_crashed, move_time, stats.to_dict()
+
+
+def _serve_bot(connection, strategy):
+    # The main loop of a bot process: answer move requests until the match is over.
+    while True:
+        request = connection.recv()
+        if request is None:
+            return
+        board, player = request
+        connection.send(_choose_move(strategy, board, player))
+
+
+class _BotProcess(object):
+    """
+    Runs a strategy in a child process for the duration of a match, so that a move that exceeds
+    the time limit can be stopped instead of blocking the match.
+    """
+
+    def __init__(self, strategy):
+        # Imported here to keep multiprocessing out of the import path of single-process users.
+        import multiprocessing
+
+        self._connection, child_connection = multiprocessing.Pipe()
+        self._process = multiprocessing.Process(target=_serve_bot, args=(child_connection, strategy))
+        self._process.daemon = True
+        self._process.start()
+        child_connection.close()
+
+    def request_move(self, board, player, time_limit):
+        """
+        Ask the bot for a move, waiting at most `time_limit` seconds.
+
+        Returns
+        -------
+        tuple or None
+            The result of `_choose_move`, or None if the bot did not respond in time
+            (the process is then stopped).
+        """
+
+        start_time = perf_counter()
+        try:
+            self._connection.send((board, player))
+            if self._connection.poll(max(0.0, time_limit - (perf_counter() - start_time))):
+                return self._connection.recv()
+        except (EOFError, OSError):
+            # The bot process died, e.g. because its move could not be sent back.
+            return None, True, perf_counter() - start_time, {}
+
+        self._process.kill()
+        self._process.join()
+        return None
+
+    def close(self):
+        if self._process.is_alive():
+            try:
+                self._connection.send(None)
+            except OSError:
+                pass
+            self._process.join(_BOT_PROCESS_EXIT_TIMEOUT)
+        if self._process.is_alive():
+            self._process.kill()
+            self._process.join()
+        self._connection.close()
+
+
+def play_match(match_id, white, black, white_strategy, black_strategy,
+               move_time_limit=None, max_plies=DEFAULT_MAX_PLIES):
+    """
+    Play a single match between two strategies. Intended to run in a worker process.
+
+    Strategies are called with a copy of the board, so they cannot tamper with the game.
+    With a move time limit, each bot runs in a child process of its own, which is stopped as soon as
+    a move exceeds the limit: the bot forfeits the match, even if its strategy never returns.
+    Without a limit, the strategies are called in this process.
+
+    The time every bot spends in library calls (see `libcheckers.stats`) is recorded per move and per match,
+    separately from the time the arbiter spends validating and applying the moves, so that a slow move
+    can be attributed either to the bot or to the library.
+
+    Parameters
+    ----------
+    match_id : int
+        The number of the match in the pairings list.
+    white, black : str
+        The names of the bots.
+    white_strategy, black_strategy : callable
+        Functions that accept (board, player) and return a move object.
+    move_time_limit : float, optional
+        Maximum number of seconds a bot may spend on a move.
+    max_plies : int
+        The match is declared a draw after this many plies.
+
+    Returns
+    -------
+    dict
+        A JSON-serializable match result.
+    """
+
+    names = {Player.WHITE: white, Player.BLACK: black}
+    strategies = {Player.WHITE: white_strategy, Player.BLACK: black_strategy}
+    bot_time = {white: 0.0, black: 0.0}
+    bot_moves = {white: 0, black: 0}
+    bot_stats = {white: Stats(), black: Stats()}
+    arbiter_stats = Stats()
+    move_stats = []
+
+    game = Game(create_starting_board())
+    arbiter = MatchArbiter(game.get_player_to_move(), max_plies)
+    arbiter.start(game.check_game_over())
+    start_time = perf_counter()
+
+    bot_processes = {}
+    if move_time_limit is not None:
+        bot_processes = dict((player, _BotProcess(strategy)) for player, strategy in strategies.items())
+
+    try:
+        while not arbiter.is_over:
+            player = arbiter.player
+            name = names[player]
+            if move_time_limit is None:
+                response = _choose_move(strategies[player], game.board.clone(), player)
+            else:
+                response = bot_processes[player].request_move(game.board, player, move_time_limit)
+
+            bot_moves[name] += 1
+            if response is None:
+                bot_time[name] += move_time_limit
+                move_stats.append({'time': move_time_limit, 'library_time': 0.0})
+                arbiter.forfeit(ForfeitReason.TIMEOUT)
+                continue
+
+            move, is_crashed, move_time, stats = response
+            bot_time[name] += move_time
+            bot_stats[name].merge(stats)
+            move_stats.append({'time': move_time, 'library_time': Stats.from_dict(stats).total_time})
+            if is_crashed:
+                arbiter.forfeit(ForfeitReason.CLIENT_ERROR)
+                continue
+
+            game_over_reason = None
+            with arbiter_stats:
+                is_legal = is_legal_move(game.board, player, move)
+                if is_legal:
+                    game.apply_move(move)
+                    game_over_reason = game.check_game_over()
+            arbiter.accept_move(is_legal, game_over_reason)
+    finally:
+        for bot_process in bot_processes.values():
+            bot_process.close()
+
+    return {
+        'match_id': match_id,
+        'white': white,
+        'black': black,
+        'result': save_game_over_reason(arbiter.game_over_reason),
+        'draw_rule': game.draw_rule,
+        'forfeited_by': save_player(arbiter.forfeited_by) if arbiter.forfeited_by else None,
+        'forfeit_reason': arbiter.forfeit_reason,
+        'plies': len(game),
+        'moves': [save_move(move) for move in game.moves],
+        'final_board': save_board(game.board),
+        'bot_time': bot_time,
+        'bot_moves': bot_moves,
+        'bot_stats': dict((bot_name, stats.to_dict()) for bot_name, stats in bot_stats.items()),
+        'arbiter_stats': arbiter_stats.to_dict(),
+        'move_stats': move_stats,
+        'elapsed': perf_counter() - start_time,
+    }
+
+
+def load_results(path):
+    """
+    Load the match results recorded so far. A truncated last line (e.g. after a crash) is ignored.
+    """
+
+    results = []
+    if not os.path.exists(path):
+        return results
+
+    with open(path) as results_file:
+        for line in results_file:
+            try:
+                results.append(json.loads(line))
+            except ValueError:
+                continue
+    return results
+
+
+def _truncate_partial_line(path):
+    # Drop a half-written last line, so that new results start on a line of their own.
+    if not os.path.exists(path):
+        return
+    with open(path, 'rb+') as results_file:
+        data = results_file.read()
+        if data and not data.endswith(b'\n'):
+            results_file.truncate(data.rfind(b'\n') + 1)
+
+
+class Tournament(object):
+    """
+    Plays the matches of a tournament on a process pool, recording every result as soon as
+    the match is finished, so that an interrupted tournament can be resumed where it stopped.
+    """
+
+    def __init__(self, bots, results_path, move_time_limit=None, max_plies=DEFAULT_MAX_PLIES, workers=None):
+        """
+        Parameters
+        ----------
+        bots : dict
+            Strategies by bot name. Strategies are functions that accept (board, player) and return a move.
+            They are sent to the worker processes, so they must be picklable (e.g. module-level functions).
+        results_path : str
+            The JSON Lines file to append the match results to.
+        move_time_limit : float, optional
+            Maximum number of seconds a bot may spend on a move. With a limit, every match starts
+            a child process for each bot (see `play_match`), which guarantees that no match can stall.
+        max_plies : int
+            A match is declared a draw after this many plies.
+        workers : int, optional
+            The number of worker processes. If 0, the matches are played in this process.
+        """
+
+        self.bots = bots
+        self.results_path = results_path
+        self.move_time_limit = move_time_limit
+        self.max_plies = max_plies
+        self.workers = workers
+
+    def _submit_args(self, match_id, white, black):
+        return (
+            match_id, white, black, self.bots[white], self.bots[black], self.move_time_limit, self.max_plies,
+        )
+
+    def run(self, pairings=None, on_result=None):
+        """
+        Play all pairings that do not have a recorded result yet.
+
+        Parameters
+        ----------
+        pairings : list, optional
+            A list of (white bot name, black bot name) tuples. By default, a single round-robin.
+            A resumed tournament must use the same pairings.
+        on_result : callable, optional
+            Called with every new match result as soon as it is recorded.
+
+        Returns
+        -------
+        list
+            The results of all pairings, ordered by match ID.
+        """
+
+        if pairings is None:
+            pairings = create_round_robin_pairings(sorted(self.bots))
+
+        results = {}
+        for result in load_results(self.results_path):
+            match_id = result['match_id']
+            if match_id >= len(pairings) or tuple(pairings[match_id]) != (result['white'], result['black']):
+                msg = 'Recorded match {0} does not match the pairings of this tournament'.format(match_id)
+                raise ValueError(msg)
+            results[match_id] = result
+
+        pending = [
+            (match_id, white, black)
+            for match_id, (white, black) in enumerate(pairings)
+            if match_id not in results
+        ]
+
+        _truncate_partial_line(self.results_path)
+        with open(self.results_path, 'a') as results_file:
+            for result in self._play(pending):
+                results_file.write(json.dumps(result, sort_keys=True) + '\n')
+                results_file.flush()
+                results[result['match_id']] = result
+                if on_result is not None:
+                    on_result(result)
+
+        return [results[match_id] for match_id in sorted(results)]
+
+    def _play(self, pending):
+        if self.workers == 0:
+            for match_id, white, black in pending:
+                yield play_match(*self._submit_args(match_id, white, black))
+            return
+
+        # Imported here to keep multiprocessing out of the import path of single-process users.
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = [
+                executor.submit(play_match, *self._submit_args(match_id, white, black))
+                for match_id, white, black in pending
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+
+
+def _get_scores(result):
+    """
+    Get the scores of the white and the black bot in a match, on a 0 to 1 scale.
+    """
+
+    if result['result'] == 'white_won':
+        return 1.0, 0.0
+    if result['result'] == 'black_won':
+        return 0.0, 1.0
+    return 0.5, 0.5
+
+
+def compute_ratings(results, k_factor=DEFAULT_K_FACTOR, initial_rating=INITIAL_RATING):
+    """
+    Compute the Elo ratings of the bots by processing the match results in the order of their match IDs.
+
+    Returns
+    -------
+    dict
+        Ratings by bot name.
+    """
+
+    ratings = {}
+    for result in sorted(results, key=lambda result: result['match_id']):
+        white_rating = ratings.setdefault(result['white'], initial_rating)
+        black_rating = ratings.setdefault(result['black'], initial_rating)
+        white_expected = 1.0 / (1.0 + 10.0 ** ((black_rating - white_rating) / 400.0))
+        white_score, black_score = _get_scores(result)
+        ratings[result['white']] = white_rating + k_factor * (white_score - white_expected)
+        ratings[result['black']] = black_rating + k_factor * (black_score - (1.0 - white_expected))
+    return ratings
+
+
+def compute_standings(results, ratings=None):
+    """
+    Compute the tournament table: points, wins, draws, losses, forfeits and time usage of every bot,
+    including the part of the time spent in library calls.
+
+    Returns
+    -------
+    list
+        A list of dicts, one per bot, ordered by points (then by rating, if specified).
+    """
+
+    rows = {}
+    for result in results:
+        white_score, black_score = _get_scores(result)
+        sides = (('white', result['white'], white_score), ('black', result['black'], black_score))
+        for color, name, score in sides:
+            row = rows.setdefault(name, {
+                'name': name,
+                'games': 0,
+                'wins': 0,
+                'draws': 0,
+                'losses': 0,
+                'forfeits': 0,
+                'points': 0,
+                'time': 0.0,
+                'moves': 0,
+                'max_match_time': 0.0,
+                'library_time': 0.0,
+            })
+            row['games'] += 1
+            if score == 1.0:
+                row['wins'] += 1
+                row['points'] += WIN_POINTS
+            elif score == 0.5:
+                row['draws'] += 1
+                row['points'] += DRAW_POINTS
+            else:
+                row['losses'] += 1
+            if result['forfeited_by'] == color:
+                row['forfeits'] += 1
+            row['time'] += result['bot_time'][name]
+            row['moves'] += result['bot_moves'][name]
+            row['max_match_time'] = max(row['max_match_time'], result['bot_time'][name])
+            row['library_time'] += Stats.from_dict(result['bot_stats'][name]).total_time
+
+    for row in rows.values():
+        row['time_per_move'] = row['time'] / row['moves'] if row['moves'] else 0.0
+        if ratings is not None:
+            row['rating'] = ratings.get(row['name'], INITIAL_RATING)
+
+    return sorted(
+        rows.values(),
+        key=lambda row: (-row['points'], -row.get('rating', 0.0), row['name']),
+    )
+
+
+def format_standings(standings):
+    """
+    Format the tournament table for display.
+    """
+
+    name_width = max([len('Bot')] + [len(row['name']) for row in standings])
+    header_format = '{0:<{1}}  Pts  Games    W    D    L   FF   Rating   Time (s)  Library (s)  ms/move'
+    row_format = (
+        '{0:<{1}}  {2:>3}  {3:>5}  {4:>3}  {5:>3}  {6:>3}  {7:>3}  {8:>7}  '
+        '{9:>9.2f}  {10:>11.2f}  {11:>7.2f}'
+    )
+
+    lines = [header_format.format('Bot', name_width)]
+    for row in standings:
+        lines.append(row_format.format(
+            row['name'],
+            name_width,
+            row['points'],
+            row['games'],
+            row['wins'],
+            row['draws'],
+            row['losses'],
+            row['forfeits'],
+            '{0:.0f}'.format(row['rating']) if 'rating' in row else '-',
+            row['time'],
+            row['library_time'],
+            row['time_per_move'] * 1000,
+        ))
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run a round-robin tournament between checkers bots.')
+    parser.add_argument('results', help='The JSON Lines file to record the results in. Reused to resume.')
+    parser.add_argument('bots', nargs='+', help='Bots as name=module:function.')
+    parser.add_argument('--rounds', type=int, default=1, help='Every pair plays both colors once per round.')
+    parser.add_argument('--move-time-limit', type=float, default=None, help='Seconds per move.')
+    parser.add_argument('--max-plies', type=int, default=DEFAULT_MAX_PLIES)
+    parser.add_argument('--workers', type=int, default=None, help='The number of worker processes.')
+    args = parser.parse_args(argv)
+
+    bots = {}
+    for bot in args.bots:
+        name, _, spec = bot.partition('=')
+        bots[name] = load_strategy(spec)
+
+    def report(result):
+        sys.stderr.write('Match {0}: {1} vs {2}: {3} in {4} plies\n'.format(
+            result['match_id'],
+            result['white'],
+            result['black'],
+            result['result'],
+            result['plies'],
+        ))
+
+    tournament = Tournament(bots, args.results, args.move_time_limit, args.max_plies, args.workers)
+    results = tournament.run(create_round_robin_pairings(sorted(bots), args.rounds), on_result=report)
+    print(format_standings(compute_standings(results, compute_ratings(results))))
+    print('')
+    print('Arbiter library time:')
+    print(merge_stats(result['arbiter_stats'] for result in results).format())
+
+
+if __name__ == '__main__':
+    main()
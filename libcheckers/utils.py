@@ -1,10 +1,40 @@
 from libcheckers import BoardConfig, InvalidMoveException
+from libcheckers.enum import MoveError, Player, PieceClass
 
 
 # Northwest, Northeast, Southwest, Southeast.
 valid_move_offsets = [(-1, -1), (-1, +1), (+1, -1), (+1, +1)]
 
 
+def _splitmix64(seed):
+    seed = (seed + 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+    seed = ((seed ^ (seed >> 30)) * 0xBF58476D1CE4E5B9) & 0xFFFFFFFFFFFFFFFF
+    seed = ((seed ^ (seed >> 27)) * 0x94D049BB133111EB) & 0xFFFFFFFFFFFFFFFF
+    return seed ^ (seed >> 31)
+
+
+# Pseudorandom 64-bit keys for Zobrist hashing of positions:
+# one key per (square, player, piece class) combination, plus one for the player to move.
+_zobrist_keys = [_splitmix64(i) for i in range((BoardConfig.total_squares + 1) * 4)]
+zobrist_black_to_move_key = _splitmix64(len(_zobrist_keys))
+
+
+def _build_zobrist_piece_keys():
+    piece_keys = [None] * (Player.BLACK * 2 + PieceClass.KING + 1)
+    for player in (Player.WHITE, Player.BLACK):
+        for piece_class in (PieceClass.MAN, PieceClass.KING):
+            piece_keys[player * 2 + piece_class] = [
+                _zobrist_keys[index * 4 + (player - 1) * 2 + (piece_class - 1)]
+                for index in range(BoardConfig.total_squares + 1)
+            ]
+    return piece_keys
+
+
+# The same keys, grouped by piece (player * 2 + piece class), then indexed by square. Unlike arithmetic
+# on a flat index, this also works with the int8 square values of NumPy board storage.
+_zobrist_piece_keys = _build_zobrist_piece_keys()
+
+
 def index_to_coords(index):
     """
     Transform an index in checkers notation to a (row, column) coordinate pair.
@@ -36,8 +66,8 @@ def get_indexes_between(start_index, end_index):
     end_row, end_col = index_to_coords(end_index)
 
     if abs(start_row - end_row) != abs(start_col - end_col):
-        msg = 'Non-diagonal move detected ({0} to {1})'.format(start_index, end_index)
-        raise InvalidMoveException(msg)
+        msg = 'Non-diagonal move detected ({0} to {1})'
+        raise InvalidMoveException(msg, MoveError.NON_DIAGONAL_MOVE, (start_index, end_index))
 
     length = abs(start_row - end_row)
     return [
@@ -65,6 +95,14 @@ def is_white_home_row(index):
     return BoardConfig.total_squares - BoardConfig.squares_per_row < index <= BoardConfig.total_squares
 
 
+def get_opponent(player):
+    """
+    Get the player who moves after the specified one.
+    """
+
+    return Player.BLACK if player == Player.WHITE else Player.WHITE
+
+
 def get_lines_of_sight(index, visibility_range):
     """
     Cast 4 diagonal rays (NW, NE, SW, SE) from the given square index
@@ -95,3 +133,88 @@ def get_lines_of_sight(index, visibility_range):
                 result[line_idx].append(coords_to_index(new_row, new_col))
 
     return result
+
+
+# Precomputed full-length lines of sight (see `get_lines_of_sight`) for every square.
+diagonal_rays = [[]] + [
+    get_lines_of_sight(index, BoardConfig.board_dim)
+    for index in range(1, BoardConfig.total_squares + 1)
+]
+
+
+def _build_free_move_rays(player, piece_class):
+    if piece_class == PieceClass.KING:
+        return diagonal_rays
+
+    # Men move one square forward, and the direction of forward depends on the color.
+    forward_rays = slice(0, 2) if player == Player.WHITE else slice(2, 4)
+    return [[]] + [
+        [ray[:1] for ray in diagonal_rays[index][forward_rays] if ray]
+        for index in range(1, BoardConfig.total_squares + 1)
+    ]
+
+
+# Precomputed rays for free movement, indexed by (player, piece class), then by square.
+# A piece may move along each ray up to the first occupied square.
+free_move_rays = dict(
+    ((player, piece_class), _build_free_move_rays(player, piece_class))
+    for player in (Player.WHITE, Player.BLACK)
+    for piece_class in (PieceClass.MAN, PieceClass.KING)
+)
+
+
+def _build_square_mask(predicate):
+    return sum(1 << index for index in range(1, BoardConfig.total_squares + 1) if predicate(index))
+
+
+# Bit masks of the squares where the men of each player get promoted: bit N is set for square N.
+promotion_masks = {
+    Player.WHITE: _build_square_mask(is_black_home_row),
+    Player.BLACK: _build_square_mask(is_white_home_row),
+}
+
+
+def _build_mask_byte_indexes():
+    byte_count = (BoardConfig.total_squares + 8) // 8
+    return [
+        [[position * 8 + bit for bit in range(8) if value >> bit & 1] for value in range(256)]
+        for position in range(byte_count)
+    ]
+
+
+# The square indexes of every possible byte of a square bit mask,
+# indexed by byte position, then by byte value.
+_mask_byte_indexes = _build_mask_byte_indexes()
+
+
+def get_mask_indexes(mask):
+    """
+    Get the square indexes whose bits are set in a square bit mask, in ascending order.
+    """
+
+    # Looking up a byte at a time is several times faster than extracting the bits one by one.
+    result = []
+    position = 0
+    while mask:
+        value = mask & 0xFF
+        if value:
+            result.extend(_mask_byte_indexes[position][value])
+        mask >>= 8
+        position += 1
+    return result
+
+
+def get_mask_count(mask):
+    """
+    Get the number of squares whose bits are set in a square bit mask.
+    """
+
+    return bin(mask).count('1')
+
+
+def get_zobrist_key(index, player, piece_class):
+    """
+    Get the Zobrist hashing key for a piece of the specified player and class on the specified square.
+    """
+
+    return _zobrist_piece_keys[player * 2 + piece_class][index]
@@ -1,4 +1,4 @@
-from setuptools import setup, find_packages
+from setuptools import setup, find_packages, Extension
 
 
 setup(
@@ -12,10 +12,21 @@ setup(
     packages=find_packages(),
     include_package_data=True,
     zip_safe=False,
+    ext_modules=[
+        # Optional compiled move generator. The pure Python one is used if the build fails.
+        Extension('libcheckers._movegen', ['libcheckers/_movegen.c'], optional=True),
+    ],
+    entry_points={
+        'console_scripts': [
+            'libcheckers = libcheckers.cli:main',
+        ],
+    },
     setup_requires=[
         'pytest-runner',
     ],
     tests_require=[
         'pytest',
+        # Not needed by the library, but the tests of the NumPy board storage are skipped without it.
+        'numpy',
     ],
 )